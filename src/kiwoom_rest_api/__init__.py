@@ -0,0 +1,58 @@
+import importlib
+from typing import TYPE_CHECKING
+
+# 공개 이름 -> 정의된 모듈. 처음 접근할 때 import 하여 (PEP 562) 패키지 import 시
+# httpx, websockets 등 무거운 의존성과 koreanstock 모듈을 불러오지 않는다.
+_LAZY_ATTRS = {
+    "KiwoomRestAPI": "kiwoom_rest_api.api",
+    "AsyncKiwoomRestAPI": "kiwoom_rest_api.api_async",
+    "TokenManager": "kiwoom_rest_api.auth.token",
+    "APIError": "kiwoom_rest_api.core.base",
+    "DeadlineExceeded": "kiwoom_rest_api.core.deadline",
+    "deadline": "kiwoom_rest_api.core.deadline",
+    "WebSocketClient": "kiwoom_rest_api.websocket",
+    "RealTimeData": "kiwoom_rest_api.websocket",
+    "WebSocketError": "kiwoom_rest_api.websocket",
+    "SimpleWebSocketClient": "kiwoom_rest_api.websocket_helper",
+    "WebSocketManager": "kiwoom_rest_api.websocket_helper",
+    "RealTimeDataProcessor": "kiwoom_rest_api.websocket_helper",
+    "create_simple_client": "kiwoom_rest_api.websocket_helper",
+    "format_balance_data": "kiwoom_rest_api.websocket_helper",
+    "format_stock_data": "kiwoom_rest_api.websocket_helper",
+    "get_field_name": "kiwoom_rest_api.websocket_constants",
+    "get_type_name": "kiwoom_rest_api.websocket_constants",
+    "REALTIME_TYPES": "kiwoom_rest_api.websocket_constants",
+}
+
+__all__ = list(_LAZY_ATTRS)
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+if TYPE_CHECKING:
+    from kiwoom_rest_api.api import KiwoomRestAPI
+    from kiwoom_rest_api.api_async import AsyncKiwoomRestAPI
+    from kiwoom_rest_api.auth.token import TokenManager
+    from kiwoom_rest_api.core.base import APIError
+    from kiwoom_rest_api.core.deadline import DeadlineExceeded, deadline
+    from kiwoom_rest_api.websocket import WebSocketClient, RealTimeData, WebSocketError
+    from kiwoom_rest_api.websocket_helper import (
+        SimpleWebSocketClient,
+        WebSocketManager,
+        RealTimeDataProcessor,
+        create_simple_client,
+        format_balance_data,
+        format_stock_data,
+    )
+    from kiwoom_rest_api.websocket_constants import get_field_name, get_type_name, REALTIME_TYPES
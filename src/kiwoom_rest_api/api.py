@@ -0,0 +1,157 @@
+from functools import cached_property
+from typing import Any, Dict, Optional
+
+from kiwoom_rest_api.config import get_base_url
+from kiwoom_rest_api.auth.token import TokenManager
+from kiwoom_rest_api.core.session import KiwoomSession
+from kiwoom_rest_api.core.rate_limit import RateLimiter
+from kiwoom_rest_api.core.cache import ResponseCache
+
+
+class KiwoomRestAPI:
+    """
+    키움 REST API 통합 클라이언트
+
+    하나의 TokenManager, 커넥션 풀 세션, RateLimiter, ResponseCache 를 소유하고
+    stockinfo, chart, account, order 등 하위 클라이언트를 처음 접근할 때 생성한다.
+    모든 하위 클라이언트가 같은 연결과 요청 한도, 캐시를 공유한다.
+
+    Example:
+        >>> from kiwoom_rest_api import KiwoomRestAPI
+        >>> with KiwoomRestAPI() as api:
+        ...     info = api.stockinfo.basic_stock_information_request_ka10001("005930")
+        ...     result = api.order.stock_buy_order_request_kt10000(
+        ...         dmst_stex_tp="KRX", stk_cd="005930", ord_qty="1", trde_tp="3"
+        ...     )
+    """
+
+    use_async = False
+    session_class = KiwoomSession
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        token_manager: Optional[TokenManager] = None,
+        session: Optional[Any] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        cache: Optional[ResponseCache] = None,
+        **options: Any,
+    ):
+        """
+        Args:
+            base_url (str, optional): API 기본 URL (기본값: 환경 설정에 따른 실전/모의 URL)
+            token_manager (TokenManager, optional): 토큰 관리자 (기본값: 새 TokenManager)
+            session (optional): HTTP 세션 (기본값: 새 커넥션 풀 세션)
+            rate_limiter (RateLimiter, optional): 요청 속도 제한 (기본값: config 의 RATE_LIMIT_*)
+            cache (ResponseCache, optional): 응답 캐시 (기본값: 기준정보 TR 메모리 캐시)
+            **options: 모든 하위 클라이언트에 전달할 KiwoomBaseAPI 옵션
+                (retry_policy, circuit_breaker, coalescer, concurrency_limiter, credential_pool, scheduler 등)
+        """
+        self.base_url = base_url or get_base_url()
+        self.token_manager = token_manager if token_manager is not None else TokenManager()
+        # 직접 만든 세션만 close() 에서 닫는다
+        self._owns_session = session is None
+        self.session = session if session is not None else self.session_class()
+        self.rate_limiter = rate_limiter if rate_limiter is not None else RateLimiter()
+        self.cache = cache if cache is not None else ResponseCache()
+        self.options = options
+
+    def _client_options(self) -> Dict[str, Any]:
+        return dict(
+            base_url=self.base_url,
+            token_manager=self.token_manager,
+            use_async=self.use_async,
+            session=self.session,
+            rate_limiter=self.rate_limiter,
+            cache=self.cache,
+            **self.options,
+        )
+
+    @cached_property
+    def account(self):
+        from kiwoom_rest_api.koreanstock.account import Account
+        return Account(**self._client_options())
+
+    @cached_property
+    def chart(self):
+        from kiwoom_rest_api.koreanstock.chart import Chart
+        return Chart(**self._client_options())
+
+    @cached_property
+    def credit_order(self):
+        from kiwoom_rest_api.koreanstock.credit_order import CreditOrder
+        return CreditOrder(**self._client_options())
+
+    @cached_property
+    def elw(self):
+        from kiwoom_rest_api.koreanstock.elw import ELW
+        return ELW(**self._client_options())
+
+    @cached_property
+    def etf(self):
+        from kiwoom_rest_api.koreanstock.etf import ETF
+        return ETF(**self._client_options())
+
+    @cached_property
+    def foreign_institution(self):
+        from kiwoom_rest_api.koreanstock.foreign_institution import ForeignInstitution
+        return ForeignInstitution(**self._client_options())
+
+    @cached_property
+    def market_condition(self):
+        from kiwoom_rest_api.koreanstock.market_condition import MarketCondition
+        return MarketCondition(**self._client_options())
+
+    @cached_property
+    def order(self):
+        from kiwoom_rest_api.koreanstock.order import Order
+        return Order(**self._client_options())
+
+    @cached_property
+    def quotes(self):
+        """ka10095 관심종목 일괄 시세 조회 (QuoteBatcher)"""
+        from kiwoom_rest_api.koreanstock.quote_batch import QuoteBatcher
+        return QuoteBatcher(self.stockinfo)
+
+    @cached_property
+    def rank_info(self):
+        from kiwoom_rest_api.koreanstock.rank_info import RankInfo
+        return RankInfo(**self._client_options())
+
+    @cached_property
+    def sector(self):
+        from kiwoom_rest_api.koreanstock.sector import Sector
+        return Sector(**self._client_options())
+
+    @cached_property
+    def slb(self):
+        from kiwoom_rest_api.koreanstock.slb import SecuritiesLendingAndBorrowing
+        return SecuritiesLendingAndBorrowing(**self._client_options())
+
+    @cached_property
+    def stockinfo(self):
+        from kiwoom_rest_api.koreanstock.stockinfo import StockInfo
+        return StockInfo(**self._client_options())
+
+    @cached_property
+    def theme(self):
+        from kiwoom_rest_api.koreanstock.theme import Theme
+        return Theme(**self._client_options())
+
+    def _stop_background_refresh(self) -> None:
+        self.token_manager.stop_background_refresh()
+        credential_pool = self.options.get("credential_pool")
+        if credential_pool is not None:
+            credential_pool.stop_background_refresh()
+
+    def close(self) -> None:
+        """Close the owned connection pool and stop background token refresh"""
+        self._stop_background_refresh()
+        if self._owns_session:
+            self.session.close()
+
+    def __enter__(self) -> "KiwoomRestAPI":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
@@ -0,0 +1,38 @@
+from typing import Any
+
+from kiwoom_rest_api.api import KiwoomRestAPI
+from kiwoom_rest_api.core.session import AsyncKiwoomSession
+
+
+class AsyncKiwoomRestAPI(KiwoomRestAPI):
+    """
+    키움 REST API 통합 비동기 클라이언트
+
+    KiwoomRestAPI 와 같은 하위 클라이언트를 제공하며 모든 TR 메서드는 코루틴을 반환한다.
+
+    Example:
+        >>> from kiwoom_rest_api import AsyncKiwoomRestAPI
+        >>> async with AsyncKiwoomRestAPI() as api:
+        ...     info = await api.stockinfo.basic_stock_information_request_ka10001("005930")
+    """
+
+    use_async = True
+    session_class = AsyncKiwoomSession
+
+    def close(self) -> None:
+        raise TypeError("AsyncKiwoomRestAPI must be closed with 'await aclose()'")
+
+    async def aclose(self) -> None:
+        """Close the owned connection pool and stop background token refresh"""
+        self._stop_background_refresh()
+        if self._owns_session:
+            await self.session.aclose()
+
+    def __enter__(self):
+        raise TypeError("Use 'async with' with AsyncKiwoomRestAPI")
+
+    async def __aenter__(self) -> "AsyncKiwoomRestAPI":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
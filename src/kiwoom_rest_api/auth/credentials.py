@@ -0,0 +1,131 @@
+import threading
+from typing import Iterable, List, Optional, Sequence, Tuple
+from urllib.parse import urlsplit
+
+from kiwoom_rest_api.auth.token import TokenManager
+from kiwoom_rest_api.core.rate_limit import RateLimiter
+
+# 계좌에 묶인 TR 의 리소스 경로. 이 TR 들은 항상 기본(계좌 소유) 자격 증명으로 보낸다
+PINNED_RESOURCES = ("/api/dostk/ordr", "/api/dostk/crdordr", "/api/dostk/acnt")
+
+ROUND_ROBIN = "round_robin"
+LEAST_LOADED = "least_loaded"
+
+
+def is_pinned(api_id: Optional[str], url: str) -> bool:
+    """Return True for order/account TRs that must use the account's own appkey"""
+    if api_id and api_id.lower().startswith("kt"):
+        return True
+    path = urlsplit(url).path if "://" in url else url
+    return path.rstrip("/").endswith(PINNED_RESOURCES)
+
+
+class Credential:
+    """
+    appkey 하나에 대한 자격 증명
+
+    요청 한도는 appkey 별로 적용되므로 rate_limiter 도 자격 증명마다 따로 둔다.
+    """
+
+    def __init__(
+        self,
+        appkey: str,
+        secretkey: str,
+        token_manager: Optional[TokenManager] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        name: Optional[str] = None,
+    ):
+        """
+        Args:
+            appkey (str): 앱키
+            secretkey (str): 시크릿키
+            token_manager (TokenManager, optional): 토큰 관리자 (기본값: 이 앱키용 새 TokenManager)
+            rate_limiter (RateLimiter, optional): 이 앱키의 요청 속도 제한
+            name (str, optional): 로그 등에 사용할 이름
+        """
+        self.appkey = appkey
+        self.secretkey = secretkey
+        self.token_manager = (
+            token_manager if token_manager is not None else TokenManager(appkey=appkey, secretkey=secretkey)
+        )
+        self.rate_limiter = rate_limiter
+        self.name = name or f"{appkey[:4]}***"
+        self.in_flight = 0
+
+    def __repr__(self) -> str:
+        return f"Credential(name={self.name!r}, in_flight={self.in_flight})"
+
+
+class CredentialPool:
+    """
+    여러 appkey 로 조회 TR 을 분산하는 자격 증명 풀
+
+    조회 TR 은 round_robin 또는 least_loaded(진행 중 요청이 가장 적은 키) 방식으로
+    자격 증명을 고르고, 주문/계좌 TR 은 항상 primary 자격 증명으로 보낸다.
+
+    Example:
+        >>> pool = CredentialPool.from_keys([(key1, secret1), (key2, secret2)])
+        >>> api = KiwoomRestAPI(credential_pool=pool)
+    """
+
+    def __init__(
+        self,
+        credentials: Sequence[Credential],
+        strategy: str = ROUND_ROBIN,
+        primary: Optional[Credential] = None,
+    ):
+        """
+        Args:
+            credentials (Sequence[Credential]): 조회 TR 에 사용할 자격 증명 목록
+            strategy (str): "round_robin" 또는 "least_loaded"
+            primary (Credential, optional): 주문/계좌 TR 용 자격 증명 (기본값: 첫 번째)
+        """
+        if not credentials:
+            raise ValueError("credentials must not be empty")
+        if strategy not in (ROUND_ROBIN, LEAST_LOADED):
+            raise ValueError(f"Unknown strategy: {strategy}")
+        self.credentials: List[Credential] = list(credentials)
+        self.strategy = strategy
+        self.primary = primary if primary is not None else self.credentials[0]
+        self._next = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_keys(
+        cls,
+        keys: Iterable[Tuple[str, str]],
+        strategy: str = ROUND_ROBIN,
+        rate_limit: bool = True,
+    ) -> "CredentialPool":
+        """Build a pool from (appkey, secretkey) pairs, each with its own RateLimiter"""
+        credentials = [
+            Credential(appkey, secretkey, rate_limiter=RateLimiter() if rate_limit else None)
+            for appkey, secretkey in keys
+        ]
+        return cls(credentials, strategy=strategy)
+
+    def acquire(self, api_id: Optional[str], url: str) -> Credential:
+        """Pick the credential for a request and count it as in flight until release()"""
+        with self._lock:
+            if is_pinned(api_id, url):
+                credential = self.primary
+            elif self.strategy == LEAST_LOADED:
+                count = len(self.credentials)
+                # 진행 중 요청 수가 같으면 돌아가며 고른다
+                order = [self.credentials[(self._next + i) % count] for i in range(count)]
+                credential = min(order, key=lambda c: c.in_flight)
+                self._next = (self.credentials.index(credential) + 1) % count
+            else:
+                credential = self.credentials[self._next]
+                self._next = (self._next + 1) % len(self.credentials)
+            credential.in_flight += 1
+            return credential
+
+    def release(self, credential: Credential) -> None:
+        with self._lock:
+            credential.in_flight -= 1
+
+    def stop_background_refresh(self) -> None:
+        """Stop background token refresh on every credential"""
+        for credential in {id(c): c for c in [self.primary, *self.credentials]}.values():
+            credential.token_manager.stop_background_refresh()
@@ -1,101 +1,324 @@
 from datetime import datetime, timedelta
-from typing import Dict, Optional, Any
+from typing import Dict, Optional, Any, Tuple
+import asyncio
+import contextvars
+import logging
+import threading
 import time
+from concurrent.futures import Future, TimeoutError as FutureTimeout
 
-from kiwoom_rest_api.config import get_api_key, get_api_secret, TOKEN_URL
+from kiwoom_rest_api.config import get_api_key, get_api_secret, get_base_url, TOKEN_URL, TOKEN_REFRESH_MARGIN
+from kiwoom_rest_api.auth.token_store import store_key
+from kiwoom_rest_api.core import deadline
 from kiwoom_rest_api.core.sync_client import make_request
+from kiwoom_rest_api.core.async_client import make_request_async
+
+logger = logging.getLogger(__name__)
+
+# 만료 직전 토큰 사용을 피하기 위한 여유 시간 (초)
+TOKEN_EXPIRY_BUFFER = 30
+# 백그라운드 갱신 실패 시 재시도 간격 (초)
+BACKGROUND_RETRY_DELAY = 10.0
 
 class TokenManager:
-    """Manages OAuth tokens for Kiwoom API"""
-    
-    def __init__(self):
-        self._access_token = None
-        self._token_expiry = None
+    """
+    Manages OAuth tokens for Kiwoom API
+
+    여러 스레드와 asyncio 태스크가 하나의 TokenManager 를 공유해도 만료 시 토큰 발급
+    요청은 한 번만 보낸다. 나머지 호출자는 발급이 끝날 때까지 기다린 뒤 새 토큰을 받는다.
+
+    start_background_refresh() / start_background_refresh_async() 를 호출하면 만료
+    refresh_margin 초 전에 미리 토큰을 갱신하므로 요청 경로에서 토큰 발급을 기다리지 않는다.
+
+    token_store 를 지정하면 시작 시 저장된 토큰을 읽어 만료 전까지 재사용하고, 새로 발급받은
+    토큰을 저장한다. 발급은 저장소 잠금 아래에서 이루어지므로 여러 프로세스가 동시에 발급하지 않는다.
+    """
+
+    def __init__(
+        self,
+        refresh_margin: float = TOKEN_REFRESH_MARGIN,
+        appkey: Optional[str] = None,
+        secretkey: Optional[str] = None,
+        token_store=None,
+    ):
+        """
+        Args:
+            refresh_margin (float): 백그라운드 갱신 시 만료 몇 초 전에 갱신할지
+            appkey (str, optional): 앱키 (기본값: KIWOOM_API_KEY)
+            secretkey (str, optional): 시크릿키 (기본값: KIWOOM_API_SECRET)
+            token_store (FileTokenStore, optional): 프로세스 간 토큰 공유 저장소
+        """
+        # (access_token, expiry) 를 한 번에 교체하여 읽는 쪽이 토큰과 만료 시각을 섞어 보지 않게 한다
+        self._token: Optional[Tuple[str, Optional[datetime]]] = None
         self._refresh_token = None
         self._refresh_expiry = None
-    
+        self.refresh_margin = refresh_margin
+        # _lock 은 상태 확인/교체 동안만 잡는다. 진행 중인 발급은 _inflight 하나로 모든 스레드와
+        # 이벤트 루프가 공유하며, 나머지 호출자는 그 결과를 기다린다 (발급 요청 동안 잠금을 잡지 않는다)
+        self._lock = threading.Lock()
+        self._inflight: Optional[Future] = None
+        self._refresh_thread: Optional[threading.Thread] = None
+        self._refresh_stop = threading.Event()
+        self._refresh_task: Optional["asyncio.Task[None]"] = None
+        self._appkey = appkey
+        self._secretkey = secretkey
+        self.token_store = token_store
+        if token_store is not None:
+            self._load_from_store()
+
+    @property
+    def _access_token(self) -> Optional[str]:
+        token = self._token
+        return token[0] if token else None
+
+    @property
+    def _token_expiry(self) -> Optional[datetime]:
+        token = self._token
+        return token[1] if token else None
+
     @property
     def access_token(self) -> Optional[str]:
         """Get the current access token, refreshing if necessary"""
-        if self._is_access_token_valid():
-            return self._access_token
-        
-        # Try to refresh the token
-        if self._can_refresh_token():
-            self._refresh_access_token()
-            return self._access_token
-        
-        # Get a new token
-        self._request_new_token()
+        token = self._valid_token(TOKEN_EXPIRY_BUFFER)
+        if token is not None:
+            return token
+
+        self._refresh_if_needed(TOKEN_EXPIRY_BUFFER)
         return self._access_token
-    
+
     def get_token(self) -> str:
         """Get the current access token (alias for access_token property)"""
         return self.access_token
-    
+
+    async def get_token_async(self) -> str:
+        """Get the current access token without blocking the event loop"""
+        token = self._valid_token(TOKEN_EXPIRY_BUFFER)
+        if token is not None:
+            return token
+
+        await self._refresh_if_needed_async(TOKEN_EXPIRY_BUFFER)
+        return self._access_token
+
+    def _join_flight(self, margin: float) -> Tuple[Optional[Future], bool]:
+        """Return (None, False) if the token is valid, else the in-flight refresh and whether we lead it"""
+        with self._lock:
+            if self._valid_token(margin) is not None:
+                return None, False
+            if self._inflight is not None:
+                return self._inflight, False
+            self._inflight = Future()
+            return self._inflight, True
+
+    def _finish_flight(self, future: Future, error: Optional[BaseException]) -> None:
+        with self._lock:
+            self._inflight = None
+        if isinstance(error, Exception):
+            future.set_exception(error)
+        else:
+            # 취소 등으로 끝나면 기다리던 호출자가 다시 확인하고 필요하면 직접 발급한다
+            future.set_result(None)
+
+    def _refresh_if_needed(self, margin: float) -> None:
+        while True:
+            future, leader = self._join_flight(margin)
+            if future is None:
+                return
+            if not leader:
+                # 다른 스레드/이벤트 루프의 발급을 기다리는 시간도 호출자의 deadline 안으로 제한한다
+                try:
+                    future.result(deadline.remaining())
+                except FutureTimeout:
+                    raise deadline.DeadlineExceeded("Deadline exceeded waiting for a token refresh") from None
+                continue
+            try:
+                self._issue(margin)
+            except BaseException as e:
+                self._finish_flight(future, e)
+                raise
+            self._finish_flight(future, None)
+            return
+
+    async def _refresh_if_needed_async(self, margin: float) -> None:
+        while True:
+            future, leader = self._join_flight(margin)
+            if future is None:
+                return
+            if not leader:
+                # shield: 기다리던 태스크가 취소되어도 진행 중인 발급은 취소하지 않는다
+                await asyncio.shield(asyncio.wrap_future(future))
+                continue
+            if self.token_store is not None:
+                await self._issue_in_thread(future, margin)
+                return
+            try:
+                response = await make_request_async(**self._token_request())
+                with self._lock:
+                    self._update_token_info(response)
+            except BaseException as e:
+                self._finish_flight(future, e)
+                raise
+            self._finish_flight(future, None)
+            return
+
+    async def _issue_in_thread(self, flight: Future, margin: float) -> None:
+        """Run the blocking store-backed _issue in a thread; the flight ends when the thread does"""
+        # 파일 잠금은 블로킹이므로 스레드에서 처리한다. deadline 등 contextvars 를 스레드로 넘긴다
+        issuing = asyncio.get_running_loop().run_in_executor(
+            None, contextvars.copy_context().run, self._issue, margin
+        )
+        # 이 태스크가 취소되어도 스레드의 발급은 계속되므로, flight 는 발급이 실제로 끝날 때 마친다
+        issuing.add_done_callback(
+            lambda done: self._finish_flight(flight, None if done.cancelled() else done.exception())
+        )
+        await asyncio.shield(issuing)
+
+    def _issue(self, margin: float) -> None:
+        """Request a token (blocking); only the flight leader calls this"""
+        if self.token_store is None:
+            response = make_request(**self._token_request())
+            with self._lock:
+                self._update_token_info(response)
+            return
+        with self.token_store.lock():
+            # 잠금을 기다리는 동안 다른 프로세스가 발급받은 토큰이 있으면 재사용한다
+            self._load_from_store()
+            if self._valid_token(margin) is None:
+                response = make_request(**self._token_request())
+                with self._lock:
+                    self._update_token_info(response)
+                self._save_to_store()
+
+    def _store_key(self) -> str:
+        return store_key(self._appkey or get_api_key(), get_base_url())
+
+    def _load_from_store(self) -> None:
+        stored = self.token_store.load(self._store_key())
+        if stored is None:
+            return
+        current = self._token
+        if current is None or current[1] is None or stored[1] > current[1]:
+            self._token = stored
+
+    def _save_to_store(self) -> None:
+        token = self._token
+        if token and token[0] and token[1]:
+            self.token_store.save(self._store_key(), token[0], token[1])
+
+    def _valid_token(self, margin: float) -> Optional[str]:
+        """Return the access token if it stays valid for at least margin seconds"""
+        token = self._token
+        if not token or not token[0] or not token[1]:
+            return None
+        if datetime.now() < token[1] - timedelta(seconds=margin):
+            return token[0]
+        return None
+
     def _is_access_token_valid(self) -> bool:
         """Check if the current access token is valid"""
-        if not self._access_token or not self._token_expiry:
-            return False
-        
         # Add a small buffer (30 seconds) to avoid edge cases
-        return datetime.now() < self._token_expiry - timedelta(seconds=30)
-    
+        return self._valid_token(TOKEN_EXPIRY_BUFFER) is not None
+
     def _can_refresh_token(self) -> bool:
         """Check if we can refresh the current token"""
         if not self._refresh_token or not self._refresh_expiry:
             return False
-        
+
         return datetime.now() < self._refresh_expiry - timedelta(seconds=30)
-    
-    def _request_new_token(self) -> None:
-        """Request a new access token"""
-        response = make_request(
-            endpoint=TOKEN_URL,
-            method="POST",
-            data={
-                "grant_type": "client_credentials",
-                "appkey": get_api_key(),
-                "secretkey": get_api_secret(),
-            },
-        )
-        
-        self._update_token_info(response)
-    
-    def _refresh_access_token(self) -> None:
-        """Refresh the access token using the refresh token"""
-        response = make_request(
-            endpoint=TOKEN_URL,
-            method="POST",
-            data={
+
+    def _token_request(self) -> Dict[str, Any]:
+        """Build the token request: refresh if possible, otherwise a new token"""
+        if self._can_refresh_token():
+            data = {
                 "grant_type": "refresh_token",
                 "refresh_token": self._refresh_token,
-                "appkey": get_api_key(),
-                "appsecret": get_api_secret(),
-            },
-        )
-        
-        self._update_token_info(response)
-    
+                "appkey": self._appkey or get_api_key(),
+                "appsecret": self._secretkey or get_api_secret(),
+            }
+        else:
+            data = {
+                "grant_type": "client_credentials",
+                "appkey": self._appkey or get_api_key(),
+                "secretkey": self._secretkey or get_api_secret(),
+            }
+        return {"endpoint": TOKEN_URL, "method": "POST", "data": data}
+
     def _update_token_info(self, token_response: Dict[str, Any]) -> None:
         """Update token information from the API response"""
-        self._access_token = token_response.get("token")
-        
+        expiry = self._token_expiry
+
         # Calculate expiry time
         if "expires_in" in token_response:
-            self._token_expiry = datetime.now() + timedelta(seconds=token_response["expires_in"])
-            
+            expiry = datetime.now() + timedelta(seconds=token_response["expires_in"])
+
         if "expires_dt" in token_response:
-            self._token_expiry = datetime.strptime(token_response["expires_dt"], "%Y%m%d%H%M%S")
-        
+            expiry = datetime.strptime(token_response["expires_dt"], "%Y%m%d%H%M%S")
+
+        self._token = (token_response.get("token"), expiry)
+
         # Update refresh token if provided
         refresh_token = token_response.get("refresh_token")
         if refresh_token:
             self._refresh_token = refresh_token
-            
+
             if "refresh_token_expires_in" in token_response:
                 self._refresh_expiry = datetime.now() + timedelta(seconds=token_response["refresh_token_expires_in"])
 
+    # 백그라운드 갱신
+
+    def _seconds_until_refresh(self) -> float:
+        expiry = self._token_expiry
+        if expiry is None:
+            return self.refresh_margin
+        delay = (expiry - timedelta(seconds=self.refresh_margin) - datetime.now()).total_seconds()
+        # 토큰 유효 기간이 refresh_margin 보다 짧아도 계속 재발급하지 않도록 최소 간격을 둔다
+        return max(delay, 1.0)
+
+    def start_background_refresh(self) -> None:
+        """Renew the token ahead of expiry in a daemon thread"""
+        if self._refresh_thread is not None and self._refresh_thread.is_alive():
+            return
+        self._refresh_stop.clear()
+        self._refresh_thread = threading.Thread(
+            target=self._refresh_loop, name="kiwoom-token-refresh", daemon=True
+        )
+        self._refresh_thread.start()
+
+    def _refresh_loop(self) -> None:
+        while not self._refresh_stop.is_set():
+            try:
+                self._refresh_if_needed(self.refresh_margin)
+                delay = self._seconds_until_refresh()
+            except Exception:
+                logger.exception("Background token refresh failed")
+                delay = BACKGROUND_RETRY_DELAY
+            self._refresh_stop.wait(delay)
+
+    def start_background_refresh_async(self) -> "asyncio.Task[None]":
+        """Renew the token ahead of expiry in a task on the running event loop"""
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.get_running_loop().create_task(self._refresh_loop_async())
+        return self._refresh_task
+
+    async def _refresh_loop_async(self) -> None:
+        while True:
+            try:
+                await self._refresh_if_needed_async(self.refresh_margin)
+                delay = self._seconds_until_refresh()
+            except Exception:
+                logger.exception("Background token refresh failed")
+                delay = BACKGROUND_RETRY_DELAY
+            await asyncio.sleep(delay)
+
+    def stop_background_refresh(self) -> None:
+        """Stop the background refresher started by either start method"""
+        self._refresh_stop.set()
+        thread, self._refresh_thread = self._refresh_thread, None
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=5)
+        task, self._refresh_task = self._refresh_task, None
+        if task is not None:
+            task.cancel()
+
 # Convenience functions
 def get_access_token() -> str:
     """Get a valid access token"""
@@ -106,4 +329,3 @@ def get_access_token() -> str:
 
 if __name__ == "__main__":
     print(get_access_token())
-
@@ -0,0 +1,114 @@
+import hashlib
+import os
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from kiwoom_rest_api.config import TOKEN_STORE_PATH
+from kiwoom_rest_api.core import codec
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+    import msvcrt
+
+EXPIRY_FORMAT = "%Y%m%d%H%M%S"
+
+
+def store_key(appkey: str, base_url: str) -> str:
+    """Build the store key for an appkey and environment (the appkey itself is not written to disk)"""
+    digest = hashlib.sha256(appkey.encode("utf-8")).hexdigest()[:16]
+    return f"{base_url}#{digest}"
+
+
+class FileTokenStore:
+    """
+    파일 기반 토큰 저장소
+
+    발급받은 접근 토큰을 (appkey, 환경) 별로 파일에 저장하여 짧게 실행되는 여러 프로세스가
+    만료 전까지 같은 토큰을 재사용하게 한다. 파일은 소유자만 읽고 쓸 수 있도록(0600) 만들며,
+    별도의 잠금 파일로 프로세스 간 발급을 직렬화한다.
+
+    Example:
+        >>> token_manager = TokenManager(token_store=FileTokenStore())
+    """
+
+    def __init__(self, path: str = TOKEN_STORE_PATH):
+        """
+        Args:
+            path (str): 토큰 파일 경로 (잠금 파일은 path + ".lock")
+        """
+        self.path = os.path.abspath(os.path.expanduser(path))
+        self.lock_path = self.path + ".lock"
+
+    def _read_all(self) -> Dict[str, Any]:
+        try:
+            with open(self.path, "rb") as f:
+                data = codec.loads(f.read())
+        except FileNotFoundError:
+            return {}
+        except (OSError, codec.JSONDecodeError):
+            # 손상된 파일은 무시하고 새로 발급받는다
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def load(self, key: str) -> Optional[Tuple[str, datetime]]:
+        """Return the stored (token, expiry) for key, or None"""
+        entry = self._read_all().get(key)
+        if not isinstance(entry, dict):
+            return None
+        try:
+            return entry["token"], datetime.strptime(entry["expires_dt"], EXPIRY_FORMAT)
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def save(self, key: str, token: str, expiry: datetime) -> None:
+        """Store the token for key, dropping entries that have already expired"""
+        now = datetime.now().strftime(EXPIRY_FORMAT)
+        data = {
+            k: v for k, v in self._read_all().items()
+            if isinstance(v, dict) and str(v.get("expires_dt", "")) > now
+        }
+        data[key] = {"token": token, "expires_dt": expiry.strftime(EXPIRY_FORMAT)}
+
+        os.makedirs(os.path.dirname(self.path), mode=0o700, exist_ok=True)
+        # 임시 파일에 쓴 뒤 교체하여 다른 프로세스가 반쯤 쓰인 파일을 읽지 않게 한다
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(codec.dumps_bytes(data))
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    @contextmanager
+    def lock(self) -> Iterator[None]:
+        """Hold an exclusive cross-process lock on the store"""
+        os.makedirs(os.path.dirname(self.lock_path), mode=0o700, exist_ok=True)
+        fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+            else:  # pragma: no cover - Windows
+                while True:
+                    try:
+                        msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+                        break
+                    except OSError:
+                        continue
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(fd, fcntl.LOCK_UN)
+                else:  # pragma: no cover - Windows
+                    os.lseek(fd, 0, os.SEEK_SET)
+                    msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+        finally:
+            os.close(fd)
@@ -1,13 +1,10 @@
 import os
 import typer
 import json
-from rich import print as rprint # print_json 대신 사용할 수 있음
-from rich.pretty import pprint # 객체 예쁘게 출력
 
-# 필요한 클래스 임포트
-from kiwoom_rest_api.koreanstock.stockinfo import StockInfo
-from kiwoom_rest_api.auth.token import TokenManager
-from kiwoom_rest_api.core.base import APIError
+# httpx, koreanstock 모듈은 명령 실행 시에만 import 한다 (--help 등 시작 시간 단축).
+# typer 0.9 는 import 시점에 rich 를 함께 불러오므로(약 200ms) CLI 시작 시간의 하한은 typer + rich 이다.
+# 이 모듈 자체의 import 비용은 tests/test_imports.py 에서 예산으로 확인한다.
 
 # Typer 앱 인스턴스 생성
 # no_args_is_help=True: 인자 없이 실행 시 도움말 표시
@@ -55,10 +52,15 @@ def ka10001(
         typer.secho("오류: API Secret이 제공되지 않았습니다.", fg=typer.colors.RED, err=True)
         raise typer.Exit(code=1)
 
+    from rich.pretty import pprint # 객체 예쁘게 출력
+    from kiwoom_rest_api.koreanstock.stockinfo import StockInfo
+    from kiwoom_rest_api.auth.token import TokenManager
+    from kiwoom_rest_api.core.base import APIError
+
     typer.echo(f"종목 코드 {stock_code} 요청 시작 (URL: {base_url})")
 
     try:
-        token_manager = TokenManager()
+        token_manager = TokenManager(appkey=api_key, secretkey=api_secret)
         stock_info = StockInfo(base_url=base_url, token_manager=token_manager, use_async=False)
         result = stock_info.basic_stock_information_request_ka10001(stock_code)
 
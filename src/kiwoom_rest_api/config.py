@@ -23,6 +23,38 @@ AUTH_URL = "/oauth2/authorize"
 DEFAULT_TIMEOUT = 30.0  # seconds
 WS_TIMEOUT = 10.0  # seconds
 
+# Background token refresh (TokenManager)
+TOKEN_REFRESH_MARGIN = float(os.environ.get("KIWOOM_TOKEN_REFRESH_MARGIN", "300"))  # seconds before expiry
+
+# On-disk token cache (FileTokenStore)
+TOKEN_STORE_PATH = os.environ.get("KIWOOM_TOKEN_STORE", "~/.kiwoom/tokens.json")
+
+# Connection pool (KiwoomSession)
+POOL_MAX_CONNECTIONS = int(os.environ.get("KIWOOM_POOL_MAX_CONNECTIONS", "100"))
+POOL_MAX_KEEPALIVE = int(os.environ.get("KIWOOM_POOL_MAX_KEEPALIVE", "20"))
+POOL_KEEPALIVE_EXPIRY = float(os.environ.get("KIWOOM_POOL_KEEPALIVE_EXPIRY", "30"))  # seconds
+
+# Client-side rate limit (RateLimiter)
+RATE_LIMIT_PER_SECOND = float(os.environ.get("KIWOOM_RATE_LIMIT", "5"))  # requests per second
+RATE_LIMIT_BURST = float(os.environ.get("KIWOOM_RATE_LIMIT_BURST", "5"))
+
+# Adaptive concurrency (AdaptiveConcurrencyLimiter)
+ADAPTIVE_INITIAL_CONCURRENCY = int(os.environ.get("KIWOOM_ADAPTIVE_INITIAL_CONCURRENCY", "4"))
+ADAPTIVE_INITIAL_CONCURRENCY_SANDBOX = int(os.environ.get("KIWOOM_ADAPTIVE_INITIAL_CONCURRENCY_SANDBOX", "2"))
+ADAPTIVE_MAX_CONCURRENCY = int(os.environ.get("KIWOOM_ADAPTIVE_MAX_CONCURRENCY", "32"))
+
+# Bulk symbol executor (map_symbols)
+BULK_CONCURRENCY = int(os.environ.get("KIWOOM_BULK_CONCURRENCY", "8"))
+
+# Local chart history (HistoryStore)
+HISTORY_DB_PATH = os.environ.get("KIWOOM_HISTORY_DB", "~/.kiwoom/history.db")
+COLUMNAR_ROOT = os.environ.get("KIWOOM_COLUMNAR_ROOT", "~/.kiwoom/bars")  # memory-mapped bar files
+BACKFILL_JOURNAL_PATH = os.environ.get("KIWOOM_BACKFILL_JOURNAL", "~/.kiwoom/backfill/journal.jsonl")
+
+# Watchlist quote batching (QuoteBatcher, ka10095)
+WATCHLIST_MAX_CODES = int(os.environ.get("KIWOOM_WATCHLIST_MAX_CODES", "100"))  # codes per ka10095 request
+QUOTE_BATCH_WINDOW = float(os.environ.get("KIWOOM_QUOTE_BATCH_WINDOW", "0.01"))  # seconds
+
 # Environment setting
 USE_SANDBOX = os.environ.get("KIWOOM_USE_SANDBOX", "false").lower() == "true"
 
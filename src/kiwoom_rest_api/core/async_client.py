@@ -2,7 +2,11 @@ from typing import Any, Dict, Optional
 
 import httpx
 
+from kiwoom_rest_api.core import codec, deadline
 from kiwoom_rest_api.core.base import prepare_request_params, process_response_async
+from kiwoom_rest_api.core.deadline import DeadlineExceeded
+from kiwoom_rest_api.core.hooks import RequestEvent, hooks
+from kiwoom_rest_api.core.session import AsyncKiwoomSession
 
 async def make_request_async(
     endpoint: str,
@@ -12,9 +16,14 @@ async def make_request_async(
     headers: Optional[Dict[str, Any]] = None,
     access_token: Optional[str] = None,
     timeout: Optional[float] = None,
+    session: Optional[AsyncKiwoomSession] = None,
     **kwargs  # Add **kwargs
 ) -> Dict[str, Any]:
-    """Make an asynchronous HTTP request to the Kiwoom API"""
+    """Make an asynchronous HTTP request to the Kiwoom API
+
+    If an AsyncKiwoomSession is given its pooled connections are reused,
+    otherwise a one-off httpx.AsyncClient is opened for this call.
+    """
     request_params = prepare_request_params(
         endpoint=endpoint,
         method=method,
@@ -34,16 +43,41 @@ async def make_request_async(
         # Remove 'data' if 'json' is being used to avoid conflicts in httpx
         request_params.pop("data", None)
 
-    async with httpx.AsyncClient() as client:
-        # This should return an httpx.Response object
-        response: httpx.Response = await client.request(
-            method=request_params["method"],
-            url=request_params["url"],
-            params=request_params.get("params"),
-            json=request_params.get("json"),
-            data=request_params.get("data"),
-            headers=request_params["headers"],
-            timeout=request_params["timeout"],
-        )
-
-    return await process_response_async(response)
+    send_kwargs = dict(
+        method=request_params["method"],
+        url=request_params["url"],
+        params=request_params.get("params"),
+        data=request_params.get("data"),
+        headers=request_params["headers"],
+        # deadline() 블록 안이면 남은 시간만큼만 기다린다
+        timeout=deadline.clamp(request_params["timeout"]),
+    )
+
+    # 요청 본문은 codec 으로 직렬화한다 (orjson 사용 가능 시 더 빠름)
+    if request_params.get("json") is not None:
+        send_kwargs["content"] = codec.dumps_bytes(request_params["json"])
+
+    # 추적 훅은 등록된 콜백이 있을 때만 이벤트를 만든다
+    event = None
+    if hooks.active:
+        event = RequestEvent(send_kwargs["method"], send_kwargs["url"], send_kwargs["headers"].get("api-id"))
+        hooks.request_start(event)
+
+    response = None
+    try:
+        if session is not None:
+            response = await session.request(**send_kwargs)
+        else:
+            async with httpx.AsyncClient() as client:
+                response = await client.request(**send_kwargs)
+        result = await process_response_async(response)
+    except Exception as e:
+        if event is not None:
+            hooks.error(event.finish(getattr(response, "status_code", None), e))
+        if isinstance(e, httpx.TimeoutException) and deadline.expired():
+            raise DeadlineExceeded() from e
+        raise
+
+    if event is not None:
+        hooks.response(event.finish(response.status_code))
+    return result
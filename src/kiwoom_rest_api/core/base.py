@@ -2,9 +2,9 @@ from typing import Any, Dict, Optional, Union
 import json
 from urllib.parse import urljoin
 import httpx
-import inspect # Import inspect
 
 from kiwoom_rest_api.config import get_base_url, get_headers, DEFAULT_TIMEOUT
+from kiwoom_rest_api.core import codec
 
 class APIError(Exception):
     """Custom exception for API errors"""
@@ -17,6 +17,22 @@ class APIError(Exception):
     def __str__(self):
         return f"API Error (HTTP {self.status_code}): {self.message}"
 
+class RateLimitError(APIError):
+    """Raised when the server rejects a request for exceeding the request quota"""
+
+# 서버 측 요청 한도 초과 판별 기준
+THROTTLE_STATUS_CODES = (429,)
+THROTTLE_MESSAGE_MARKERS = ("1700:", "요청 개수를 초과")
+
+def is_throttled(status_code: int, error_data: Optional[Dict[str, Any]] = None) -> bool:
+    """Return True if a response signals that the request quota was exceeded"""
+    if status_code in THROTTLE_STATUS_CODES:
+        return True
+    if isinstance(error_data, dict):
+        message = error_data.get("return_msg") or error_data.get("msg1") or error_data.get("message") or ""
+        return any(marker in str(message) for marker in THROTTLE_MESSAGE_MARKERS)
+    return False
+
 def make_url(endpoint: str) -> str:
     """Create a full URL from an endpoint"""
     if endpoint.startswith(('http://', 'https://')):
@@ -25,8 +41,6 @@ def make_url(endpoint: str) -> str:
     # Ensure endpoint starts with a forward slash
     if not endpoint.startswith('/'):
         endpoint = f"/{endpoint}"
-        
-    print("\n\n##  full url  ##\n\n", urljoin(get_base_url(), endpoint))
     
     return urljoin(get_base_url(), endpoint)
 
@@ -40,17 +54,23 @@ def process_response(response: Any) -> Dict[str, Any]:
             return {}
         
         try:
-            response_json = response.json()
+            response_json = codec.loads(response.content)
             
             access_control_expose_headers = response.headers.get("access-control-expose-headers")
             if access_control_expose_headers:
-                access_control_expose_headers = access_control_expose_headers.split(",")
+                access_control_expose_headers = [h.strip() for h in access_control_expose_headers.split(",")]
                 
                 for header in access_control_expose_headers:
                     response_json[header] = response.headers.get(header)
-                
-                return response_json
-                
+            
+            # 동기 경로는 업무 오류를 그대로 돌려주지만, 한도 초과는 재시도 정책이 알 수 있도록 예외로 올린다
+            if (
+                isinstance(response_json, dict)
+                and str(response_json.get("return_code")) != "0"
+                and is_throttled(response.status_code, response_json)
+            ):
+                error_message = response_json.get("return_msg", "Request quota exceeded")
+                raise RateLimitError(response.status_code, error_message, response_json)
             return response_json
         
         except json.JSONDecodeError:
@@ -61,13 +81,14 @@ def process_response(response: Any) -> Dict[str, Any]:
     error_data = None
     
     try:
-        error_data = response.json()
+        error_data = codec.loads(response.content)
         error_message = error_data.get("message", "Unknown error")
     except (json.JSONDecodeError, AttributeError):
         if response.text:
             error_message = response.text
     
-    raise APIError(response.status_code, error_message, error_data)
+    error_class = RateLimitError if is_throttled(response.status_code, error_data) else APIError
+    raise error_class(response.status_code, error_message, error_data)
 
 def prepare_request_params(
     endpoint: str,
@@ -130,94 +151,54 @@ def prepare_request_params(
 
 async def process_response_async(response: httpx.Response) -> Dict[str, Any]:
     if not isinstance(response, httpx.Response):
-        print("ERROR: process_response_async did not receive an httpx.Response object!")
         raise TypeError(f"Expected httpx.Response, but got {type(response)}")
 
-    # --- 추가 디버깅 ---
-    json_method = getattr(response, 'json', None)
-    is_json_coro = inspect.iscoroutinefunction(json_method)
-    print(f"DEBUG: inspect.iscoroutinefunction(response.json) = {is_json_coro}")
-    # --- 추가 디버깅 끝 ---
-
     try:
         # 성공(200) 응답 처리
         if response.status_code == 200:
             try:
-                # 여기서 여전히 TypeError 발생 가능성 있음
-                json_data = await response.json()
-                
-                access_control_expose_headers = response.headers.get("access-control-expose-headers")
-                if access_control_expose_headers:
-                    access_control_expose_headers = access_control_expose_headers.split(",")
-                    
-                    for header in access_control_expose_headers:
-                        json_data[header] = response.headers.get(header)
-                
-                
-                if isinstance(json_data, dict) and str(json_data.get("return_code")) != "0":
-                     error_message = json_data.get("return_msg", "Unknown API error message")
-                     raise APIError(response.status_code, error_message, json_data)
-                return json_data
+                json_data = codec.loads(response.content)
             except json.JSONDecodeError:
-                 # 여기서도 TypeError 발생 가능성 있음
-                 raw_text_content = await response.text()
-                 error_message = f"Failed to decode JSON response. Content: {raw_text_content[:200]}"
-                 raise APIError(response.status_code, error_message, {"raw_content": raw_text_content})
-            except TypeError as te: # await 실패 시
-                 print(f"ERROR: TypeError on SUCCESS path await: {te}")
-                 # await 없이 직접 접근 시도 (진단용)
-                 try:
-                    json_data = response.json() # await 없이 호출
-                     
-                       
-                    access_control_expose_headers = response.headers.get("access-control-expose-headers")
-                    if access_control_expose_headers:
-                        access_control_expose_headers = access_control_expose_headers.split(",")
-                        
-                        for header in access_control_expose_headers:
-                            json_data[header] = response.headers.get(header)
-                            
-                    if isinstance(json_data, dict) and str(json_data.get("return_code")) != "0":
-                        error_message = json_data.get("return_msg", "Unknown API error message")
-                        raise APIError(response.status_code, error_message, json_data)
-                    return json_data # 성공하면 반환
-                 except Exception as direct_err:
-                     print(f"ERROR: Direct access failed after TypeError: {direct_err}")
-                     raw_text_content = getattr(response, 'text', 'N/A') # text 속성 접근 시도
-                     raise APIError(response.status_code, f"TypeError processing SUCCESS response: {te}. Raw content: {raw_text_content[:200]}", {"raw_content": raw_text_content})
+                raw_text_content = response.text
+                error_message = f"Failed to decode JSON response. Content: {raw_text_content[:200]}"
+                raise APIError(response.status_code, error_message, {"raw_content": raw_text_content})
 
+            access_control_expose_headers = response.headers.get("access-control-expose-headers")
+            if access_control_expose_headers:
+                access_control_expose_headers = [h.strip() for h in access_control_expose_headers.split(",")]
+
+                for header in access_control_expose_headers:
+                    json_data[header] = response.headers.get(header)
+
+            if isinstance(json_data, dict) and str(json_data.get("return_code")) != "0":
+                error_message = json_data.get("return_msg", "Unknown API error message")
+                error_class = RateLimitError if is_throttled(response.status_code, json_data) else APIError
+                raise error_class(response.status_code, error_message, json_data)
+            return json_data
 
         # HTTP 에러(400 등) 처리
         else:
             error_message = f"HTTP Error {response.status_code}"
             error_data = {"status_code": response.status_code}
-            raw_text_content = "Could not retrieve error content"
 
-            # --- 진단: await 없이 text 속성 직접 접근 시도 ---
-            try:
-                if hasattr(response, 'text') and isinstance(response.text, str):
-                    print("DEBUG: Accessing response.text directly as attribute.")
-                    raw_text_content = response.text
-                    error_data["raw_content"] = raw_text_content
-                    error_message += f". Content: {raw_text_content[:500]}" # 내용 조금 더 보기
-
-                    # 텍스트 내용으로 JSON 파싱 시도
-                    try:
-                        error_json = json.loads(raw_text_content)
-                        error_msg1 = error_json.get("msg1", "No msg1 found in error JSON")
-                        error_message = f"HTTP Error {response.status_code}: {error_msg1}" # 에러 메시지 개선
-                        error_data.update(error_json)
-                    except json.JSONDecodeError:
-                        print("DEBUG: Error response body is not JSON.")
-                else:
-                     print("DEBUG: response.text is not a direct string attribute.")
-                     # 여기서 await response.text()를 시도하면 TypeError 발생 가능성 높음
-            except Exception as e_diag:
-                print(f"ERROR: Exception during diagnostic access of response text: {e_diag}")
-            # --- 진단 끝 ---
+            raw_text_content = response.text
+            if raw_text_content:
+                error_data["raw_content"] = raw_text_content
+                error_message += f". Content: {raw_text_content[:500]}" # 내용 조금 더 보기
+
+                # 텍스트 내용으로 JSON 파싱 시도
+                try:
+                    error_json = codec.loads(raw_text_content)
+                except json.JSONDecodeError:
+                    error_json = None
+                if isinstance(error_json, dict):
+                    error_msg1 = error_json.get("msg1") or error_json.get("return_msg") or "No msg1 found in error JSON"
+                    error_message = f"HTTP Error {response.status_code}: {error_msg1}" # 에러 메시지 개선
+                    error_data.update(error_json)
 
             # 최종 에러 발생
-            raise APIError(response.status_code, error_message, error_data)
+            error_class = RateLimitError if is_throttled(response.status_code, error_data) else APIError
+            raise error_class(response.status_code, error_message, error_data)
 
     except httpx.RequestError as e:
         # 네트워크 관련 에러
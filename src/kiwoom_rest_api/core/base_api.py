@@ -1,6 +1,22 @@
-from typing import Optional
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, Iterator, Optional, Union
+from kiwoom_rest_api.config import BULK_CONCURRENCY
 from kiwoom_rest_api.core.sync_client import make_request
 from kiwoom_rest_api.core.async_client import make_request_async
+from kiwoom_rest_api.core.session import KiwoomSession, AsyncKiwoomSession
+from kiwoom_rest_api.core.rate_limit import RateLimiter
+from kiwoom_rest_api.core.scheduler import PriorityScheduler
+from kiwoom_rest_api.core.concurrency import AdaptiveConcurrencyLimiter
+from kiwoom_rest_api.core.retry import RetryPolicy, CircuitBreaker, call_with_retry, acall_with_retry, request_host
+from kiwoom_rest_api.core.coalesce import RequestCoalescer, is_coalescable, request_key
+from kiwoom_rest_api.core.cache import ResponseCache
+from kiwoom_rest_api.core import bulk, deadline
+from kiwoom_rest_api.core.pagination import (
+    PageMerger,
+    iter_pages,
+    aiter_pages,
+    prefetch_pages,
+    aprefetch_pages,
+)
 
 class KiwoomBaseAPI:
     def __init__(
@@ -8,39 +24,168 @@ class KiwoomBaseAPI:
         base_url: str = None,
         token_manager=None,
         use_async: bool = False,
-        resource_url: str = ""
+        resource_url: str = "",
+        session: Optional[Union[KiwoomSession, AsyncKiwoomSession]] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        concurrency_limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        coalescer: Optional[RequestCoalescer] = None,
+        cache: Optional[ResponseCache] = None,
+        credential_pool=None,
+        scheduler: Optional[PriorityScheduler] = None,
     ):
         self.base_url = base_url
         self.token_manager = token_manager
         self.use_async = use_async
         self.resource_url = resource_url
+        # 공유 커넥션 풀. 없으면 요청마다 일회성 클라이언트를 연다
+        self.session = session
+        # api-id 기준 요청 속도 제한. 여러 인스턴스가 공유해야 전체 한도를 지킨다
+        self.rate_limiter = rate_limiter
+        # 비동기 경로의 동시 요청 수 자동 조절 (AIMD)
+        self.concurrency_limiter = concurrency_limiter
+        # 일시적 장애 재시도 및 호스트별 빠른 실패
+        self.retry_policy = retry_policy
+        self.circuit_breaker = circuit_breaker
+        # 동시에 들어온 동일 조회 요청을 한 번의 HTTP 요청으로 합친다
+        self.coalescer = coalescer
+        # api-id 별 TTL 응답 캐시 (기준정보 TR 등)
+        self.cache = cache
+        # 여러 appkey 로 조회 TR 분산 (주문/계좌 TR 은 기본 자격 증명 고정). 지정하면 token_manager 대신 사용
+        self.credential_pool = credential_pool
+        # 속도 제한 대기 중 주문 > 계좌 > 시세 > 차트 순으로 슬롯 배정
+        self.scheduler = scheduler
         self._request_func = make_request_async if use_async else make_request
 
-    def _get_access_token(self) -> Optional[str]:
-        if self.token_manager:
-            return self.token_manager.get_token()
+    def _get_access_token(self, token_manager=None) -> Optional[str]:
+        token_manager = token_manager or self.token_manager
+        if token_manager:
+            return token_manager.get_token()
         return None
 
-    async def _get_access_token_async(self) -> Optional[str]:
-        if self.token_manager and hasattr(self.token_manager, 'get_token_async'):
-            return await self.token_manager.get_token_async()
-        return self._get_access_token()
+    async def _get_access_token_async(self, token_manager=None) -> Optional[str]:
+        token_manager = token_manager or self.token_manager
+        if token_manager and hasattr(token_manager, 'get_token_async'):
+            return await token_manager.get_token_async()
+        return self._get_access_token(token_manager)
+
+    def _apply_credential(self, headers: Dict[str, Any], credential) -> None:
+        headers["appkey"] = credential.appkey
+        headers["appsecret"] = credential.secretkey
+
+    def _send(self, method: str, url: str, headers: Dict[str, Any], kwargs: Dict[str, Any], rate_limiter=None):
+        api_id = headers.get("api-id")
+        rate_limiter = rate_limiter or self.rate_limiter
+
+        def send():
+            if self.scheduler is not None:
+                self.scheduler.acquire(api_id, url, rate_limiter)
+            elif rate_limiter is not None:
+                rate_limiter.acquire(api_id)
+            return make_request(endpoint=url, method=method, headers=headers, session=self.session, **kwargs)
+
+        if self.retry_policy is None and self.circuit_breaker is None:
+            return send()
+        return call_with_retry(send, api_id, request_host(url), self.retry_policy, self.circuit_breaker)
+
+    async def _send_async(self, method: str, url: str, headers: Dict[str, Any], kwargs: Dict[str, Any], rate_limiter=None):
+        api_id = headers.get("api-id")
+        rate_limiter = rate_limiter or self.rate_limiter
+
+        async def send():
+            if self.scheduler is not None:
+                await self.scheduler.acquire_async(api_id, url, rate_limiter)
+            elif rate_limiter is not None:
+                await rate_limiter.acquire_async(api_id)
+            if self.concurrency_limiter is not None:
+                async with self.concurrency_limiter.slot():
+                    return await make_request_async(endpoint=url, method=method, headers=headers, session=self.session, **kwargs)
+            return await make_request_async(endpoint=url, method=method, headers=headers, session=self.session, **kwargs)
+
+        if self.retry_policy is None and self.circuit_breaker is None:
+            return await send()
+        return await acall_with_retry(send, api_id, request_host(url), self.retry_policy, self.circuit_breaker)
+
+    def _cache_lookup(self, url: str, headers: Dict[str, Any], kwargs: Dict[str, Any]):
+        """Return (cache_key, ttl, cached_value) for cacheable TRs"""
+        ttl = self.cache.ttl_for(headers.get("api-id"), url)
+        if ttl is None:
+            return None, None, None
+        key = self.cache.make_key(url, headers, kwargs.get("json"))
+        return key, ttl, self.cache.get(key)
 
     def _make_request(self, method: str, url: str, **kwargs):
         headers = kwargs.pop("headers", {})
         headers["content-type"] = "application/json;charset=UTF-8"
-        if self.token_manager:
-            access_token = self._get_access_token()
-            headers["Authorization"] = f"Bearer {access_token}"
-        return make_request(endpoint=url, method=method, headers=headers, **kwargs)
+        cache_key = None
+        if self.cache is not None:
+            cache_key, ttl, cached = self._cache_lookup(url, headers, kwargs)
+            if cached is not None:
+                return cached
+        # 이미 deadline 이 지났으면 토큰 발급이나 대기 없이 바로 실패한다
+        deadline.check()
+        credential = None
+        if self.credential_pool is not None:
+            credential = self.credential_pool.acquire(headers.get("api-id"), url)
+        try:
+            token_manager = self.token_manager
+            rate_limiter = None
+            if credential is not None:
+                self._apply_credential(headers, credential)
+                token_manager, rate_limiter = credential.token_manager, credential.rate_limiter
+            if token_manager:
+                access_token = self._get_access_token(token_manager)
+                headers["Authorization"] = f"Bearer {access_token}"
+            if self.coalescer is not None and is_coalescable(headers.get("api-id"), url):
+                key = request_key(url, headers, kwargs.get("json"))
+                result = self.coalescer.run(key, lambda: self._send(method, url, headers, kwargs, rate_limiter))
+            else:
+                result = self._send(method, url, headers, kwargs, rate_limiter)
+        finally:
+            if credential is not None:
+                self.credential_pool.release(credential)
+        if cache_key is not None and self.cache.is_success(result):
+            self.cache.set(cache_key, result, ttl)
+        return result
 
     async def _make_request_async(self, method: str, url: str, **kwargs):
+        # deadline() 블록 안이면 토큰 발급, 대기, 재시도를 포함한 요청 전체를 남은 시간이 지나는 즉시 취소한다
+        return await deadline.wait_for(self._request_async(method, url, **kwargs))
+
+    async def _request_async(self, method: str, url: str, **kwargs):
         headers = kwargs.pop("headers", {})
         headers["content-type"] = "application/json;charset=UTF-8"
-        if self.token_manager:
-            access_token = await self._get_access_token_async()
-            headers["Authorization"] = f"Bearer {access_token}"
-        return await make_request_async(endpoint=url, method=method, headers=headers, **kwargs)
+        cache_key = None
+        if self.cache is not None:
+            cache_key, ttl, cached = self._cache_lookup(url, headers, kwargs)
+            if cached is not None:
+                return cached
+        credential = None
+        if self.credential_pool is not None:
+            credential = self.credential_pool.acquire(headers.get("api-id"), url)
+        try:
+            token_manager = self.token_manager
+            rate_limiter = None
+            if credential is not None:
+                self._apply_credential(headers, credential)
+                token_manager, rate_limiter = credential.token_manager, credential.rate_limiter
+            if token_manager:
+                access_token = await self._get_access_token_async(token_manager)
+                headers["Authorization"] = f"Bearer {access_token}"
+            if self.coalescer is not None and is_coalescable(headers.get("api-id"), url):
+                key = request_key(url, headers, kwargs.get("json"))
+                result = await self.coalescer.run_async(
+                    key, lambda: self._send_async(method, url, headers, kwargs, rate_limiter)
+                )
+            else:
+                result = await self._send_async(method, url, headers, kwargs, rate_limiter)
+        finally:
+            if credential is not None:
+                self.credential_pool.release(credential)
+        if cache_key is not None and self.cache.is_success(result):
+            self.cache.set(cache_key, result, ttl)
+        return result
 
     def _execute_request(self, method: str, resource_url: str = None, **kwargs):
         # resource_url이 제공되면 임시로 사용, 아니면 기본값 사용
@@ -49,3 +194,160 @@ class KiwoomBaseAPI:
         if self.use_async:
             return self._make_request_async(method, url, **kwargs)
         return self._make_request(method, url, **kwargs)
+
+
+    def _resolve_request_method(self, request_method: Union[str, Callable]) -> Callable:
+        if isinstance(request_method, str):
+            return getattr(self, request_method)
+        return request_method
+
+    def _page_fetcher(self, request_method: Union[str, Callable], args: tuple, kwargs: Dict[str, Any]):
+        func = self._resolve_request_method(request_method)
+        kwargs.pop("cont_yn", None)
+        next_key = kwargs.pop("next_key", "")
+
+        def fetch(cont_yn: str, key: str):
+            return func(*args, cont_yn=cont_yn, next_key=key, **kwargs)
+
+        return fetch, next_key
+
+    def iter_pages(
+        self,
+        request_method: Union[str, Callable],
+        *args,
+        max_pages: Optional[int] = None,
+        prefetch: int = 0,
+        **kwargs
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        연속조회(cont-yn/next-key)를 자동으로 따라가며 페이지를 하나씩 반환 (동기)
+
+        Args:
+            request_method: TR 메서드 (예: chart.stock_daily_chart_request_ka10081) 또는 메서드 이름
+            *args, **kwargs: TR 메서드 인자 (next_key 를 주면 해당 위치부터 이어서 조회)
+            max_pages (int, optional): 최대 페이지 수
+            prefetch (int, optional): 미리 요청할 페이지 수. 0 이면 사용하지 않음 (기본값: 0)
+
+        Example:
+            >>> for page in chart.iter_pages(
+            ...     chart.stock_daily_chart_request_ka10081,
+            ...     stk_cd="005930", base_dt="20241107", upd_stkpc_tp="1",
+            ... ):
+            ...     handle(page["stk_dt_pole_chart_qry"])
+        """
+        if self.use_async:
+            raise TypeError("use_async=True 인 경우 aiter_pages 를 사용하세요")
+        fetch, next_key = self._page_fetcher(request_method, args, kwargs)
+        if prefetch:
+            return prefetch_pages(fetch, depth=prefetch, max_pages=max_pages, next_key=next_key)
+        return iter_pages(fetch, max_pages=max_pages, next_key=next_key)
+
+    def aiter_pages(
+        self,
+        request_method: Union[str, Callable],
+        *args,
+        max_pages: Optional[int] = None,
+        prefetch: int = 0,
+        **kwargs
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        iter_pages 의 비동기 버전 (use_async=True 필요)
+
+        Example:
+            >>> async for page in chart.aiter_pages("stock_daily_chart_request_ka10081", ...):
+            ...     handle(page["stk_dt_pole_chart_qry"])
+        """
+        if not self.use_async:
+            raise TypeError("use_async=False 인 경우 iter_pages 를 사용하세요")
+        fetch, next_key = self._page_fetcher(request_method, args, kwargs)
+        if prefetch:
+            return aprefetch_pages(fetch, depth=prefetch, max_pages=max_pages, next_key=next_key)
+        return aiter_pages(fetch, max_pages=max_pages, next_key=next_key)
+
+    def fetch_all(
+        self,
+        request_method: Union[str, Callable],
+        *args,
+        list_keys: Optional[Iterable[str]] = None,
+        max_pages: Optional[int] = None,
+        **kwargs
+    ):
+        """
+        모든 연속조회 페이지를 받아 리스트 필드를 이어 붙인 하나의 응답을 반환
+
+        Args:
+            request_method: TR 메서드 또는 메서드 이름
+            *args, **kwargs: TR 메서드 인자
+            list_keys (Iterable[str], optional): 이어 붙일 리스트 필드 (기본값: 모든 리스트 필드)
+            max_pages (int, optional): 최대 페이지 수
+
+        deadline() 블록 안에서 호출하면 모든 페이지와 재시도가 남은 시간 안에서 실행된다.
+
+        Returns:
+            Dict[str, Any] or Awaitable[Dict[str, Any]]: 병합된 응답
+        """
+        if self.use_async:
+            return self._fetch_all_async(request_method, args, list_keys, max_pages, kwargs)
+        merger = PageMerger(list_keys)
+        for page in self.iter_pages(request_method, *args, max_pages=max_pages, **kwargs):
+            merger.add(page)
+        return merger.result
+
+    async def _fetch_all_async(self, request_method, args, list_keys, max_pages, kwargs) -> Dict[str, Any]:
+        merger = PageMerger(list_keys)
+        async for page in self.aiter_pages(request_method, *args, max_pages=max_pages, **kwargs):
+            merger.add(page)
+        return merger.result
+
+    def map_symbols(
+        self,
+        request_method: Union[str, Callable],
+        codes: Iterable[str],
+        *args,
+        concurrency: Optional[int] = None,
+        **kwargs
+    ) -> Iterator[bulk.BulkResult]:
+        """
+        여러 종목에 같은 TR 을 스레드 풀로 호출하고 완료되는 순서대로 결과를 반환 (동기)
+
+        종목코드는 TR 메서드의 첫 번째 인자로 전달한다. 요청 속도는 rate_limiter 가,
+        동시 요청 수는 concurrency 가 제한하며 종목별 예외는 BulkResult.error 에 담긴다.
+
+        Args:
+            request_method: TR 메서드 또는 메서드 이름
+            codes (Iterable[str]): 종목코드 목록
+            *args, **kwargs: 종목코드 다음에 전달할 TR 메서드 인자
+            concurrency (int, optional): 최대 동시 요청 수 (기본값: config 의 BULK_CONCURRENCY)
+
+        Example:
+            >>> for item in stock_info.map_symbols("basic_stock_information_request_ka10001", codes):
+            ...     if item.ok:
+            ...         handle(item.code, item.result)
+        """
+        if self.use_async:
+            raise TypeError("use_async=True 인 경우 amap_symbols 를 사용하세요")
+        func = self._resolve_request_method(request_method)
+        return bulk.map_symbols(func, codes, *args, max_workers=concurrency or BULK_CONCURRENCY, **kwargs)
+
+    def amap_symbols(
+        self,
+        request_method: Union[str, Callable],
+        codes: Iterable[str],
+        *args,
+        concurrency: Optional[int] = None,
+        **kwargs
+    ) -> AsyncIterator[bulk.BulkResult]:
+        """
+        map_symbols 의 비동기 버전 (use_async=True 필요)
+
+        Example:
+            >>> async for item in chart.amap_symbols(
+            ...     chart.stock_daily_chart_request_ka10081, codes,
+            ...     base_dt="20250101", upd_stkpc_tp="1", concurrency=16,
+            ... ):
+            ...     handle(item)
+        """
+        if not self.use_async:
+            raise TypeError("use_async=False 인 경우 map_symbols 를 사용하세요")
+        func = self._resolve_request_method(request_method)
+        return bulk.amap_symbols(func, codes, *args, concurrency=concurrency or BULK_CONCURRENCY, **kwargs)
@@ -0,0 +1,101 @@
+import asyncio
+import contextvars
+import itertools
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterable, Iterator, NamedTuple, Optional
+
+from kiwoom_rest_api.config import BULK_CONCURRENCY
+
+
+class BulkResult(NamedTuple):
+    """종목 하나에 대한 처리 결과 (result 와 error 중 하나만 채워진다)"""
+
+    code: str
+    result: Optional[Any] = None
+    error: Optional[BaseException] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def map_symbols(
+    func: Callable[..., Any],
+    codes: Iterable[str],
+    *args: Any,
+    max_workers: int = BULK_CONCURRENCY,
+    **kwargs: Any,
+) -> Iterator[BulkResult]:
+    """
+    Call func(code, *args, **kwargs) for every code on a thread pool
+
+    At most max_workers calls are in flight; further codes are only pulled
+    from the iterable as earlier calls finish. Results are yielded in
+    completion order and exceptions are captured per item.
+    """
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
+    codes = iter(codes)
+
+    def call(code: str) -> BulkResult:
+        try:
+            return BulkResult(code, func(code, *args, **kwargs))
+        except Exception as e:
+            return BulkResult(code, error=e)
+
+    def submit(executor: ThreadPoolExecutor, code: str):
+        # 호출자의 contextvars (deadline 등) 를 작업 스레드에서도 사용한다
+        return executor.submit(contextvars.copy_context().run, call, code)
+
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="kiwoom-bulk")
+    pending = set()
+    try:
+        pending = {submit(executor, code) for code in itertools.islice(codes, max_workers)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            # 결과를 넘기기 전에 빈 자리를 먼저 채워 소비자가 처리하는 동안에도 요청이 진행되게 한다
+            for code in itertools.islice(codes, len(done)):
+                pending.add(submit(executor, code))
+            for future in done:
+                yield future.result()
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=True)
+
+
+async def amap_symbols(
+    func: Callable[..., Awaitable[Any]],
+    codes: Iterable[str],
+    *args: Any,
+    concurrency: int = BULK_CONCURRENCY,
+    **kwargs: Any,
+) -> AsyncIterator[BulkResult]:
+    """
+    Await func(code, *args, **kwargs) for every code with at most concurrency in flight
+
+    Async counterpart of map_symbols; results are yielded as they complete.
+    Leaving the loop early cancels the calls still in flight.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    codes = iter(codes)
+
+    async def call(code: str) -> BulkResult:
+        try:
+            return BulkResult(code, await func(code, *args, **kwargs))
+        except Exception as e:
+            return BulkResult(code, error=e)
+
+    pending = set()
+    try:
+        pending = {asyncio.ensure_future(call(code)) for code in itertools.islice(codes, concurrency)}
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for code in itertools.islice(codes, len(done)):
+                pending.add(asyncio.ensure_future(call(code)))
+            for task in done:
+                yield task.result()
+    finally:
+        for task in pending:
+            task.cancel()
@@ -0,0 +1,198 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from kiwoom_rest_api.core import codec
+from kiwoom_rest_api.core.coalesce import is_account_resource, request_key
+
+# 하루에 한 번 이상 바뀌지 않는 기준정보 TR 의 기본 TTL (초)
+REFERENCE_DATA_TTLS: Dict[str, float] = {
+    "ka10099": 6 * 60 * 60,  # 종목정보 리스트
+    "ka10100": 6 * 60 * 60,  # 종목정보 조회
+    "ka10101": 6 * 60 * 60,  # 업종코드 리스트
+    "ka10102": 6 * 60 * 60,  # 회원사 리스트
+    "ka90001": 6 * 60 * 60,  # 테마그룹별
+}
+
+
+class MemoryCacheBackend:
+    """프로세스 메모리 LRU 캐시 백엔드"""
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._data: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.time():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, expires_at: float) -> None:
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class SQLiteCacheBackend:
+    """
+    SQLite 파일 LRU 캐시 백엔드
+
+    프로세스가 재시작되어도 유지되며 여러 프로세스가 같은 파일을 공유할 수 있다.
+    값은 JSON 으로 저장한다.
+    """
+
+    def __init__(self, path: str, maxsize: int = 10000):
+        """
+        Args:
+            path (str): SQLite 파일 경로
+            maxsize (int): 최대 항목 수 (초과 시 가장 오래 사용하지 않은 항목부터 삭제)
+        """
+        import sqlite3  # 메모리 캐시만 쓰는 경우 import 비용을 피한다
+
+        path = os.path.expanduser(path)
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS response_cache ("
+                " key TEXT PRIMARY KEY,"
+                " value TEXT NOT NULL,"
+                " expires_at REAL NOT NULL,"
+                " accessed_at REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS response_cache_accessed ON response_cache (accessed_at)"
+            )
+
+    def get(self, key: str) -> Optional[Any]:
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM response_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            value, expires_at = row
+            with self._conn:
+                if expires_at <= now:
+                    self._conn.execute("DELETE FROM response_cache WHERE key = ?", (key,))
+                    return None
+                self._conn.execute("UPDATE response_cache SET accessed_at = ? WHERE key = ?", (now, key))
+        return codec.loads(value)
+
+    def set(self, key: str, value: Any, expires_at: float) -> None:
+        encoded = codec.dumps(value)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO response_cache (key, value, expires_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, encoded, expires_at, time.time()),
+            )
+            self._conn.execute(
+                "DELETE FROM response_cache WHERE key IN ("
+                " SELECT key FROM response_cache ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                (self.maxsize,),
+            )
+
+    def delete(self, key: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM response_cache WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM response_cache")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM response_cache").fetchone()[0]
+
+
+class ResponseCache:
+    """
+    api-id 별 TTL 응답 캐시
+
+    TTL 이 지정된 TR 의 성공 응답만 저장한다. 메모리 백엔드는 저장된 dict 를 그대로
+    돌려주므로 호출자는 결과를 수정하지 않아야 한다.
+
+    Example:
+        >>> cache = ResponseCache()  # 기준정보 TR 기본 TTL, 메모리 LRU
+        >>> cache = ResponseCache(SQLiteCacheBackend("~/.kiwoom/cache.db"), ttls={"ka10001": 5})
+        >>> stock_info = StockInfo(base_url="https://api.kiwoom.com", cache=cache)
+    """
+
+    def __init__(
+        self,
+        backend: Any = None,
+        ttls: Optional[Dict[str, float]] = None,
+        default_ttl: Optional[float] = None,
+    ):
+        """
+        Args:
+            backend: 캐시 백엔드 (기본값: MemoryCacheBackend)
+            ttls (Dict[str, float], optional): api-id 별 TTL (초). 기본값은 기준정보 TR 목록
+            default_ttl (float, optional): ttls 에 없는 조회 TR(ka*) 의 TTL (None 이면 캐시하지 않음)
+        """
+        self.backend = backend if backend is not None else MemoryCacheBackend()
+        self.ttls = dict(REFERENCE_DATA_TTLS if ttls is None else ttls)
+        self.default_ttl = default_ttl
+
+    def ttl_for(self, api_id: Optional[str], url: str = "") -> Optional[float]:
+        """Return the TTL for api_id, or None if it must not be cached (account resources never are)"""
+        if not api_id or is_account_resource(url):
+            return None
+        ttl = self.ttls.get(api_id)
+        if ttl is None and api_id.lower().startswith("ka"):
+            ttl = self.default_ttl
+        return ttl if ttl and ttl > 0 else None
+
+    @staticmethod
+    def is_success(value: Any) -> bool:
+        """Only return_code 0 bodies are cached (HTTP 200 can still carry an error or throttle reply)"""
+        return isinstance(value, dict) and str(value.get("return_code")) == "0"
+
+    @staticmethod
+    def make_key(url: str, headers: Dict[str, Any], body: Any) -> str:
+        return codec.dumps(request_key(url, headers, body))
+
+    def get(self, key: str) -> Optional[Any]:
+        return self.backend.get(key)
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        self.backend.set(key, value, time.time() + ttl)
+
+    def invalidate(self, key: Optional[str] = None) -> None:
+        """Drop one entry, or everything when key is None"""
+        if key is None:
+            self.backend.clear()
+        else:
+            self.backend.delete(key)
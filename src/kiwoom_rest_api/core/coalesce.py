@@ -0,0 +1,94 @@
+import asyncio
+import threading
+from concurrent.futures import Future, TimeoutError as FutureTimeout
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+from urllib.parse import urlsplit
+
+from kiwoom_rest_api.core import codec, deadline
+
+
+# 계좌별 응답을 돌려주는 리소스. 요청 본문에 계좌가 없고 appkey 로 구분되므로 다른 호출자와 공유하지 않는다
+ACCOUNT_RESOURCES = ("/api/dostk/acnt",)
+
+
+def is_account_resource(url: str) -> bool:
+    """Return True for account-scoped resources (e.g. ka10075, ka10085, ka10170 on /api/dostk/acnt)"""
+    path = (urlsplit(url).path if "://" in url else url).rstrip("/")
+    return path.endswith(ACCOUNT_RESOURCES)
+
+
+def is_coalescable(api_id: Optional[str], url: str = "") -> bool:
+    """Only market-data inquiry TRs (ka*) may share a response; orders and account inquiries are always sent"""
+    return bool(api_id) and api_id.lower().startswith("ka") and not is_account_resource(url)
+
+
+def request_key(url: str, headers: Dict[str, Any], body: Any) -> Tuple[Hashable, ...]:
+    """Build the coalescing key from the TR identity and request body"""
+    return (
+        url,
+        headers.get("api-id"),
+        headers.get("cont-yn"),
+        headers.get("next-key"),
+        codec.dumps(body, sort_keys=True, default=str),
+    )
+
+
+class RequestCoalescer:
+    """
+    동일 요청 단일 실행 (single-flight)
+
+    같은 (api-id, 요청 본문) 요청이 처리 중일 때 들어온 요청은 새 HTTP 요청을 보내지 않고
+    진행 중인 요청의 결과(또는 예외)를 함께 받는다. 스레드와 asyncio 호출자 모두 지원한다.
+
+    결과 dict 는 대기하던 모든 호출자가 같은 객체를 공유하므로 수정하지 않아야 한다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending: Dict[Hashable, Future] = {}
+        self._pending_async: Dict[Tuple[int, Hashable], "asyncio.Future[Any]"] = {}
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._pending) + len(self._pending_async)
+
+    def run(self, key: Hashable, func: Callable[[], Any]) -> Any:
+        """Run func once for all concurrent callers with the same key (threads)"""
+        with self._lock:
+            future = self._pending.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._pending[key] = future
+
+        if not leader:
+            try:
+                return future.result(deadline.remaining())
+            except FutureTimeout:
+                if future.done():
+                    raise
+                raise deadline.DeadlineExceeded("Deadline exceeded waiting for a coalesced request") from None
+
+        try:
+            result = func()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                self._pending.pop(key, None)
+
+    async def run_async(self, key: Hashable, func: Callable[[], Awaitable[Any]]) -> Any:
+        """Run func once for all concurrent callers with the same key (asyncio)"""
+        loop = asyncio.get_running_loop()
+        loop_key = (id(loop), key)
+        task = self._pending_async.get(loop_key)
+        if task is None:
+            # 별도 태스크로 실행하여 첫 호출자가 취소되어도 다른 대기자는 결과를 받는다
+            task = asyncio.ensure_future(func())
+            self._pending_async[loop_key] = task
+            task.add_done_callback(lambda _: self._pending_async.pop(loop_key, None))
+        return await asyncio.shield(task)
@@ -0,0 +1,68 @@
+import json
+import os
+from typing import Any, Callable, Optional, Union
+
+# JSON 인코딩/디코딩. orjson 이 설치되어 있으면 사용하고, 없으면 표준 라이브러리 json 을 사용한다.
+# REST 요청/응답과 웹소켓 메시지가 모두 이 모듈을 거친다.
+# 환경 변수 KIWOOM_JSON_BACKEND=json 으로 표준 라이브러리를 강제할 수 있다.
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+# orjson.JSONDecodeError 는 json.JSONDecodeError 의 하위 클래스이다
+JSONDecodeError = json.JSONDecodeError
+
+_use_orjson = orjson is not None and os.environ.get("KIWOOM_JSON_BACKEND", "").lower() != "json"
+
+
+def get_backend() -> str:
+    """Return the name of the active JSON backend"""
+    return "orjson" if _use_orjson else "json"
+
+
+def set_backend(name: str) -> None:
+    """Select the JSON backend ('orjson' or 'json')"""
+    global _use_orjson
+    if name == "orjson":
+        if orjson is None:
+            raise ImportError("orjson is not installed")
+        _use_orjson = True
+    elif name == "json":
+        _use_orjson = False
+    else:
+        raise ValueError(f"Unknown JSON backend: {name}")
+
+
+def dumps_bytes(
+    obj: Any,
+    sort_keys: bool = False,
+    default: Optional[Callable[[Any], Any]] = None,
+) -> bytes:
+    """Serialize obj to compact UTF-8 JSON bytes"""
+    if _use_orjson:
+        try:
+            return orjson.dumps(obj, default=default, option=orjson.OPT_SORT_KEYS if sort_keys else 0)
+        except TypeError:
+            # orjson 이 처리하지 못하는 타입(비문자열 키 등)은 표준 라이브러리로 처리
+            pass
+    return json.dumps(
+        obj, ensure_ascii=False, separators=(",", ":"), sort_keys=sort_keys, default=default
+    ).encode("utf-8")
+
+
+def dumps(
+    obj: Any,
+    sort_keys: bool = False,
+    default: Optional[Callable[[Any], Any]] = None,
+) -> str:
+    """Serialize obj to a compact JSON string"""
+    return dumps_bytes(obj, sort_keys=sort_keys, default=default).decode("utf-8")
+
+
+def loads(data: Union[str, bytes, bytearray, memoryview]) -> Any:
+    """Deserialize JSON from str or UTF-8 bytes"""
+    if _use_orjson:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -0,0 +1,117 @@
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
+from kiwoom_rest_api.config import (
+    USE_SANDBOX,
+    ADAPTIVE_INITIAL_CONCURRENCY,
+    ADAPTIVE_INITIAL_CONCURRENCY_SANDBOX,
+    ADAPTIVE_MAX_CONCURRENCY,
+)
+from kiwoom_rest_api.core.base import RateLimitError
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    AIMD(가산 증가 / 승산 감소) 방식의 비동기 동시 요청 수 제어기
+
+    요청이 성공하는 동안에는 동시 요청 한도를 조금씩 늘리고, 서버가 요청 한도 초과
+    (HTTP 429 또는 한도 초과 return_msg)로 응답하면 한도를 곱셈으로 줄인다.
+    실서버/모의서버, 계정별로 다른 한도를 실행 중에 찾아간다.
+
+    Example:
+        >>> limiter = AdaptiveConcurrencyLimiter()
+        >>> stock_info = StockInfo(use_async=True, concurrency_limiter=limiter)
+    """
+
+    def __init__(
+        self,
+        initial_limit: Optional[float] = None,
+        min_limit: float = 1,
+        max_limit: float = ADAPTIVE_MAX_CONCURRENCY,
+        increase: float = 1.0,
+        decrease_factor: float = 0.5,
+        cooldown: float = 1.0,
+    ):
+        """
+        Args:
+            initial_limit (float, optional): 초기 동시 요청 한도 (기본값: 실서버/모의서버 설정값)
+            min_limit (float): 최소 한도
+            max_limit (float): 최대 한도
+            increase (float): 한도만큼 연속 성공할 때마다 늘릴 양
+            decrease_factor (float): 한도 초과 응답 시 곱할 비율 (0~1)
+            cooldown (float): 연속된 감소 사이의 최소 간격 (초). 같은 혼잡으로 실패한
+                동시 요청들이 한도를 여러 번 깎지 않도록 한다
+        """
+        if initial_limit is None:
+            initial_limit = ADAPTIVE_INITIAL_CONCURRENCY_SANDBOX if USE_SANDBOX else ADAPTIVE_INITIAL_CONCURRENCY
+        if not 0 < decrease_factor < 1:
+            raise ValueError("decrease_factor must be between 0 and 1")
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.increase = increase
+        self.decrease_factor = decrease_factor
+        self.cooldown = cooldown
+        self.limit = float(min(max(initial_limit, min_limit), max_limit))
+        self.in_flight = 0
+        self._last_decrease = 0.0
+        self._condition: Optional[asyncio.Condition] = None
+        self._loop = None
+
+    def _get_condition(self) -> asyncio.Condition:
+        loop = asyncio.get_running_loop()
+        if self._condition is None or self._loop is not loop:
+            self._condition = asyncio.Condition()
+            self._loop = loop
+            self.in_flight = 0
+        return self._condition
+
+    def on_success(self) -> None:
+        """Additive increase: grows by `increase` per `limit` successful calls"""
+        self.limit = min(self.max_limit, self.limit + self.increase / self.limit)
+
+    def on_throttle(self) -> None:
+        """Multiplicative decrease, at most once per cooldown window"""
+        now = time.monotonic()
+        if now - self._last_decrease < self.cooldown:
+            return
+        self._last_decrease = now
+        self.limit = max(self.min_limit, self.limit * self.decrease_factor)
+
+    async def acquire(self) -> None:
+        """Wait until fewer than `limit` requests are in flight"""
+        condition = self._get_condition()
+        async with condition:
+            await condition.wait_for(lambda: self.in_flight < int(self.limit))
+            self.in_flight += 1
+
+    async def release(self, throttled: Optional[bool] = None) -> None:
+        """
+        Release a slot and feed back the outcome
+
+        Args:
+            throttled: True 면 한도 감소, False 면 한도 증가, None 이면 한도 유지
+        """
+        if throttled:
+            self.on_throttle()
+        elif throttled is not None:
+            self.on_success()
+        condition = self._get_condition()
+        async with condition:
+            self.in_flight = max(0, self.in_flight - 1)
+            condition.notify_all()
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Hold one concurrency slot for the duration of a request"""
+        await self.acquire()
+        throttled: Optional[bool] = None
+        try:
+            yield
+            throttled = False
+        except RateLimitError:
+            throttled = True
+            raise
+        finally:
+            await self.release(throttled)
@@ -0,0 +1,103 @@
+import asyncio
+import contextvars
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Awaitable, Iterator, Optional, TypeVar, Union
+
+from kiwoom_rest_api.core.base import APIError
+
+T = TypeVar("T")
+
+# 현재 컨텍스트의 만료 시각 (time.monotonic 기준). 스레드 풀/태스크로 전달하려면 contextvars 를 복사한다
+_expires_at: "contextvars.ContextVar[Optional[float]]" = contextvars.ContextVar("kiwoom_deadline", default=None)
+
+
+class DeadlineExceeded(APIError):
+    """Raised when the caller's time budget runs out before a request completes"""
+
+    def __init__(self, message: str = "Deadline exceeded"):
+        super().__init__(504, message)
+
+
+def _monotonic_at(at: Union[float, datetime]) -> float:
+    """Convert a wall-clock deadline (epoch seconds or datetime) to time.monotonic()"""
+    timestamp = at.timestamp() if isinstance(at, datetime) else float(at)
+    return time.monotonic() + (timestamp - time.time())
+
+
+@contextmanager
+def deadline(timeout: Optional[float] = None, at: Optional[Union[float, datetime]] = None) -> Iterator[None]:
+    """
+    블록 안의 모든 요청에 전체 시간 예산을 적용
+
+    연속조회 페이지, 재시도와 백오프, 요청 속도 제한 대기, 토큰 발급이 모두 남은 시간 안에서
+    실행되며, 예산을 다 쓰면 DeadlineExceeded 가 발생한다. 중첩하면 더 이른 만료 시각이 적용된다.
+    동기/비동기 코드 모두에서 사용할 수 있다.
+
+    Args:
+        timeout (float, optional): 지금부터의 시간 예산 (초)
+        at (float or datetime, optional): 절대 만료 시각 (epoch 초 또는 datetime)
+
+    Example:
+        >>> with deadline(2.0):
+        ...     chart.fetch_all("stock_daily_chart_request_ka10081", "005930", "20250101", "1")
+    """
+    if (timeout is None) == (at is None):
+        raise ValueError("Specify exactly one of timeout or at")
+    expires_at = time.monotonic() + timeout if timeout is not None else _monotonic_at(at)
+    outer = _expires_at.get()
+    if outer is not None:
+        expires_at = min(expires_at, outer)
+    token = _expires_at.set(expires_at)
+    try:
+        yield
+    finally:
+        _expires_at.reset(token)
+
+
+def remaining() -> Optional[float]:
+    """Seconds left in the current deadline (may be negative), or None without one"""
+    expires_at = _expires_at.get()
+    if expires_at is None:
+        return None
+    return expires_at - time.monotonic()
+
+
+def expired() -> bool:
+    left = remaining()
+    return left is not None and left <= 0
+
+
+def check() -> None:
+    """Raise DeadlineExceeded if the current deadline has passed"""
+    if expired():
+        raise DeadlineExceeded()
+
+
+def clamp(timeout: Optional[float]) -> Optional[float]:
+    """Shorten timeout to the time left in the current deadline"""
+    left = remaining()
+    if left is None:
+        return timeout
+    if left <= 0:
+        raise DeadlineExceeded()
+    return left if timeout is None else min(timeout, left)
+
+
+async def wait_for(awaitable: Awaitable[T]) -> T:
+    """Await awaitable, cancelling it when the current deadline passes"""
+    left = remaining()
+    if left is None:
+        return await awaitable
+    if left <= 0:
+        # 코루틴을 시작하지 않고 닫아 경고를 남기지 않는다
+        if asyncio.iscoroutine(awaitable):
+            awaitable.close()
+        raise DeadlineExceeded()
+    try:
+        return await asyncio.wait_for(awaitable, left)
+    except asyncio.TimeoutError:
+        if not expired():
+            raise
+        raise DeadlineExceeded() from None
@@ -0,0 +1,155 @@
+import logging
+import threading
+import time
+from typing import Any, Callable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# 요청 추적 훅. 등록된 콜백이 없으면 요청 경로에서 아무 작업도 하지 않는다.
+# 콜백에서 발생한 예외는 로그만 남기고 요청에는 영향을 주지 않는다.
+
+Callback = Callable[["RequestEvent"], Any]
+
+
+class RequestEvent:
+    """
+    요청 추적 이벤트
+
+    Attributes:
+        method (str): HTTP 메서드
+        url (str): 요청 URL
+        api_id (str): TR 코드 (api-id 헤더)
+        start (float): 요청 시작 시각 (time.perf_counter)
+        elapsed (float): 소요 시간 (초). on_request_start 에서는 None
+        status_code (int): HTTP 상태 코드. 응답을 받지 못했으면 None
+        error (BaseException): on_error 에서 발생한 예외
+    """
+
+    __slots__ = ("method", "url", "api_id", "start", "elapsed", "status_code", "error")
+
+    def __init__(self, method: str, url: str, api_id: Optional[str] = None):
+        self.method = method
+        self.url = url
+        self.api_id = api_id
+        self.start = time.perf_counter()
+        self.elapsed: Optional[float] = None
+        self.status_code: Optional[int] = None
+        self.error: Optional[BaseException] = None
+
+    def finish(self, status_code: Optional[int] = None, error: Optional[BaseException] = None) -> "RequestEvent":
+        self.elapsed = time.perf_counter() - self.start
+        self.status_code = status_code
+        self.error = error
+        return self
+
+    def __repr__(self) -> str:
+        return (
+            f"RequestEvent(method={self.method!r}, url={self.url!r}, api_id={self.api_id!r}, "
+            f"elapsed={self.elapsed!r}, status_code={self.status_code!r}, error={self.error!r})"
+        )
+
+
+class RequestHooks:
+    """
+    요청 추적 훅 레지스트리
+
+    Example:
+        >>> from kiwoom_rest_api.core.hooks import hooks
+        >>> @hooks.on_response
+        ... def trace(event):
+        ...     print(event.api_id, event.status_code, event.elapsed)
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._start: List[Callback] = []
+        self._response: List[Callback] = []
+        self._error: List[Callback] = []
+        self.active = False
+
+    def _register(self, callbacks: List[Callback], callback: Callback) -> Callback:
+        with self._lock:
+            callbacks.append(callback)
+            self.active = True
+        return callback
+
+    def on_request_start(self, callback: Callback) -> Callback:
+        """Register a callback fired before the request is sent (usable as a decorator)"""
+        return self._register(self._start, callback)
+
+    def on_response(self, callback: Callback) -> Callback:
+        """Register a callback fired after a response was received and processed"""
+        return self._register(self._response, callback)
+
+    def on_error(self, callback: Callback) -> Callback:
+        """Register a callback fired when the request or response processing raised"""
+        return self._register(self._error, callback)
+
+    def remove(self, callback: Callback) -> None:
+        with self._lock:
+            for callbacks in (self._start, self._response, self._error):
+                while callback in callbacks:
+                    callbacks.remove(callback)
+            self.active = bool(self._start or self._response or self._error)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._start.clear()
+            self._response.clear()
+            self._error.clear()
+            self.active = False
+
+    @staticmethod
+    def _fire(callbacks: List[Callback], event: RequestEvent) -> None:
+        for callback in list(callbacks):
+            try:
+                callback(event)
+            except Exception:
+                logger.exception("Request hook %r failed", callback)
+
+    def request_start(self, event: RequestEvent) -> None:
+        self._fire(self._start, event)
+
+    def response(self, event: RequestEvent) -> None:
+        self._fire(self._response, event)
+
+    def error(self, event: RequestEvent) -> None:
+        self._fire(self._error, event)
+
+
+# 전역 훅 레지스트리 (sync_client / async_client 가 사용)
+hooks = RequestHooks()
+
+
+class LoggingHook:
+    """요청 결과를 logging 으로 기록하는 훅"""
+
+    def __init__(self, logger: Optional[logging.Logger] = None, level: int = logging.DEBUG):
+        self.logger = logger or logging.getLogger("kiwoom_rest_api.requests")
+        self.level = level
+
+    def on_response(self, event: RequestEvent) -> None:
+        self.logger.log(
+            self.level, "%s %s api-id=%s status=%s %.1fms",
+            event.method, event.url, event.api_id, event.status_code, event.elapsed * 1000,
+        )
+
+    def on_error(self, event: RequestEvent) -> None:
+        self.logger.log(
+            max(self.level, logging.WARNING), "%s %s api-id=%s status=%s %.1fms failed: %r",
+            event.method, event.url, event.api_id, event.status_code, event.elapsed * 1000, event.error,
+        )
+
+
+def enable_logging(logger: Optional[logging.Logger] = None, level: int = logging.DEBUG) -> LoggingHook:
+    """Register a LoggingHook on the global registry and return it"""
+    hook = LoggingHook(logger, level)
+    hooks.on_response(hook.on_response)
+    hooks.on_error(hook.on_error)
+    return hook
+
+
+def disable_logging(hook: LoggingHook) -> None:
+    """Unregister a hook returned by enable_logging"""
+    hooks.remove(hook.on_response)
+    hooks.remove(hook.on_error)
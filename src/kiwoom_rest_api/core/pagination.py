@@ -0,0 +1,224 @@
+import asyncio
+import contextvars
+import queue
+import threading
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, Iterator, Optional
+
+# 연속조회 응답 헤더 (process_response 가 응답 본문에 병합한다)
+CONT_YN_HEADER = "cont-yn"
+NEXT_KEY_HEADER = "next-key"
+
+PageFetcher = Callable[[str, str], Dict[str, Any]]
+AsyncPageFetcher = Callable[[str, str], Awaitable[Dict[str, Any]]]
+
+
+def next_page_key(page: Any) -> Optional[str]:
+    """Return the next-key of a page if the server says more data follows"""
+    if not isinstance(page, dict):
+        return None
+    if str(page.get(CONT_YN_HEADER) or "").upper() != "Y":
+        return None
+    return page.get(NEXT_KEY_HEADER) or None
+
+
+def iter_pages(
+    fetch: PageFetcher,
+    max_pages: Optional[int] = None,
+    next_key: str = "",
+) -> Iterator[Dict[str, Any]]:
+    """
+    연속조회 페이지를 차례로 반환하는 제너레이터
+
+    Args:
+        fetch: (cont_yn, next_key) 를 받아 한 페이지를 반환하는 함수
+        max_pages (int, optional): 최대 페이지 수
+        next_key (str, optional): 이어서 조회할 연속조회키
+    """
+    cont_yn = "Y" if next_key else "N"
+    count = 0
+    while max_pages is None or count < max_pages:
+        page = fetch(cont_yn, next_key)
+        count += 1
+        yield page
+
+        key = next_page_key(page)
+        if key is None:
+            return
+        cont_yn, next_key = "Y", key
+
+
+async def aiter_pages(
+    fetch: AsyncPageFetcher,
+    max_pages: Optional[int] = None,
+    next_key: str = "",
+) -> AsyncIterator[Dict[str, Any]]:
+    """iter_pages 의 비동기 버전"""
+    cont_yn = "Y" if next_key else "N"
+    count = 0
+    while max_pages is None or count < max_pages:
+        page = await fetch(cont_yn, next_key)
+        count += 1
+        yield page
+
+        key = next_page_key(page)
+        if key is None:
+            return
+        cont_yn, next_key = "Y", key
+
+
+class _Failure:
+    """Carries an exception from the prefetch producer to the consumer"""
+
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+_DONE = object()
+
+
+def prefetch_pages(
+    fetch: PageFetcher,
+    depth: int = 1,
+    max_pages: Optional[int] = None,
+    next_key: str = "",
+) -> Iterator[Dict[str, Any]]:
+    """
+    다음 페이지를 미리 요청하는 iter_pages (백그라운드 스레드)
+
+    페이지 N 의 응답(연속조회키)이 도착하는 즉시 N+1 을 요청하므로,
+    호출자가 페이지를 처리하는 시간과 네트워크 대기 시간이 겹친다.
+
+    Args:
+        fetch: (cont_yn, next_key) 를 받아 한 페이지를 반환하는 함수
+        depth (int): 호출자가 아직 가져가지 않은 페이지를 최대 몇 개까지 미리 받을지
+        max_pages (int, optional): 최대 페이지 수
+        next_key (str, optional): 이어서 조회할 연속조회키
+    """
+    if depth < 1:
+        raise ValueError("depth must be >= 1")
+
+    pages: "queue.Queue[Any]" = queue.Queue()
+    slots = threading.Semaphore(depth)
+    stop = threading.Event()
+
+    def acquire_slot() -> bool:
+        while not stop.is_set():
+            if slots.acquire(timeout=0.1):
+                return True
+        return False
+
+    def produce() -> None:
+        try:
+            if not acquire_slot():
+                return
+            for page in iter_pages(fetch, max_pages, next_key):
+                pages.put(page)
+                if not acquire_slot():
+                    return
+            pages.put(_DONE)
+        except BaseException as e:
+            pages.put(_Failure(e))
+
+    # deadline 등 contextvars 를 생산 스레드로 전달한다
+    context = contextvars.copy_context()
+    producer = threading.Thread(target=context.run, args=(produce,), daemon=True)
+    producer.start()
+    try:
+        while True:
+            item = pages.get()
+            if item is _DONE:
+                return
+            if isinstance(item, _Failure):
+                raise item.error
+            slots.release()
+            yield item
+    finally:
+        stop.set()
+
+
+async def aprefetch_pages(
+    fetch: AsyncPageFetcher,
+    depth: int = 1,
+    max_pages: Optional[int] = None,
+    next_key: str = "",
+) -> AsyncIterator[Dict[str, Any]]:
+    """prefetch_pages 의 비동기 버전 (생산자 태스크 사용)"""
+    if depth < 1:
+        raise ValueError("depth must be >= 1")
+
+    pages: "asyncio.Queue[Any]" = asyncio.Queue()
+    slots = asyncio.Semaphore(depth)
+
+    async def produce() -> None:
+        try:
+            await slots.acquire()
+            async for page in aiter_pages(fetch, max_pages, next_key):
+                pages.put_nowait(page)
+                await slots.acquire()
+            pages.put_nowait(_DONE)
+        except asyncio.CancelledError:
+            raise
+        except BaseException as e:
+            pages.put_nowait(_Failure(e))
+
+    producer = asyncio.ensure_future(produce())
+    try:
+        while True:
+            item = await pages.get()
+            if item is _DONE:
+                return
+            if isinstance(item, _Failure):
+                raise item.error
+            slots.release()
+            yield item
+    finally:
+        producer.cancel()
+
+
+class PageMerger:
+    """
+    여러 페이지의 리스트 필드를 하나의 응답으로 이어 붙인다
+
+    첫 페이지의 스칼라 필드는 유지하고, 리스트 필드(예: stk_dt_pole_chart_qry, oso)는
+    이후 페이지의 항목을 뒤에 이어 붙인다. 연속조회 헤더는 마지막 페이지 값을 따른다.
+    """
+
+    def __init__(self, list_keys: Optional[Iterable[str]] = None):
+        self.list_keys = set(list_keys) if list_keys is not None else None
+        self.result: Dict[str, Any] = {}
+        self.pages = 0
+
+    def _is_merged(self, key: str, value: Any) -> bool:
+        if not isinstance(value, list):
+            return False
+        return self.list_keys is None or key in self.list_keys
+
+    def add(self, page: Dict[str, Any]) -> None:
+        """Merge one page into the result"""
+        if not isinstance(page, dict):
+            return
+        self.pages += 1
+        if self.pages == 1:
+            self.result = {
+                key: list(value) if self._is_merged(key, value) else value
+                for key, value in page.items()
+            }
+            return
+
+        for key, value in page.items():
+            if self._is_merged(key, value):
+                self.result.setdefault(key, []).extend(value)
+        for header in (CONT_YN_HEADER, NEXT_KEY_HEADER):
+            if header in page:
+                self.result[header] = page[header]
+
+
+def merge_pages(
+    pages: Iterable[Dict[str, Any]],
+    list_keys: Optional[Iterable[str]] = None,
+) -> Dict[str, Any]:
+    """Stitch the list payloads of several pages together"""
+    merger = PageMerger(list_keys)
+    for page in pages:
+        merger.add(page)
+    return merger.result
@@ -0,0 +1,156 @@
+import asyncio
+import threading
+import time
+from contextlib import ExitStack
+from typing import Dict, Optional
+
+from kiwoom_rest_api.config import RATE_LIMIT_PER_SECOND, RATE_LIMIT_BURST
+from kiwoom_rest_api.core import deadline
+
+
+class TokenBucket:
+    """
+    토큰 버킷 (GCRA 방식의 예약형 구현)
+
+    reserve() 는 토큰을 즉시 예약하고 사용 가능한 시각을 돌려준다. 대기열 없이도
+    먼저 예약한 호출이 먼저 통과하며, 잠금은 예약 계산 동안만 잡는다.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """
+        Args:
+            rate (float): 초당 허용 요청 수
+            capacity (float, optional): 순간 허용 요청 수 (기본값: max(1, rate))
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._interval = 1.0 / rate
+        self._tolerance = max(0.0, (self.capacity - 1) * self._interval)
+        self._tat = 0.0  # theoretical arrival time
+        self._lock = threading.Lock()
+
+    def earliest(self, not_before: float) -> float:
+        """Earliest monotonic time at or after not_before when a slot is free (reserves nothing)"""
+        return max(not_before, self._tat - self._tolerance)
+
+    def commit(self, start: float) -> None:
+        """Record a slot used at start (start must not be before earliest())"""
+        self._tat = max(self._tat, start) + self._interval
+
+    def reserve(self, not_before: Optional[float] = None) -> float:
+        """Reserve one slot and return the monotonic time at which it may be used"""
+        with self._lock:
+            now = time.monotonic()
+            start = self.earliest(now if not_before is None else max(now, not_before))
+            self.commit(start)
+            return start
+
+
+class RateLimiter:
+    """
+    api-id 별 토큰 버킷 레이트 리미터
+
+    전역 버킷과 TR(api-id)별 버킷을 함께 적용한다. 동기 경로는 time.sleep,
+    비동기 경로는 asyncio.sleep 으로 슬롯이 열릴 때까지 기다린다.
+
+    Example:
+        >>> limiter = RateLimiter(rate=5, per_api_rates={"ka10081": 1})
+        >>> chart = Chart(base_url="https://api.kiwoom.com", rate_limiter=limiter)
+    """
+
+    def __init__(
+        self,
+        rate: Optional[float] = RATE_LIMIT_PER_SECOND,
+        burst: Optional[float] = RATE_LIMIT_BURST,
+        per_api_rates: Optional[Dict[str, float]] = None,
+        per_api_burst: Optional[float] = None,
+    ):
+        """
+        Args:
+            rate (float, optional): 전역 초당 요청 수 (None 이면 전역 제한 없음)
+            burst (float, optional): 전역 순간 허용 요청 수
+            per_api_rates (Dict[str, float], optional): api-id 별 초당 요청 수
+            per_api_burst (float, optional): api-id 별 순간 허용 요청 수
+        """
+        self.global_bucket = TokenBucket(rate, burst) if rate else None
+        self.per_api_rates = dict(per_api_rates or {})
+        self.per_api_burst = per_api_burst
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def _bucket_for(self, api_id: Optional[str]) -> Optional[TokenBucket]:
+        if not api_id or api_id not in self.per_api_rates:
+            return None
+        bucket = self._buckets.get(api_id)
+        if bucket is None:
+            with self._lock:
+                bucket = self._buckets.get(api_id)
+                if bucket is None:
+                    bucket = TokenBucket(self.per_api_rates[api_id], self.per_api_burst)
+                    self._buckets[api_id] = bucket
+        return bucket
+
+    def reserve(self, api_id: Optional[str] = None) -> float:
+        """Reserve a slot for api_id and return the delay in seconds before it opens"""
+        buckets = [b for b in (self._bucket_for(api_id), self.global_bucket) if b is not None]
+        if not buckets:
+            return 0.0
+        # 두 버킷 모두 같은 시작 시각으로 예약해야 전역 대기로 밀린 요청도 TR 별 간격을 지킨다.
+        # 잠금은 항상 TR 버킷 -> 전역 버킷 순서로 잡는다
+        with ExitStack() as stack:
+            for bucket in buckets:
+                stack.enter_context(bucket._lock)
+            now = time.monotonic()
+            start = max(bucket.earliest(now) for bucket in buckets)
+            for bucket in buckets:
+                bucket.commit(start)
+        return max(0.0, start - now)
+
+    def api_delay(self, api_id: Optional[str] = None) -> float:
+        """Seconds until the api_id bucket alone has a free slot (reserves nothing)"""
+        bucket = self._bucket_for(api_id)
+        if bucket is None:
+            return 0.0
+        with bucket._lock:
+            now = time.monotonic()
+            return max(0.0, bucket.earliest(now) - now)
+
+    def wait_api(self, api_id: Optional[str] = None) -> float:
+        """Sleep until the api_id bucket has a free slot without reserving it; returns the time waited"""
+        delay = self.api_delay(api_id)
+        self._check_deadline(delay)
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    async def wait_api_async(self, api_id: Optional[str] = None) -> float:
+        """asyncio version of wait_api"""
+        delay = self.api_delay(api_id)
+        self._check_deadline(delay)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return delay
+
+    def _check_deadline(self, delay: float) -> None:
+        left = deadline.remaining()
+        if left is not None and left < delay:
+            # 예약한 슬롯은 버린다 (한도를 넘지 않는 쪽으로 틀린다)
+            raise deadline.DeadlineExceeded(f"Deadline exceeded waiting {delay:.3f}s for a rate-limit slot")
+
+    def acquire(self, api_id: Optional[str] = None) -> float:
+        """Block until a slot for api_id is free; returns the time waited"""
+        delay = self.reserve(api_id)
+        self._check_deadline(delay)
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    async def acquire_async(self, api_id: Optional[str] = None) -> float:
+        """Await until a slot for api_id is free; returns the time waited"""
+        delay = self.reserve(api_id)
+        self._check_deadline(delay)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return delay
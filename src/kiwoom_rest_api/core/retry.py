@@ -0,0 +1,263 @@
+import asyncio
+import random
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+import httpx
+
+from kiwoom_rest_api.config import get_base_url
+from kiwoom_rest_api.core import deadline
+from kiwoom_rest_api.core.base import APIError, RateLimitError
+
+# 주문 TR (주식/신용 매수·매도·정정·취소). 서버 도달 여부가 불확실하면 자동 재시도하지 않는다
+ORDER_API_IDS = frozenset(f"kt{n}" for n in range(10000, 10010))
+
+
+def is_order_api(api_id: Optional[str]) -> bool:
+    """Return True for order TRs (kt10000-kt10009)"""
+    return bool(api_id) and api_id.lower() in ORDER_API_IDS
+
+
+class CircuitOpenError(APIError):
+    """Raised without sending a request while a host's circuit is open"""
+
+    def __init__(self, host: str, retry_after: float):
+        self.host = host
+        self.retry_after = retry_after
+        super().__init__(503, f"Circuit open for {host}; retry after {retry_after:.1f}s")
+
+
+class RetryPolicy:
+    """
+    지수 백오프 + 지터 재시도 정책
+
+    조회 TR(ka*)은 네트워크 오류, 5xx, 요청 한도 초과 시 재시도한다.
+    주문 TR(kt10000~kt10009)은 요청이 서버에 도달하지 않았음이 확실한 경우
+    (연결 실패, 한도 초과 거절)에만 재시도하며, 타임아웃 등 결과를 알 수 없는
+    실패는 중복 주문을 막기 위해 그대로 호출자에게 돌려준다.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        base_delay: float = 0.2,
+        max_delay: float = 5.0,
+        retry_statuses: Tuple[int, ...] = (429, 500, 502, 503, 504),
+        retry_orders: bool = True,
+    ):
+        """
+        Args:
+            max_attempts (int): 최초 요청을 포함한 최대 시도 횟수
+            base_delay (float): 첫 재시도 대기 상한 (초)
+            max_delay (float): 재시도 대기 상한 (초)
+            retry_statuses (Tuple[int, ...]): 재시도할 HTTP 상태 코드
+            retry_orders (bool): 주문 TR 의 안전한 재시도(연결 실패, 한도 초과) 허용 여부
+        """
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be >= 1")
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retry_statuses = tuple(retry_statuses)
+        self.retry_orders = retry_orders
+
+    def backoff(self, attempt: int) -> float:
+        """Full-jitter exponential backoff for the given (1-based) failed attempt"""
+        ceiling = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+        return random.uniform(0, ceiling)
+
+    def should_retry(self, error: BaseException, api_id: Optional[str], attempt: int) -> bool:
+        """Decide whether a failed attempt may be retried"""
+        if attempt >= self.max_attempts or isinstance(error, (CircuitOpenError, deadline.DeadlineExceeded)):
+            return False
+        if is_order_api(api_id):
+            if not self.retry_orders:
+                return False
+            return isinstance(error, (httpx.ConnectError, httpx.ConnectTimeout, RateLimitError))
+        if isinstance(error, RateLimitError):
+            return True
+        if isinstance(error, httpx.TransportError):
+            return True
+        if isinstance(error, APIError):
+            return error.status_code in self.retry_statuses
+        return False
+
+
+def _is_outage(error: BaseException) -> bool:
+    """Failures that suggest the host is unhealthy (not quota or business errors)"""
+    if isinstance(error, httpx.TransportError):
+        return True
+    return (
+        isinstance(error, APIError)
+        and not isinstance(error, (RateLimitError, CircuitOpenError, deadline.DeadlineExceeded))
+        and error.status_code >= 500
+    )
+
+
+class _HostCircuit:
+    def __init__(self):
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self.trial_in_flight = False
+
+
+class CircuitBreaker:
+    """
+    호스트별 서킷 브레이커
+
+    연속 장애가 failure_threshold 에 도달하면 recovery_timeout 동안 요청을 보내지 않고
+    즉시 CircuitOpenError 를 발생시킨다. 이후 한 건의 시험 요청이 성공하면 닫힌다.
+    """
+
+    def __init__(self, failure_threshold: int = 5, recovery_timeout: float = 30.0):
+        """
+        Args:
+            failure_threshold (int): 서킷을 여는 연속 장애 횟수
+            recovery_timeout (float): 서킷이 열린 뒤 시험 요청까지 대기 시간 (초)
+        """
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self._hosts: Dict[str, _HostCircuit] = {}
+        self._lock = threading.Lock()
+
+    def _circuit(self, host: str) -> _HostCircuit:
+        circuit = self._hosts.get(host)
+        if circuit is None:
+            circuit = self._hosts.setdefault(host, _HostCircuit())
+        return circuit
+
+    def state(self, host: str) -> str:
+        """Return 'closed', 'open' or 'half-open' for host"""
+        with self._lock:
+            circuit = self._circuit(host)
+            if circuit.opened_at is None:
+                return "closed"
+            if time.monotonic() - circuit.opened_at >= self.recovery_timeout:
+                return "half-open"
+            return "open"
+
+    def before_request(self, host: str) -> None:
+        """Raise CircuitOpenError if requests to host must fail fast"""
+        with self._lock:
+            circuit = self._circuit(host)
+            if circuit.opened_at is None:
+                return
+            elapsed = time.monotonic() - circuit.opened_at
+            if elapsed < self.recovery_timeout or circuit.trial_in_flight:
+                raise CircuitOpenError(host, max(0.0, self.recovery_timeout - elapsed))
+            circuit.trial_in_flight = True
+
+    def record_success(self, host: str) -> None:
+        with self._lock:
+            circuit = self._circuit(host)
+            circuit.failures = 0
+            circuit.opened_at = None
+            circuit.trial_in_flight = False
+
+    def record_failure(self, host: str) -> None:
+        with self._lock:
+            circuit = self._circuit(host)
+            circuit.failures += 1
+            if circuit.trial_in_flight or circuit.failures >= self.failure_threshold:
+                circuit.opened_at = time.monotonic()
+            circuit.trial_in_flight = False
+
+    def release(self, host: str) -> None:
+        """Forget an unfinished half-open trial (e.g. cancelled) without changing the circuit state"""
+        with self._lock:
+            self._circuit(host).trial_in_flight = False
+
+    def record_result(self, host: str, error: Optional[BaseException]) -> None:
+        """Feed the outcome of a request into the breaker"""
+        if error is None:
+            self.record_success(host)
+        elif isinstance(error, deadline.DeadlineExceeded):
+            # 호출자의 시간 예산 소진은 호스트 상태와 무관하다
+            self.release(host)
+        elif _is_outage(error):
+            self.record_failure(host)
+        else:
+            # 업무 오류/한도 초과는 호스트가 살아 있다는 뜻이다
+            self.record_success(host)
+
+
+def request_host(url: str) -> str:
+    """Return the host part used to key circuit breakers"""
+    return urlsplit(url).netloc or urlsplit(get_base_url()).netloc
+
+
+def _retry_delay(policy: RetryPolicy, attempt: int, error: BaseException) -> float:
+    """Backoff before the next attempt; gives up if the current deadline can't cover it"""
+    delay = policy.backoff(attempt)
+    left = deadline.remaining()
+    if left is not None and left <= delay:
+        raise deadline.DeadlineExceeded(f"Deadline exceeded after {attempt} attempt(s): {error}") from error
+    return delay
+
+
+def call_with_retry(
+    send: Callable[[], Any],
+    api_id: Optional[str],
+    host: str,
+    policy: Optional[RetryPolicy] = None,
+    breaker: Optional[CircuitBreaker] = None,
+) -> Any:
+    """Run send() under the retry policy and circuit breaker (blocking)"""
+    attempt = 0
+    while True:
+        attempt += 1
+        deadline.check()
+        if breaker is not None:
+            breaker.before_request(host)
+        try:
+            result = send()
+        except Exception as e:
+            if breaker is not None:
+                breaker.record_result(host, e)
+            if policy is None or not policy.should_retry(e, api_id, attempt):
+                raise
+            time.sleep(_retry_delay(policy, attempt, e))
+            continue
+        except BaseException:
+            # KeyboardInterrupt 등으로 결과를 모르면 시험 요청 자리만 비운다
+            if breaker is not None:
+                breaker.release(host)
+            raise
+        if breaker is not None:
+            breaker.record_result(host, None)
+        return result
+
+
+async def acall_with_retry(
+    send: Callable[[], Awaitable[Any]],
+    api_id: Optional[str],
+    host: str,
+    policy: Optional[RetryPolicy] = None,
+    breaker: Optional[CircuitBreaker] = None,
+) -> Any:
+    """call_with_retry 의 비동기 버전"""
+    attempt = 0
+    while True:
+        attempt += 1
+        deadline.check()
+        if breaker is not None:
+            breaker.before_request(host)
+        try:
+            result = await send()
+        except Exception as e:
+            if breaker is not None:
+                breaker.record_result(host, e)
+            if policy is None or not policy.should_retry(e, api_id, attempt):
+                raise
+            await asyncio.sleep(_retry_delay(policy, attempt, e))
+            continue
+        except BaseException:
+            # 취소(CancelledError)되면 결과를 모르므로 시험 요청 자리만 비운다
+            if breaker is not None:
+                breaker.release(host)
+            raise
+        if breaker is not None:
+            breaker.record_result(host, None)
+        return result
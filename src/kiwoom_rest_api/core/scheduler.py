@@ -0,0 +1,179 @@
+import asyncio
+import heapq
+import itertools
+import threading
+import time
+from enum import IntEnum
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from kiwoom_rest_api.core import deadline
+from kiwoom_rest_api.core.rate_limit import RateLimiter
+from kiwoom_rest_api.core.retry import is_order_api
+
+
+class Priority(IntEnum):
+    """요청 우선순위 (값이 작을수록 먼저 슬롯을 받는다)"""
+
+    ORDER = 0
+    ACCOUNT = 1
+    QUOTE = 2
+    HISTORY = 3
+
+
+# 리소스 경로별 기본 우선순위
+RESOURCE_PRIORITIES: Dict[str, Priority] = {
+    "/api/dostk/ordr": Priority.ORDER,
+    "/api/dostk/crdordr": Priority.ORDER,
+    "/api/dostk/acnt": Priority.ACCOUNT,
+    "/api/dostk/chart": Priority.HISTORY,
+}
+
+
+def classify(api_id: Optional[str], url: str = "") -> Priority:
+    """Return the default priority for a TR from its api-id and resource path"""
+    if is_order_api(api_id):
+        return Priority.ORDER
+    path = (urlsplit(url).path if "://" in url else url).rstrip("/")
+    for resource, priority in RESOURCE_PRIORITIES.items():
+        if path.endswith(resource):
+            return priority
+    if api_id and api_id.lower().startswith("kt"):
+        return Priority.ACCOUNT
+    return Priority.QUOTE
+
+
+class _AsyncQueue:
+    def __init__(self):
+        self.busy = False
+        self.waiters: List[Tuple[int, int, "asyncio.Future[None]"]] = []
+
+
+class PriorityScheduler:
+    """
+    우선순위 요청 스케줄러
+
+    RateLimiter 앞에서 대기 중인 요청 중 우선순위가 가장 높은 요청에게 다음 슬롯을 준다.
+    한 번에 한 요청만 슬롯을 예약하므로, 조회 요청 수백 개가 기다리는 중에 들어온 주문도
+    바로 다음 슬롯을 받고 대량 조회(HISTORY)는 남는 슬롯만 사용한다.
+    같은 우선순위끼리는 도착 순서를 지킨다. api-id 별 버킷 대기는 차례를 잡기 전에 하므로
+    TR 별 한도에 걸린 요청이 다른 요청의 차례를 막지 않는다.
+
+    Example:
+        >>> scheduler = PriorityScheduler(RateLimiter(rate=5))
+        >>> order = Order(base_url="https://api.kiwoom.com", scheduler=scheduler)
+        >>> chart = Chart(base_url="https://api.kiwoom.com", scheduler=scheduler)
+    """
+
+    def __init__(
+        self,
+        rate_limiter: Optional[RateLimiter] = None,
+        overrides: Optional[Dict[str, Priority]] = None,
+    ):
+        """
+        Args:
+            rate_limiter (RateLimiter, optional): 슬롯을 배정할 레이트 리미터 (기본값: config 의 RATE_LIMIT_*)
+            overrides (Dict[str, Priority], optional): api-id 별 우선순위 지정
+        """
+        self.rate_limiter = rate_limiter if rate_limiter is not None else RateLimiter()
+        self.overrides = dict(overrides or {})
+        self._seq = itertools.count()
+        self._lock = threading.Lock()
+        self._busy = False
+        self._waiters: List[Tuple[int, int, threading.Event]] = []
+        self._async_queues: Dict[int, _AsyncQueue] = {}
+
+    def priority_for(self, api_id: Optional[str], url: str = "") -> Priority:
+        if api_id in self.overrides:
+            return self.overrides[api_id]
+        return classify(api_id, url)
+
+    @property
+    def waiting(self) -> int:
+        return len(self._waiters) + sum(len(q.waiters) for q in self._async_queues.values())
+
+    def acquire(self, api_id: Optional[str] = None, url: str = "", rate_limiter: Optional[RateLimiter] = None) -> float:
+        """Block until this request's turn comes and its rate-limit slot opens; returns the time waited"""
+        started = time.monotonic()
+        limiter = rate_limiter or self.rate_limiter
+        while True:
+            limiter.wait_api(api_id)
+            self._take_turn(api_id, url)
+            try:
+                # 기다리는 사이 같은 TR 이 슬롯을 가져갔으면 차례를 넘기고 다시 기다린다
+                if limiter.api_delay(api_id) > 0:
+                    continue
+                limiter.acquire(api_id)
+            finally:
+                self._handoff()
+            return time.monotonic() - started
+
+    def _take_turn(self, api_id: Optional[str], url: str) -> None:
+        waiter = None
+        with self._lock:
+            if self._busy or self._waiters:
+                waiter = threading.Event()
+                entry = (self.priority_for(api_id, url), next(self._seq), waiter)
+                heapq.heappush(self._waiters, entry)
+            else:
+                self._busy = True
+        if waiter is not None and not waiter.wait(deadline.remaining()):
+            with self._lock:
+                # 차례를 넘겨받기 전에 시간이 다 되었으면 대기열에서 빠진다
+                if not waiter.is_set():
+                    self._waiters.remove(entry)
+                    heapq.heapify(self._waiters)
+                    raise deadline.DeadlineExceeded("Deadline exceeded waiting for a scheduler slot")
+
+    def _handoff(self) -> None:
+        with self._lock:
+            if self._waiters:
+                # 차례를 다음 대기자에게 넘긴다 (busy 유지)
+                heapq.heappop(self._waiters)[2].set()
+            else:
+                self._busy = False
+
+    async def acquire_async(
+        self, api_id: Optional[str] = None, url: str = "", rate_limiter: Optional[RateLimiter] = None
+    ) -> float:
+        """asyncio version of acquire"""
+        started = time.monotonic()
+        limiter = rate_limiter or self.rate_limiter
+        while True:
+            await limiter.wait_api_async(api_id)
+            queue, loop_id = await self._take_turn_async(api_id, url)
+            try:
+                if limiter.api_delay(api_id) > 0:
+                    continue
+                await limiter.acquire_async(api_id)
+            finally:
+                self._handoff_async(queue, loop_id)
+            return time.monotonic() - started
+
+    async def _take_turn_async(self, api_id: Optional[str], url: str) -> Tuple[_AsyncQueue, int]:
+        loop = asyncio.get_running_loop()
+        queue = self._async_queues.get(id(loop))
+        if queue is None:
+            queue = self._async_queues[id(loop)] = _AsyncQueue()
+        if queue.busy or queue.waiters:
+            future = loop.create_future()
+            heapq.heappush(queue.waiters, (self.priority_for(api_id, url), next(self._seq), future))
+            try:
+                await future
+            except asyncio.CancelledError:
+                if future.done() and not future.cancelled():
+                    # 차례를 받은 직후 취소되었으면 다음 대기자에게 넘긴다
+                    self._handoff_async(queue, id(loop))
+                raise
+        else:
+            queue.busy = True
+        return queue, id(loop)
+
+    def _handoff_async(self, queue: _AsyncQueue, loop_id: int) -> None:
+        while queue.waiters:
+            future = heapq.heappop(queue.waiters)[2]
+            if not future.done():
+                future.set_result(None)
+                return
+        queue.busy = False
+        self._async_queues.pop(loop_id, None)
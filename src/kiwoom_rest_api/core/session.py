@@ -0,0 +1,212 @@
+import threading
+from typing import Any, Optional, Set
+
+import httpx
+
+from kiwoom_rest_api.config import (
+    DEFAULT_TIMEOUT,
+    POOL_MAX_CONNECTIONS,
+    POOL_MAX_KEEPALIVE,
+    POOL_KEEPALIVE_EXPIRY,
+)
+
+
+def _pool_limits(
+    max_connections: Optional[int],
+    max_keepalive_connections: Optional[int],
+    keepalive_expiry: Optional[float],
+) -> httpx.Limits:
+    """Build httpx connection pool limits, falling back to config defaults"""
+    return httpx.Limits(
+        max_connections=POOL_MAX_CONNECTIONS if max_connections is None else max_connections,
+        max_keepalive_connections=(
+            POOL_MAX_KEEPALIVE if max_keepalive_connections is None else max_keepalive_connections
+        ),
+        keepalive_expiry=POOL_KEEPALIVE_EXPIRY if keepalive_expiry is None else keepalive_expiry,
+    )
+
+
+class KiwoomSession:
+    """
+    동기 HTTP 세션 (커넥션 풀 유지)
+
+    하나의 httpx.Client 를 재사용하여 요청마다 TCP/TLS 연결을 새로 맺지 않도록 한다.
+    여러 KiwoomBaseAPI 인스턴스(StockInfo, Chart, Account 등)가 공유할 수 있으며
+    httpx.Client 는 스레드 안전하다.
+    """
+
+    def __init__(
+        self,
+        max_connections: Optional[int] = None,
+        max_keepalive_connections: Optional[int] = None,
+        keepalive_expiry: Optional[float] = None,
+        timeout: float = DEFAULT_TIMEOUT,
+        http2: bool = False,
+        transport: Optional[Any] = None,
+    ):
+        """
+        Args:
+            max_connections (int, optional): 최대 동시 연결 수
+            max_keepalive_connections (int, optional): 유지할 keep-alive 연결 수
+            keepalive_expiry (float, optional): 유휴 연결 유지 시간 (초)
+            timeout (float): 기본 요청 타임아웃 (초)
+            http2 (bool): HTTP/2 사용 여부 (h2 패키지 필요)
+            transport: httpx 트랜스포트 (테스트용 MockTransport 등)
+        """
+        self.limits = _pool_limits(max_connections, max_keepalive_connections, keepalive_expiry)
+        self.timeout = timeout
+        self.http2 = http2
+        self._transport = transport
+        self._client: Optional[httpx.Client] = None
+        self._lock = threading.Lock()
+
+    @property
+    def client(self) -> httpx.Client:
+        """Return the underlying httpx.Client, creating it on first use"""
+        if self._client is None or self._client.is_closed:
+            with self._lock:
+                if self._client is None or self._client.is_closed:
+                    self._client = httpx.Client(
+                        limits=self.limits,
+                        timeout=self.timeout,
+                        http2=self.http2,
+                        transport=self._transport,
+                    )
+        return self._client
+
+    def request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        """Send a request over the pooled client"""
+        return self.client.request(method, url, **kwargs)
+
+    @property
+    def is_closed(self) -> bool:
+        return self._client is None or self._client.is_closed
+
+    def close(self) -> None:
+        """Close all pooled connections"""
+        with self._lock:
+            if self._client is not None:
+                self._client.close()
+                self._client = None
+
+    def __enter__(self) -> "KiwoomSession":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+async def _aclose_quietly(client: httpx.AsyncClient) -> None:
+    try:
+        await client.aclose()
+    except RuntimeError:
+        pass
+
+
+async def _close_on_cancel(client: httpx.AsyncClient) -> None:
+    """Wait until cancelled, then close client while its loop is still running"""
+    import asyncio
+
+    try:
+        await asyncio.get_running_loop().create_future()
+    finally:
+        if not client.is_closed:
+            await client.aclose()
+
+
+class AsyncKiwoomSession:
+    """
+    비동기 HTTP 세션 (커넥션 풀 유지)
+
+    httpx.AsyncClient 는 생성된 이벤트 루프에 묶이므로, 루프가 바뀌면
+    (예: asyncio.run 을 여러 번 호출) 새 클라이언트를 만든다. 클라이언트마다 대기 태스크를
+    하나 두어 asyncio.run 이 끝나며 남은 태스크를 취소할 때 그 루프 안에서 클라이언트를 닫고,
+    그렇지 못한 이전 클라이언트는 다음 루프에서 닫는다.
+    """
+
+    def __init__(
+        self,
+        max_connections: Optional[int] = None,
+        max_keepalive_connections: Optional[int] = None,
+        keepalive_expiry: Optional[float] = None,
+        timeout: float = DEFAULT_TIMEOUT,
+        http2: bool = False,
+        transport: Optional[Any] = None,
+    ):
+        """
+        Args:
+            max_connections (int, optional): 최대 동시 연결 수
+            max_keepalive_connections (int, optional): 유지할 keep-alive 연결 수
+            keepalive_expiry (float, optional): 유휴 연결 유지 시간 (초)
+            timeout (float): 기본 요청 타임아웃 (초)
+            http2 (bool): HTTP/2 사용 여부 (h2 패키지 필요)
+            transport: httpx 비동기 트랜스포트 (테스트용 MockTransport 등)
+        """
+        self.limits = _pool_limits(max_connections, max_keepalive_connections, keepalive_expiry)
+        self.timeout = timeout
+        self.http2 = http2
+        self._transport = transport
+        self._client: Optional[httpx.AsyncClient] = None
+        self._loop = None
+        # 닫는 중인 이전 루프의 클라이언트 (태스크가 GC 되지 않도록 참조를 유지한다)
+        self._closing: Set[Any] = set()
+        self._watcher = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Return the httpx.AsyncClient bound to the running event loop"""
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._loop is not loop:
+            if self._client is not None and not self._client.is_closed:
+                self._close_stale(self._client, self._loop, loop)
+            self._client = httpx.AsyncClient(
+                limits=self.limits,
+                timeout=self.timeout,
+                http2=self.http2,
+                transport=self._transport,
+            )
+            self._loop = loop
+            self._watcher = loop.create_task(_close_on_cancel(self._client))
+            # 태스크를 취소하지 않고 닫힌 루프에서는 다음 루프가 정리하므로 경고를 남기지 않는다
+            self._watcher._log_destroy_pending = False
+        return self._client
+
+    def _close_stale(self, client: httpx.AsyncClient, old_loop: Any, loop: Any) -> None:
+        """Close a client left over from a previous event loop"""
+        import asyncio
+
+        if old_loop is not None and old_loop.is_running() and not old_loop.is_closed():
+            # 다른 스레드에서 아직 도는 루프면 그 루프에서 닫는다
+            future = asyncio.run_coroutine_threadsafe(client.aclose(), old_loop)
+        else:
+            # 루프가 이미 끝났으면 현재 루프에서 닫는다. 연결은 닫히지만 끝난 루프에 콜백을
+            # 예약하려다 RuntimeError 가 날 수 있으므로 무시한다
+            future = loop.create_task(_aclose_quietly(client))
+        self._closing.add(future)
+        future.add_done_callback(self._closing.discard)
+
+    async def request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        """Send a request over the pooled client"""
+        return await self.client.request(method, url, **kwargs)
+
+    @property
+    def is_closed(self) -> bool:
+        return self._client is None or self._client.is_closed
+
+    async def aclose(self) -> None:
+        """Close all pooled connections"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._loop = None
+        if self._watcher is not None:
+            self._watcher.cancel()
+            self._watcher = None
+
+    async def __aenter__(self) -> "AsyncKiwoomSession":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
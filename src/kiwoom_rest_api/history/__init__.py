@@ -0,0 +1,39 @@
+import importlib
+from typing import TYPE_CHECKING
+
+# 로컬 차트 이력 (저장소, 변환 도구). 사용할 때만 import 한다 (PEP 562)
+_LAZY_ATTRS = {
+    "BarAggregator": "kiwoom_rest_api.history.aggregate",
+    "aggregate_pages": "kiwoom_rest_api.history.aggregate",
+    "trades_from_real": "kiwoom_rest_api.history.aggregate",
+    "BackfillJournal": "kiwoom_rest_api.history.backfill",
+    "MinuteBackfill": "kiwoom_rest_api.history.backfill",
+    "BarFile": "kiwoom_rest_api.history.columnar",
+    "ColumnarStore": "kiwoom_rest_api.history.columnar",
+    "HistoryStore": "kiwoom_rest_api.history.store",
+    "compare_bars": "kiwoom_rest_api.history.resample",
+    "resample": "kiwoom_rest_api.history.resample",
+}
+
+__all__ = list(_LAZY_ATTRS)
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+if TYPE_CHECKING:
+    from kiwoom_rest_api.history.aggregate import BarAggregator, aggregate_pages, trades_from_real
+    from kiwoom_rest_api.history.backfill import BackfillJournal, MinuteBackfill
+    from kiwoom_rest_api.history.columnar import BarFile, ColumnarStore
+    from kiwoom_rest_api.history.resample import compare_bars, resample
+    from kiwoom_rest_api.history.store import HistoryStore
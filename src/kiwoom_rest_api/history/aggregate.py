@@ -0,0 +1,203 @@
+from datetime import datetime
+from typing import Any, AsyncIterable, AsyncIterator, Dict, Iterable, Iterator, List, NamedTuple, Optional
+
+from kiwoom_rest_api.history.columnar import parse_number
+from kiwoom_rest_api.history.resample import SESSION_OPEN
+
+TICK_LIST_KEY = "stk_tic_chart_qry"
+
+# 실시간 주식체결(0B) 필드
+REAL_TRADE_TYPE = "0B"
+REAL_TIME_FIELD = "20"  # 체결시간 HHMMSS
+REAL_PRICE_FIELD = "10"  # 현재가 (부호는 전일 대비 방향)
+REAL_VOLUME_FIELD = "15"  # 거래량 (부호는 매수/매도 체결 구분)
+
+BAR_KINDS = ("time", "tick", "volume", "value")
+
+
+class Trade(NamedTuple):
+    """One trade: time as YYYYMMDDHHMMSS, price and volume as positive ints"""
+
+    time: int
+    price: int
+    volume: int
+
+
+class Bar(NamedTuple):
+    time: int
+    open: int
+    high: int
+    low: int
+    close: int
+    volume: int
+    value: int
+    ticks: int
+
+
+def trades_from_page(page: Dict[str, Any]) -> Iterator[Trade]:
+    """Yield the trades of a ka10079 tick chart page in page order (newest first)"""
+    for row in page.get(TICK_LIST_KEY) or []:
+        if isinstance(row, dict) and row.get("cntr_tm"):
+            yield Trade(int(row["cntr_tm"]), parse_number(row.get("cur_prc")), parse_number(row.get("trde_qty")))
+
+
+def trades_from_real(
+    message: Any, code: Optional[str] = None, trade_date: Optional[str] = None
+) -> Iterator[Trade]:
+    """
+    Yield the trades in a real-time REAL message (dict or RealTimeData) of type 0B
+
+    Args:
+        message: 웹소켓 REAL 메시지 또는 RealTimeData
+        code (str, optional): 이 종목의 체결만 반환
+        trade_date (str, optional): 체결일자 YYYYMMDD (0B 는 시각만 보내므로 기본값: 오늘)
+    """
+    data = message.get("data") if isinstance(message, dict) else getattr(message, "data", None)
+    day = int(trade_date or datetime.now().strftime("%Y%m%d")) * 1000000
+    for item in data or []:
+        if item.get("type") != REAL_TRADE_TYPE or (code is not None and item.get("item") != code):
+            continue
+        values = item.get("values") or {}
+        if not values.get(REAL_TIME_FIELD):
+            continue
+        yield Trade(
+            day + int(values[REAL_TIME_FIELD]),
+            parse_number(values.get(REAL_PRICE_FIELD)),
+            parse_number(values.get(REAL_VOLUME_FIELD)),
+        )
+
+
+def _seconds_bucket(tm: int, seconds: int, opened: int) -> int:
+    day, hhmmss = divmod(tm, 1000000)
+    of_day = hhmmss // 10000 * 3600 + hhmmss // 100 % 100 * 60 + hhmmss % 100
+    start = opened + (of_day - opened) // seconds * seconds
+    return day * 1000000 + start // 3600 * 10000 + start // 60 % 60 * 100 + start % 60
+
+
+class BarAggregator:
+    """
+    체결 스트림을 봉으로 묶는 스트리밍 집계기
+
+    add() 에 체결을 하나씩 넣으면 완성된 봉을 돌려주며, 진행 중인 봉 하나만 들고 있으므로
+    메모리 사용량이 일정하다.
+
+    - time: size 초 단위 시간봉 (정규장 시작 시각 기준으로 나누며 time 은 구간 시작 시각)
+    - tick: size 체결마다 한 봉
+    - volume / value: 누적 거래량 / 거래대금(가격 x 수량)이 size 이상이 되면 한 봉
+
+    REST 틱 페이지(ka10079)는 최신 체결부터 오므로 descending=True 로 만든다. 이때 봉은 최신 봉부터
+    나오고, tick/volume/value 봉은 가장 최근 체결을 기준으로 나뉜다. 실시간 0B 체결은 기본값
+    (descending=False)으로 넣으며, 이미 지난 시간 구간의 늦은 체결은 진행 중인 봉에 합친다.
+
+    Example:
+        >>> aggregator = BarAggregator("time", 60, descending=True)
+        >>> pages = chart.iter_pages("stock_tick_chart_request_ka10079", "005930", "1", "1")
+        >>> for bar in aggregate_pages(pages, aggregator):
+        ...     handle(bar)
+    """
+
+    def __init__(self, kind: str, size: int, descending: bool = False, session_open: str = SESSION_OPEN):
+        """
+        Args:
+            kind (str): "time", "tick", "volume" 또는 "value"
+            size (int): 봉 크기 (초, 체결 수, 주, 원)
+            descending (bool): 체결이 최신부터 들어오면 True
+            session_open (str): 시간봉 구간 기준 시각 (HHMM)
+        """
+        if kind not in BAR_KINDS:
+            raise ValueError(f"Unknown bar kind: {kind}")
+        if size < 1:
+            raise ValueError("size must be at least 1")
+        self.kind = kind
+        self.size = size
+        self.descending = descending
+        self._opened = int(session_open[:2]) * 3600 + int(session_open[2:4]) * 60
+        self._bar: Optional[List[int]] = None
+        self._key: Optional[int] = None
+
+    @property
+    def current(self) -> Optional[Bar]:
+        """The bar being built, if any"""
+        return Bar(*self._bar) if self._bar is not None else None
+
+    def add(self, trade: Trade) -> List[Bar]:
+        """Feed one trade and return the bars it completed (zero or one)"""
+        completed: List[Bar] = []
+        if self.kind == "time":
+            key = _seconds_bucket(trade.time, self.size, self._opened)
+            if self._bar is not None and (key < self._key if self.descending else key > self._key):
+                completed.append(Bar(*self._bar))
+                self._bar = None
+            if self._bar is None:
+                self._key = key
+                self._start(trade, key)
+            else:
+                self._update(trade)
+            return completed
+
+        if self._bar is None:
+            self._start(trade, trade.time)
+        else:
+            self._update(trade)
+        bar = self._bar
+        measure = {"tick": bar[7], "volume": bar[5], "value": bar[6]}[self.kind]
+        if measure >= self.size:
+            completed.append(Bar(*bar))
+            self._bar = None
+        return completed
+
+    def flush(self) -> Optional[Bar]:
+        """Return and clear the bar in progress (call at end of stream)"""
+        bar, self._bar = self.current, None
+        return bar
+
+    def _start(self, trade: Trade, label: int) -> None:
+        price = trade.price
+        self._bar = [label, price, price, price, price, trade.volume, price * trade.volume, 1]
+
+    def _update(self, trade: Trade) -> None:
+        bar, price = self._bar, trade.price
+        if self.descending:
+            # 최신 체결부터 오므로 새 체결이 시가가 된다
+            bar[1] = price
+            if self.kind != "time":
+                bar[0] = trade.time
+        else:
+            bar[4] = price
+        if price > bar[2]:
+            bar[2] = price
+        if price < bar[3]:
+            bar[3] = price
+        bar[5] += trade.volume
+        bar[6] += price * trade.volume
+        bar[7] += 1
+
+
+def aggregate_trades(trades: Iterable[Trade], aggregator: BarAggregator, flush: bool = True) -> Iterator[Bar]:
+    """Stream bars from trades; the bar in progress is emitted at the end unless flush=False"""
+    for trade in trades:
+        yield from aggregator.add(trade)
+    if flush:
+        bar = aggregator.flush()
+        if bar is not None:
+            yield bar
+
+
+def aggregate_pages(pages: Iterable[Dict[str, Any]], aggregator: BarAggregator, flush: bool = True) -> Iterator[Bar]:
+    """Stream bars from ka10079 pages (e.g. chart.iter_pages(...)) one page at a time"""
+    trades = (trade for page in pages for trade in trades_from_page(page))
+    return aggregate_trades(trades, aggregator, flush)
+
+
+async def aaggregate_pages(
+    pages: AsyncIterable[Dict[str, Any]], aggregator: BarAggregator, flush: bool = True
+) -> AsyncIterator[Bar]:
+    """aggregate_pages 의 비동기 버전 (chart.aiter_pages(...) 사용)"""
+    async for page in pages:
+        for trade in trades_from_page(page):
+            for bar in aggregator.add(trade):
+                yield bar
+    if flush:
+        bar = aggregator.flush()
+        if bar is not None:
+            yield bar
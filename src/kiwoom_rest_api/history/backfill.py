@@ -0,0 +1,265 @@
+import asyncio
+import logging
+import math
+import os
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from kiwoom_rest_api.config import BACKFILL_JOURNAL_PATH, RATE_LIMIT_PER_SECOND
+from kiwoom_rest_api.core import codec
+from kiwoom_rest_api.core.pagination import next_page_key
+from kiwoom_rest_api.history.columnar import ColumnarStore
+
+logger = logging.getLogger(__name__)
+
+MINUTE_API = "stock_minute_chart_request_ka10080"
+MINUTE_LIST_KEY = "stk_min_pole_chart_qry"
+
+
+def _append_line(f, record: Dict[str, Any]) -> None:
+    f.write(codec.dumps(record) + "\n")
+    f.flush()
+    os.fsync(f.fileno())
+
+
+def _drop_partial_line(path: str) -> None:
+    """Truncate a trailing line left half-written by a crash so appends start on a fresh line"""
+    try:
+        with open(path, "rb+") as f:
+            data = f.read()
+            if data and not data.endswith(b"\n"):
+                f.truncate(data.rfind(b"\n") + 1)
+    except FileNotFoundError:
+        pass
+
+
+def _rewrite_lines(path: str, records: Iterable[Dict[str, Any]]) -> None:
+    """Replace path with records atomically (temporary file + os.replace)"""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        for record in records:
+            f.write(codec.dumps(record) + "\n")
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def _unlink_quietly(path: str) -> None:
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+
+def _read_lines(path: str) -> List[Dict[str, Any]]:
+    """Read a JSON-lines file, ignoring a line cut short by a crash"""
+    records = []
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    records.append(codec.loads(line))
+                except (ValueError, TypeError):
+                    continue
+    except FileNotFoundError:
+        pass
+    return records
+
+
+class BackfillJournal:
+    """
+    백필 체크포인트 저널 (JSON lines, 추가 전용)
+
+    (종목코드, tic_scope) 별로 마지막으로 받은 페이지의 연속조회키와 가장 오래된 체결시간,
+    완료 여부를 기록한다. 기록할 때마다 fsync 하므로 프로세스가 중단되어도 마지막 체크포인트부터
+    이어서 받을 수 있다. 열 때 키마다 마지막 기록 하나만 남기도록 저널을 다시 써서(os.replace)
+    페이지마다 쌓인 체크포인트가 실행을 거듭하며 커지지 않게 한다.
+    """
+
+    def __init__(self, path: str = BACKFILL_JOURNAL_PATH):
+        """
+        Args:
+            path (str): 저널 파일 경로
+        """
+        self.path = os.path.expanduser(path)
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self.state: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        for record in _read_lines(self.path):
+            if isinstance(record, dict) and "code" in record and "tic_scope" in record:
+                self.state[(record["code"], record["tic_scope"])] = record
+        # 압축하면서 중단으로 잘린 마지막 줄도 함께 사라진다
+        _rewrite_lines(self.path, self.state.values())
+        self._file = open(self.path, "a", encoding="utf-8")
+
+    def get(self, code: str, tic_scope: str) -> Optional[Dict[str, Any]]:
+        return self.state.get((code, tic_scope))
+
+    def is_done(self, code: str, tic_scope: str) -> bool:
+        return bool((self.get(code, tic_scope) or {}).get("done"))
+
+    def checkpoint(self, code: str, tic_scope: str, next_key: str, oldest: Optional[str], pages: int) -> None:
+        """Record that pages up to next_key have been spooled"""
+        self._write({"code": code, "tic_scope": tic_scope, "next_key": next_key, "oldest": oldest, "pages": pages})
+
+    def complete(self, code: str, tic_scope: str, rows: int) -> None:
+        self._write({"code": code, "tic_scope": tic_scope, "done": True, "rows": rows})
+
+    def _write(self, record: Dict[str, Any]) -> None:
+        _append_line(self._file, record)
+        self.state[(record["code"], record["tic_scope"])] = record
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class MinuteBackfill:
+    """
+    재개 가능한 분봉(ka10080) 병렬 백필
+
+    종목마다 연속조회 페이지를 과거 방향으로 받아 스풀 파일에 쌓고, 페이지마다 저널에
+    체크포인트를 남긴다. 종목이 끝나면 ColumnarStore 에 {tic_scope}m 주기 파일로 원자적으로
+    쓰고(os.replace) 스풀을 지운다. 중단 후 다시 실행하면 완료된 종목은 건너뛰고
+    진행 중이던 종목은 마지막 연속조회키부터 이어서 받는다.
+
+    워커 수는 기본적으로 요청 속도 제한(초당 요청 수)에 맞추며, 실제 요청 속도는 chart 의
+    rate_limiter 가 지킨다. chart 는 use_async=True 여야 한다.
+
+    Example:
+        >>> backfill = MinuteBackfill(api.chart, ColumnarStore(), tic_scope="1")
+        >>> written = await backfill.run(codes)
+    """
+
+    def __init__(
+        self,
+        chart,
+        store: Optional[ColumnarStore] = None,
+        journal_path: str = BACKFILL_JOURNAL_PATH,
+        tic_scope: str = "1",
+        upd_stkpc_tp: str = "1",
+        workers: Optional[int] = None,
+        until: Optional[str] = None,
+    ):
+        """
+        Args:
+            chart (Chart): 요청에 사용할 Chart 인스턴스 (use_async=True)
+            store (ColumnarStore, optional): 완료된 종목을 저장할 저장소 (기본값: ColumnarStore())
+            journal_path (str): 체크포인트 저널 경로. 스풀 파일은 같은 디렉터리의 spool/ 아래에 둔다
+            tic_scope (str): 틱범위 (1, 3, 5, 10, 15, 30, 45, 60 분)
+            upd_stkpc_tp (str): 수정주가구분 (0 or 1)
+            workers (int, optional): 동시에 백필할 종목 수 (기본값: 초당 요청 한도)
+            until (str, optional): 이 체결시간(YYYYMMDD[HHMMSS]) 이전 분봉은 받지 않는다
+        """
+        if not chart.use_async:
+            raise TypeError("MinuteBackfill requires a Chart with use_async=True")
+        self.chart = chart
+        self.store = store if store is not None else ColumnarStore()
+        self.journal_path = os.path.expanduser(journal_path)
+        self.spool_dir = os.path.join(os.path.dirname(os.path.abspath(self.journal_path)), "spool", tic_scope)
+        self.tic_scope = tic_scope
+        self.upd_stkpc_tp = upd_stkpc_tp
+        self.workers = workers if workers is not None else self._default_workers(chart)
+        if self.workers < 1:
+            raise ValueError("workers must be at least 1")
+        self.until = until
+        self.timeframe = f"{tic_scope}m"
+
+    @staticmethod
+    def _default_workers(chart) -> int:
+        limiter = getattr(chart, "rate_limiter", None)
+        bucket = getattr(limiter, "global_bucket", None)
+        rate = bucket.rate if bucket is not None else RATE_LIMIT_PER_SECOND
+        return max(1, math.ceil(rate))
+
+    def _spool_path(self, code: str) -> str:
+        return os.path.join(self.spool_dir, f"{code}.jsonl")
+
+    async def run(self, codes: Iterable[str]) -> Dict[str, int]:
+        """
+        Backfill codes and return {code: rows written} for the symbols finished in this run
+
+        종목별 오류는 저널에 진행 상황을 남긴 채 다른 종목을 계속 처리한 뒤 첫 오류를 다시 발생시킨다.
+        """
+        journal = BackfillJournal(self.journal_path)
+        self._sweep_spool(journal)
+        queue: "asyncio.Queue[str]" = asyncio.Queue()
+        for code in dict.fromkeys(codes):
+            if not journal.is_done(code, self.tic_scope):
+                queue.put_nowait(code)
+        written: Dict[str, int] = {}
+        errors: List[BaseException] = []
+
+        async def worker() -> None:
+            while True:
+                try:
+                    code = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                try:
+                    written[code] = await self._backfill_symbol(code, journal)
+                except Exception as e:
+                    logger.warning("Backfill of %s stopped: %s", code, e)
+                    errors.append(e)
+
+        try:
+            await asyncio.gather(*(worker() for _ in range(min(self.workers, queue.qsize()))))
+        finally:
+            journal.close()
+        if errors:
+            raise errors[0]
+        return written
+
+    def _sweep_spool(self, journal: BackfillJournal) -> None:
+        """Remove spool files left behind by symbols that were completed before a crash"""
+        try:
+            names = os.listdir(self.spool_dir)
+        except FileNotFoundError:
+            return
+        for name in names:
+            code, ext = os.path.splitext(name)
+            if ext == ".jsonl" and journal.is_done(code, self.tic_scope):
+                _unlink_quietly(os.path.join(self.spool_dir, name))
+
+    async def _backfill_symbol(self, code: str, journal: BackfillJournal) -> int:
+        state = journal.get(code, self.tic_scope) or {}
+        spool_path = self._spool_path(code)
+        next_key, pages = state.get("next_key") or "", state.get("pages") or 0
+        if pages and not os.path.exists(spool_path):
+            # 스풀 없이 체크포인트만 남았으면 이어 받을 수 없으므로 처음부터 받는다
+            next_key, pages = "", 0
+        if not pages and os.path.exists(spool_path):
+            os.unlink(spool_path)
+
+        if not pages or next_key:
+            os.makedirs(self.spool_dir, exist_ok=True)
+            _drop_partial_line(spool_path)
+            with open(spool_path, "a", encoding="utf-8") as spool:
+                await self._fetch_pages(code, next_key, pages, spool, journal)
+
+        rows = [row for record in _read_lines(spool_path) for row in record.get("rows", [])]
+        count = self.store.write(code, self.timeframe, rows)
+        journal.complete(code, self.tic_scope, count)
+        # 완료 기록 뒤 스풀을 지우기 전에 중단되면 다음 run() 이 _sweep_spool 로 지운다
+        _unlink_quietly(spool_path)
+        return count
+
+    async def _fetch_pages(self, code: str, next_key: str, pages: int, spool, journal: BackfillJournal) -> None:
+        iterator = self.chart.aiter_pages(MINUTE_API, code, self.tic_scope, self.upd_stkpc_tp, next_key=next_key)
+        try:
+            async for page in iterator:
+                rows, reached_until = self._page_rows(page)
+                oldest = rows[-1].get("cntr_tm") if rows else None
+                # 스풀에 먼저 쓰고 체크포인트를 남긴다. 그 사이 중단되면 같은 페이지를 다시 받고 중복은 저장 시 제거된다
+                _append_line(spool, {"rows": rows})
+                pages += 1
+                key = "" if reached_until else (next_page_key(page) or "")
+                journal.checkpoint(code, self.tic_scope, key, oldest, pages)
+                if not key:
+                    return
+        finally:
+            await iterator.aclose()
+
+    def _page_rows(self, page: Dict[str, Any]) -> Tuple[List[Dict[str, Any]], bool]:
+        rows = [row for row in page.get(MINUTE_LIST_KEY) or [] if isinstance(row, dict) and row.get("cntr_tm")]
+        if self.until is None:
+            return rows, False
+        kept = [row for row in rows if row["cntr_tm"] >= self.until]
+        return kept, len(kept) < len(rows)
@@ -0,0 +1,267 @@
+import array
+import bisect
+import mmap
+import os
+import re
+import struct
+import sys
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from kiwoom_rest_api.config import COLUMNAR_ROOT
+
+# 파일 형식: 헤더(매직, 컬럼 수, 행 수) + 컬럼 표(이름, 형식) + 64 바이트 정렬된 컬럼 블록.
+# 컬럼은 little-endian 8 바이트 고정폭(int64 'q' 또는 float64 'd') 배열을 행 수만큼 연속 저장한다.
+MAGIC = b"KWBARS01"
+_HEADER = struct.Struct("<8sIQ")
+_COLUMN = struct.Struct("<16sc7x")
+_ALIGN = 64
+ITEM_SIZE = 8
+
+# (컬럼 이름, 형식, 차트 응답 필드). 시간 컬럼은 일봉 이상은 dt(YYYYMMDD), 분봉/틱은 cntr_tm(YYYYMMDDHHMMSS)
+BAR_COLUMNS: Tuple[Tuple[str, str, Tuple[str, ...]], ...] = (
+    ("time", "q", ("cntr_tm", "dt")),
+    ("open", "q", ("open_pric",)),
+    ("high", "q", ("high_pric",)),
+    ("low", "q", ("low_pric",)),
+    ("close", "q", ("cur_prc",)),
+    ("volume", "q", ("trde_qty",)),
+    ("value", "q", ("trde_prica",)),
+)
+
+_NAME_PATTERN = re.compile(r"^[A-Za-z0-9_.]+$")
+
+
+def parse_number(value: Any, typecode: str = "q") -> Any:
+    """
+    Parse a chart string field such as "+70000", "-1.25" or "" into int/float
+
+    가격 필드의 +/- 부호는 전일 대비 방향을 나타내므로 int 컬럼은 절댓값으로 저장한다.
+    """
+    text = str(value or "").strip().replace(",", "")
+    if not text:
+        return 0 if typecode == "q" else 0.0
+    if typecode == "q":
+        return abs(int(float(text)) if "." in text else int(text))
+    return float(text)
+
+
+def _row_value(row: Dict[str, Any], fields: Tuple[str, ...], typecode: str) -> Any:
+    for field in fields:
+        if row.get(field) not in (None, ""):
+            return parse_number(row[field], typecode)
+    return parse_number(None, typecode)
+
+
+def rows_to_columns(
+    rows: Iterable[Dict[str, Any]],
+    columns: Sequence[Tuple[str, str, Tuple[str, ...]]] = BAR_COLUMNS,
+) -> Dict[str, array.array]:
+    """
+    Convert bar rows (any order) to columns sorted by time
+
+    봉 데이터 전용이다. 시간이 같은 행은 같은 봉으로 보고 나중 행만 남기므로(연속조회 겹침 처리),
+    같은 초에 여러 건이 있는 틱 차트(ka10079) 행은 넣지 말고 BarAggregator 로 먼저 봉을 만든다.
+    """
+    by_time: Dict[int, Dict[str, Any]] = {}
+    time_fields = columns[0][2]
+    for row in rows:
+        if isinstance(row, dict) and any(row.get(field) for field in time_fields):
+            by_time[_row_value(row, time_fields, "q")] = row
+    times = sorted(by_time)
+    result = {columns[0][0]: array.array("q", times)}
+    for name, typecode, fields in columns[1:]:
+        result[name] = array.array(typecode, (_row_value(by_time[t], fields, typecode) for t in times))
+    return result
+
+
+def _data_offset(ncols: int) -> int:
+    size = _HEADER.size + _COLUMN.size * ncols
+    return (size + _ALIGN - 1) // _ALIGN * _ALIGN
+
+
+def write_columns(path: str, columns: Dict[str, array.array]) -> int:
+    """Atomically write equal-length 8-byte columns to path; returns the row count"""
+    lengths = {len(values) for values in columns.values()}
+    if len(lengths) > 1:
+        raise ValueError("columns must have the same length")
+    nrows = lengths.pop() if lengths else 0
+    header = bytearray(_HEADER.pack(MAGIC, len(columns), nrows))
+    for name, values in columns.items():
+        if values.itemsize != ITEM_SIZE or len(name.encode()) > 16:
+            raise ValueError(f"Unsupported column: {name}")
+        header += _COLUMN.pack(name.encode(), values.typecode.encode())
+    header += b"\0" * (_data_offset(len(columns)) - len(header))
+
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    # 임시 파일에 쓴 뒤 교체하여 읽고 있는 프로세스가 반쯤 쓰인 파일을 보지 않게 한다
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(header)
+            for values in columns.values():
+                if sys.byteorder != "little":
+                    values = array.array(values.typecode, values)
+                    values.byteswap()
+                f.write(values.tobytes())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+    return nrows
+
+
+class BarFile:
+    """
+    메모리 맵 컬럼형 봉 파일 (읽기 전용)
+
+    column() 은 파일을 복사하거나 파싱하지 않는 memoryview 를 돌려주므로 여러 프로세스가
+    같은 페이지 캐시를 공유한다. numpy 가 설치되어 있으면 as_numpy() 로 같은 메모리를
+    ndarray 로 볼 수 있다. 돌려받은 뷰를 모두 해제한 뒤 close() 해야 한다.
+
+    Example:
+        >>> with BarFile(path) as bars:
+        ...     close = bars.slice(20240101, 20241231)["close"]
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path (str): write_columns / ColumnarStore 로 만든 파일 경로
+        """
+        if sys.byteorder != "little":
+            raise ValueError("BarFile requires a little-endian host")
+        self.path = path
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, ncols, self.nrows = _HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC:
+            self._mmap.close()
+            raise ValueError(f"Not a bar file: {path}")
+        self.typecodes: Dict[str, str] = {}
+        self._offsets: Dict[str, int] = {}
+        offset = _data_offset(ncols)
+        for i in range(ncols):
+            name, typecode = _COLUMN.unpack_from(self._mmap, _HEADER.size + _COLUMN.size * i)
+            name = name.rstrip(b"\0").decode()
+            self.typecodes[name] = typecode.decode()
+            self._offsets[name] = offset
+            offset += self.nrows * ITEM_SIZE
+
+    @property
+    def columns(self) -> List[str]:
+        return list(self._offsets)
+
+    def __len__(self) -> int:
+        return self.nrows
+
+    def column(self, name: str) -> memoryview:
+        """Zero-copy view of one column"""
+        start = self._offsets[name]
+        return memoryview(self._mmap)[start:start + self.nrows * ITEM_SIZE].cast(self.typecodes[name])
+
+    __getitem__ = column
+
+    def to_array(self, name: str) -> array.array:
+        """Copy one column into an array.array"""
+        start = self._offsets[name]
+        values = array.array(self.typecodes[name])
+        values.frombytes(self._mmap[start:start + self.nrows * ITEM_SIZE])
+        return values
+
+    def bounds(self, start: Optional[int] = None, end: Optional[int] = None) -> Tuple[int, int]:
+        """Row index range [lo, hi) whose time lies in [start, end]"""
+        times = self.column(BAR_COLUMNS[0][0])
+        try:
+            lo = 0 if start is None else bisect.bisect_left(times, start)
+            hi = self.nrows if end is None else bisect.bisect_right(times, end)
+        finally:
+            times.release()
+        return lo, max(lo, hi)
+
+    def slice(self, start: Optional[int] = None, end: Optional[int] = None) -> Dict[str, memoryview]:
+        """Zero-copy views of every column for rows with start <= time <= end"""
+        lo, hi = self.bounds(start, end)
+        return {name: self.column(name)[lo:hi] for name in self._offsets}
+
+    def as_numpy(self, name: str):
+        """Read-only numpy array sharing the mapped memory (requires numpy)"""
+        try:
+            import numpy
+        except ImportError:  # pragma: no cover - optional dependency
+            raise ImportError("numpy is required for BarFile.as_numpy (pip install kiwoom-rest-api[numpy])")
+        dtype = numpy.dtype("<i8" if self.typecodes[name] == "q" else "<f8")
+        return numpy.frombuffer(self._mmap, dtype=dtype, count=self.nrows, offset=self._offsets[name])
+
+    def close(self) -> None:
+        self._mmap.close()
+
+    def __enter__(self) -> "BarFile":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+class ColumnarStore:
+    """
+    종목/주기별 컬럼형 봉 파일 디렉터리
+
+    {root}/{timeframe}/{code}.bars 파일 하나에 한 종목의 한 주기 봉을 저장한다.
+    분봉/일봉/주봉/월봉/년봉 차트 응답(ka10080~ka10094)의 문자열 필드를 int64 컬럼(time, open,
+    high, low, close, volume, value)으로 바꾸어 시간 오름차순으로 쓴다. 봉 시각마다 한 행이므로
+    틱 데이터는 history.aggregate.BarAggregator 로 봉을 만든 뒤 저장한다.
+
+    Example:
+        >>> bars = ColumnarStore()
+        >>> bars.write("005930", "D", history.daily("005930"))
+        >>> with bars.open("005930", "D") as daily:
+        ...     volume = daily.as_numpy("volume")
+    """
+
+    def __init__(self, root: str = COLUMNAR_ROOT):
+        """
+        Args:
+            root (str): 봉 파일을 저장할 디렉터리
+        """
+        self.root = os.path.expanduser(root)
+
+    def path_for(self, code: str, timeframe: str) -> str:
+        for part in (code, timeframe):
+            if not _NAME_PATTERN.match(part):
+                raise ValueError(f"Invalid code or timeframe: {part!r}")
+        return os.path.join(self.root, timeframe, f"{code}.bars")
+
+    def exists(self, code: str, timeframe: str) -> bool:
+        return os.path.exists(self.path_for(code, timeframe))
+
+    def write(self, code: str, timeframe: str, rows: Iterable[Dict[str, Any]]) -> int:
+        """Replace the file for code/timeframe with rows; returns the row count"""
+        return write_columns(self.path_for(code, timeframe), rows_to_columns(rows))
+
+    def append(self, code: str, timeframe: str, rows: Iterable[Dict[str, Any]]) -> int:
+        """Merge rows into the existing file (same time overwrites) and rewrite it atomically"""
+        path = self.path_for(code, timeframe)
+        new = rows_to_columns(rows)
+        if not os.path.exists(path):
+            return write_columns(path, new)
+        with BarFile(path) as current:
+            merged = {name: current.to_array(name) for name in current.columns}
+        time_name = BAR_COLUMNS[0][0]
+        index = {t: i for i, t in enumerate(merged[time_name])}
+        for i, t in enumerate(new[time_name]):
+            if t in index:
+                for name in merged:
+                    merged[name][index[t]] = new[name][i]
+            else:
+                for name in merged:
+                    merged[name].append(new[name][i])
+        order = sorted(range(len(merged[time_name])), key=merged[time_name].__getitem__)
+        merged = {name: array.array(values.typecode, (values[i] for i in order)) for name, values in merged.items()}
+        return write_columns(path, merged)
+
+    def open(self, code: str, timeframe: str) -> BarFile:
+        return BarFile(self.path_for(code, timeframe))
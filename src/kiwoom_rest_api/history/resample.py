@@ -0,0 +1,217 @@
+import array
+import functools
+import re
+from datetime import date
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Mapping, Sequence, Tuple
+
+from kiwoom_rest_api.history.columnar import BAR_COLUMNS, rows_to_columns
+
+# 주기 문자열: W(주), M(월), Y(년) 은 일봉에서, "{N}m" 은 분봉에서 만든다 (ColumnarStore 의 timeframe 과 같다)
+DAILY_PERIODS = ("W", "M", "Y")
+_MINUTES_PATTERN = re.compile(r"^(\d+)m$")
+
+# 주식 정규장 시작 시각. N분봉은 이 시각부터 N분 단위로 나눈다
+SESSION_OPEN = "0900"
+
+Columns = Mapping[str, Sequence[Any]]
+
+
+def period_key(dt: int, period: str) -> Tuple[int, int]:
+    """
+    Group key of a YYYYMMDD date for W/M/Y bars
+
+    주는 월~일 ISO 주(연말연시에 걸친 주도 한 주)로, 월/년은 달력 기준으로 나눈다.
+    휴장일은 일봉에 없으므로 각 봉은 그 기간의 실제 거래일만으로 만들어진다.
+    """
+    year, month, day = dt // 10000, dt // 100 % 100, dt % 100
+    if period == "W":
+        iso = date(year, month, day).isocalendar()
+        return iso[0], iso[1]
+    if period == "M":
+        return year, month
+    if period == "Y":
+        return year, 0
+    raise ValueError(f"Unknown period: {period}")
+
+
+def minute_bucket(tm: int, minutes: int, session_open: str = SESSION_OPEN) -> int:
+    """Start time (YYYYMMDDHHMM00) of the N-minute bucket holding cntr_tm, aligned to session_open"""
+    day, hhmm = tm // 1000000, tm // 100 % 10000
+    opened = int(session_open[:2]) * 60 + int(session_open[2:4])
+    offset = (hhmm // 100 * 60 + hhmm % 100) - opened
+    start = opened + offset // minutes * minutes
+    return day * 1000000 + (start // 60) * 10000 + (start % 60) * 100
+
+
+@functools.lru_cache(maxsize=None)
+def _numpy():
+    try:
+        import numpy
+    except ImportError:  # pragma: no cover - optional dependency
+        return None
+    return numpy
+
+
+def _period_keys(np, times, period: str):
+    """Vectorised period_key: one int64 key per YYYYMMDD date"""
+    if period == "Y":
+        return times // 10000
+    if period == "M":
+        return times // 100
+    if period == "W":
+        year, month, day = times // 10000, times // 100 % 100, times % 100
+        months = ((year - 1970) * 12 + month - 1).astype("datetime64[M]")
+        days = months.astype("datetime64[D]").astype(np.int64) + day - 1
+        # 1970-01-01 은 목요일이다. 주의 월요일 날짜를 키로 쓴다
+        return days - (days + 3) % 7
+    raise ValueError(f"Unknown period: {period}")
+
+
+def _aggregate_numpy(np, columns: Columns, keys, labels, label: str = "first") -> Dict[str, array.array]:
+    """Vectorised _aggregate: group boundaries from np.diff(keys), OHLCV with ufunc.reduceat"""
+    out = {name: array.array(typecode) for name, typecode, _ in BAR_COLUMNS}
+    n = len(keys)
+    if not n:
+        return out
+    starts = np.concatenate(([0], np.flatnonzero(np.diff(keys)) + 1))
+    ends = np.append(starts[1:], n) - 1
+    lows = np.asarray(columns["low"])
+    # 거래가 없는 봉의 저가 0 은 무시한다. 모두 0 이면 0 으로 남긴다
+    missing = np.iinfo(lows.dtype).max if lows.dtype.kind in "iu" else np.inf
+    low = np.minimum.reduceat(np.where(lows != 0, lows, missing), starts)
+    bars = {
+        "time": np.asarray(labels)[starts if label == "first" else ends],
+        "open": np.asarray(columns["open"])[starts],
+        "high": np.maximum.reduceat(np.asarray(columns["high"]), starts),
+        "low": np.where(low == missing, 0, low),
+        "close": np.asarray(columns["close"])[ends],
+        "volume": np.add.reduceat(np.asarray(columns["volume"]), starts),
+        "value": np.add.reduceat(np.asarray(columns["value"]), starts),
+    }
+    for name, typecode, _ in BAR_COLUMNS:
+        out[name].frombytes(bars[name].astype(typecode).tobytes())
+    return out
+
+
+def _aggregate(columns: Columns, keys: Iterable[Hashable], labels: Sequence[int]) -> Dict[str, array.array]:
+    """One pass over time-sorted columns, merging consecutive rows that share a key"""
+    opens, highs, lows, closes = columns["open"], columns["high"], columns["low"], columns["close"]
+    volumes, values = columns["volume"], columns["value"]
+    out = {name: array.array(typecode) for name, typecode, _ in BAR_COLUMNS}
+    time, open_, high, low, close = out["time"], out["open"], out["high"], out["low"], out["close"]
+    volume, value = out["volume"], out["value"]
+    current = object()
+    for i, key in enumerate(keys):
+        if key != current:
+            current = key
+            time.append(labels[i])
+            open_.append(opens[i])
+            high.append(highs[i])
+            low.append(lows[i])
+            close.append(closes[i])
+            volume.append(volumes[i])
+            value.append(values[i])
+            continue
+        if highs[i] > high[-1]:
+            high[-1] = highs[i]
+        # 거래가 없는 봉의 저가 0 은 무시한다
+        if lows[i] and (lows[i] < low[-1] or not low[-1]):
+            low[-1] = lows[i]
+        close[-1] = closes[i]
+        volume[-1] += volumes[i]
+        value[-1] += values[i]
+    return out
+
+
+def resample_daily(columns: Columns, period: str, label: str = "first") -> Dict[str, array.array]:
+    """
+    Build W/M/Y bars from time-sorted daily columns
+
+    Args:
+        columns: 시간 오름차순 일봉 컬럼 (rows_to_columns 결과, BarFile.slice() 의 memoryview 나 as_numpy() 배열)
+        period (str): "W", "M" 또는 "Y"
+        label (str): 봉의 time 을 기간의 첫 거래일("first") 또는 마지막 거래일("last")로 표시
+    """
+    if label not in ("first", "last"):
+        raise ValueError("label must be 'first' or 'last'")
+    times = columns["time"]
+    np = _numpy()
+    if np is not None:
+        times = np.asarray(times, dtype=np.int64)
+        return _aggregate_numpy(np, columns, _period_keys(np, times, period), times, label)
+    keys = [period_key(t, period) for t in times]
+    if label == "first":
+        return _aggregate(columns, keys, times)
+    # 같은 키의 마지막 거래일을 뒤에서부터 채운다
+    labels = list(times)
+    for i in range(len(labels) - 2, -1, -1):
+        if keys[i] == keys[i + 1]:
+            labels[i] = labels[i + 1]
+    return _aggregate(columns, keys, labels)
+
+
+def resample_minutes(columns: Columns, minutes: int, session_open: str = SESSION_OPEN) -> Dict[str, array.array]:
+    """Build N-minute bars from time-sorted minute columns; bars are labelled with their bucket start"""
+    if minutes < 1:
+        raise ValueError("minutes must be at least 1")
+    np = _numpy()
+    if np is not None:
+        # minute_bucket 의 정수 연산은 배열에도 그대로 적용된다
+        buckets = minute_bucket(np.asarray(columns["time"], dtype=np.int64), minutes, session_open)
+        return _aggregate_numpy(np, columns, buckets, buckets)
+    buckets = [minute_bucket(t, minutes, session_open) for t in columns["time"]]
+    return _aggregate(columns, buckets, buckets)
+
+
+def resample(columns: Columns, timeframe: str, **kwargs: Any) -> Dict[str, array.array]:
+    """
+    Dispatch to resample_daily ("W"/"M"/"Y") or resample_minutes ("{N}m")
+
+    numpy 가 설치되어 있으면 기간 키 계산과 집계를 벡터 연산으로 하고, 없으면 한 번의 파이썬 루프로 한다.
+    두 경로의 결과는 같다.
+    """
+    if timeframe in DAILY_PERIODS:
+        return resample_daily(columns, timeframe, **kwargs)
+    match = _MINUTES_PATTERN.match(timeframe)
+    if match:
+        return resample_minutes(columns, int(match.group(1)), **kwargs)
+    raise ValueError(f"Unknown timeframe: {timeframe}")
+
+
+def _group_key(timeframe: str) -> Callable[[int], Hashable]:
+    if timeframe in DAILY_PERIODS:
+        return lambda t: period_key(t, timeframe)
+    match = _MINUTES_PATTERN.match(timeframe)
+    if match:
+        minutes = int(match.group(1))
+        return lambda t: minute_bucket(t, minutes)
+    raise ValueError(f"Unknown timeframe: {timeframe}")
+
+
+def compare_bars(
+    local: Columns,
+    server_rows: Iterable[Dict[str, Any]],
+    timeframe: str,
+    fields: Sequence[str] = ("open", "high", "low", "close", "volume"),
+) -> List[Tuple[Hashable, str, Any, Any]]:
+    """
+    Compare resampled bars with the server's own bars for the same timeframe
+
+    주/월/년봉(ka10082/ka10083/ka10094) 또는 N분봉(ka10080, tic_scope=N) 응답 행을 받아 같은 기간끼리
+    비교하고 (기간 키, 필드, 로컬 값, 서버 값) 불일치 목록을 돌려준다. 한쪽에만 있는 기간은
+    필드 "missing" 으로 표시한다. 봉의 날짜 표시 방식이 달라도 기간 키로 맞추어 비교한다.
+    """
+    key_of = _group_key(timeframe)
+    server = rows_to_columns(server_rows)
+    server_index = {key_of(t): i for i, t in enumerate(server["time"])}
+    local_index = {key_of(t): i for i, t in enumerate(local["time"])}
+    mismatches: List[Tuple[Hashable, str, Any, Any]] = []
+    for key in sorted(set(server_index) | set(local_index)):
+        i, j = local_index.get(key), server_index.get(key)
+        if i is None or j is None:
+            mismatches.append((key, "missing", i is not None, j is not None))
+            continue
+        for field in fields:
+            if local[field][i] != server[field][j]:
+                mismatches.append((key, field, local[field][i], server[field][j]))
+    return mismatches
@@ -0,0 +1,253 @@
+import os
+import threading
+from datetime import datetime
+from typing import Any, Awaitable, Dict, Iterable, List, Optional, Tuple, Union
+
+from kiwoom_rest_api.config import BULK_CONCURRENCY, HISTORY_DB_PATH
+from kiwoom_rest_api.core import bulk, codec
+
+DAILY_API = "stock_daily_chart_request_ka10081"
+DAILY_LIST_KEY = "stk_dt_pole_chart_qry"
+
+
+def has_adjustment_event(row: Dict[str, Any]) -> bool:
+    """Return True if a bar carries a price-adjustment event (split, rights issue, ...)"""
+    return str(row.get("upd_stkpc_event") or "").strip() not in ("", "0")
+
+
+def collect_new_rows(page: Dict[str, Any], since: Optional[str], rows: List[Dict[str, Any]]) -> bool:
+    """
+    Append the bars of a newest-first chart page dated on or after since
+
+    Returns True once an older (already stored) bar is reached, so pagination can stop.
+    """
+    for row in page.get(DAILY_LIST_KEY) or []:
+        dt = row.get("dt") if isinstance(row, dict) else None
+        if not dt:
+            continue
+        if since is not None and dt < since:
+            return True
+        rows.append(row)
+    return False
+
+
+class HistoryStore:
+    """
+    일봉(ka10081) 로컬 이력 저장소 (SQLite)
+
+    종목코드와 수정주가구분(upd_stkpc_tp)별로 일자(dt)를 키로 일봉을 추가한다.
+    sync_daily() 는 마지막 저장 일자 이후의 페이지만 받고, 이미 저장된 일자에 닿으면
+    연속조회를 멈춘다. 마지막 저장 일봉은 장중에 저장되었을 수 있으므로 다시 받아 덮어쓴다.
+
+    수정주가(upd_stkpc_tp="1") 이력에 새 수정주가 이벤트가 나타나면 과거 가격이 모두
+    바뀌므로 해당 종목은 처음부터 다시 받아 교체한다.
+
+    Example:
+        >>> store = HistoryStore()
+        >>> store.sync_daily(api.chart, codes)
+        >>> bars = store.daily("005930", start="20240101")
+    """
+
+    def __init__(self, path: str = HISTORY_DB_PATH):
+        """
+        Args:
+            path (str): SQLite 파일 경로 (":memory:" 이면 메모리 DB)
+        """
+        import sqlite3  # 이력 저장소를 쓰지 않으면 import 비용을 피한다
+
+        if path != ":memory:":
+            path = os.path.expanduser(path)
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS daily_bars ("
+                " stk_cd TEXT NOT NULL,"
+                " upd_stkpc_tp TEXT NOT NULL,"
+                " dt TEXT NOT NULL,"
+                " bar TEXT NOT NULL,"
+                " PRIMARY KEY (stk_cd, upd_stkpc_tp, dt)) WITHOUT ROWID"
+            )
+
+    def last_date(self, code: str, upd_stkpc_tp: str = "1") -> Optional[str]:
+        """Return the newest stored dt (YYYYMMDD) for code, or None"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT MAX(dt) FROM daily_bars WHERE stk_cd = ? AND upd_stkpc_tp = ?",
+                (code, upd_stkpc_tp),
+            ).fetchone()
+        return row[0]
+
+    def codes(self, upd_stkpc_tp: str = "1") -> List[str]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT DISTINCT stk_cd FROM daily_bars WHERE upd_stkpc_tp = ? ORDER BY stk_cd",
+                (upd_stkpc_tp,),
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def daily(
+        self,
+        code: str,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        upd_stkpc_tp: str = "1",
+    ) -> List[Dict[str, Any]]:
+        """Return stored ka10081 rows for code in ascending dt order (start/end inclusive)"""
+        query = "SELECT bar FROM daily_bars WHERE stk_cd = ? AND upd_stkpc_tp = ?"
+        params: List[Any] = [code, upd_stkpc_tp]
+        if start is not None:
+            query += " AND dt >= ?"
+            params.append(start)
+        if end is not None:
+            query += " AND dt <= ?"
+            params.append(end)
+        with self._lock:
+            rows = self._conn.execute(query + " ORDER BY dt", params).fetchall()
+        return [codec.loads(row[0]) for row in rows]
+
+    def append_daily(
+        self,
+        code: str,
+        rows: Iterable[Dict[str, Any]],
+        upd_stkpc_tp: str = "1",
+        replace: bool = False,
+    ) -> int:
+        """
+        Store ka10081 rows for code; rows with an existing dt overwrite it
+
+        Args:
+            replace (bool): True 면 기존 이력을 지우고 rows 로 교체
+        """
+        values = [(code, upd_stkpc_tp, row["dt"], codec.dumps(row)) for row in rows if row.get("dt")]
+        with self._lock, self._conn:
+            if replace:
+                self._conn.execute(
+                    "DELETE FROM daily_bars WHERE stk_cd = ? AND upd_stkpc_tp = ?", (code, upd_stkpc_tp)
+                )
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO daily_bars (stk_cd, upd_stkpc_tp, dt, bar) VALUES (?, ?, ?, ?)",
+                values,
+            )
+        return len(values)
+
+    # 증분 동기화
+
+    def sync_daily(
+        self,
+        chart,
+        codes: Iterable[str],
+        base_dt: Optional[str] = None,
+        upd_stkpc_tp: str = "1",
+        concurrency: int = BULK_CONCURRENCY,
+    ) -> Union[Dict[str, int], Awaitable[Dict[str, int]]]:
+        """
+        codes 의 일봉을 마지막 저장 일자 이후만 받아 저장
+
+        종목별 요청은 chart 의 map_symbols/amap_symbols 로 동시에 보내고, 저장은 호출한
+        스레드에서 한다. 일부 종목이 실패해도 나머지 종목은 저장한 뒤 첫 오류를 다시 발생시킨다.
+        chart 가 use_async=True 이면 코루틴을 반환한다.
+
+        Args:
+            chart (Chart): 요청에 사용할 Chart 인스턴스
+            codes (Iterable[str]): 종목코드 목록
+            base_dt (str, optional): 기준일자 YYYYMMDD (기본값: 오늘)
+            upd_stkpc_tp (str): 수정주가구분 (0 or 1)
+            concurrency (int): 동시에 동기화할 종목 수
+
+        Returns:
+            Dict[str, int]: 종목코드별 저장한 일봉 수
+        """
+        base_dt = base_dt or datetime.now().strftime("%Y%m%d")
+        since = {code: self.last_date(code, upd_stkpc_tp) for code in dict.fromkeys(codes)}
+        if chart.use_async:
+            return self._sync_daily_async(chart, since, base_dt, upd_stkpc_tp, concurrency)
+
+        def fetch(code: str) -> Tuple[List[Dict[str, Any]], bool]:
+            rows = self._fetch_since(chart, code, since[code], base_dt, upd_stkpc_tp)
+            if self._needs_rebuild(rows, since[code], upd_stkpc_tp):
+                return self._fetch_since(chart, code, None, base_dt, upd_stkpc_tp), True
+            return rows, False
+
+        results = chart.map_symbols(fetch, since, concurrency=concurrency)
+        return self._store_results(results, upd_stkpc_tp)
+
+    async def _sync_daily_async(self, chart, since, base_dt, upd_stkpc_tp, concurrency) -> Dict[str, int]:
+        async def fetch(code: str) -> Tuple[List[Dict[str, Any]], bool]:
+            rows = await self._fetch_since_async(chart, code, since[code], base_dt, upd_stkpc_tp)
+            if self._needs_rebuild(rows, since[code], upd_stkpc_tp):
+                return await self._fetch_since_async(chart, code, None, base_dt, upd_stkpc_tp), True
+            return rows, False
+
+        written: Dict[str, int] = {}
+        error: Optional[BaseException] = None
+        results = chart.amap_symbols(fetch, since, concurrency=concurrency)
+        try:
+            async for item in results:
+                failure = self._store_result(item, upd_stkpc_tp, written)
+                error = error or failure
+        finally:
+            await results.aclose()
+        if error is not None:
+            raise error
+        return written
+
+    def _store_results(self, results: Iterable[bulk.BulkResult], upd_stkpc_tp: str) -> Dict[str, int]:
+        written: Dict[str, int] = {}
+        error: Optional[BaseException] = None
+        for item in results:
+            failure = self._store_result(item, upd_stkpc_tp, written)
+            error = error or failure
+        if error is not None:
+            raise error
+        return written
+
+    def _store_result(self, item: bulk.BulkResult, upd_stkpc_tp: str, written: Dict[str, int]) -> Optional[BaseException]:
+        if item.error is not None:
+            return item.error
+        rows, rebuild = item.result
+        written[item.code] = self.append_daily(item.code, rows, upd_stkpc_tp, replace=rebuild)
+        return None
+
+    @staticmethod
+    def _needs_rebuild(rows: List[Dict[str, Any]], since: Optional[str], upd_stkpc_tp: str) -> bool:
+        # 수정주가 이력은 새 수정 이벤트가 생기면 과거 가격이 모두 바뀐다
+        if since is None or upd_stkpc_tp != "1":
+            return False
+        return any(row["dt"] > since and has_adjustment_event(row) for row in rows)
+
+    @staticmethod
+    def _fetch_since(chart, code, since, base_dt, upd_stkpc_tp) -> List[Dict[str, Any]]:
+        rows: List[Dict[str, Any]] = []
+        pages = chart.iter_pages(DAILY_API, code, base_dt, upd_stkpc_tp)
+        try:
+            for page in pages:
+                if collect_new_rows(page, since, rows):
+                    break
+        finally:
+            pages.close()
+        return rows
+
+    @staticmethod
+    async def _fetch_since_async(chart, code, since, base_dt, upd_stkpc_tp) -> List[Dict[str, Any]]:
+        rows: List[Dict[str, Any]] = []
+        pages = chart.aiter_pages(DAILY_API, code, base_dt, upd_stkpc_tp)
+        try:
+            async for page in pages:
+                if collect_new_rows(page, since, rows):
+                    break
+        finally:
+            await pages.aclose()
+        return rows
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self) -> "HistoryStore":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
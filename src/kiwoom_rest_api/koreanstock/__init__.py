@@ -0,0 +1,52 @@
+import importlib
+from typing import TYPE_CHECKING
+
+# 클래스 이름 -> 모듈. 수천 줄짜리 모듈을 실제로 사용할 때만 import 한다 (PEP 562)
+_LAZY_ATTRS = {
+    "Account": "kiwoom_rest_api.koreanstock.account",
+    "Chart": "kiwoom_rest_api.koreanstock.chart",
+    "CreditOrder": "kiwoom_rest_api.koreanstock.credit_order",
+    "ELW": "kiwoom_rest_api.koreanstock.elw",
+    "ETF": "kiwoom_rest_api.koreanstock.etf",
+    "ForeignInstitution": "kiwoom_rest_api.koreanstock.foreign_institution",
+    "MarketCondition": "kiwoom_rest_api.koreanstock.market_condition",
+    "Order": "kiwoom_rest_api.koreanstock.order",
+    "QuoteBatcher": "kiwoom_rest_api.koreanstock.quote_batch",
+    "RankInfo": "kiwoom_rest_api.koreanstock.rank_info",
+    "Sector": "kiwoom_rest_api.koreanstock.sector",
+    "SecuritiesLendingAndBorrowing": "kiwoom_rest_api.koreanstock.slb",
+    "StockInfo": "kiwoom_rest_api.koreanstock.stockinfo",
+    "Theme": "kiwoom_rest_api.koreanstock.theme",
+}
+
+__all__ = list(_LAZY_ATTRS)
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+if TYPE_CHECKING:
+    from kiwoom_rest_api.koreanstock.account import Account
+    from kiwoom_rest_api.koreanstock.chart import Chart
+    from kiwoom_rest_api.koreanstock.credit_order import CreditOrder
+    from kiwoom_rest_api.koreanstock.elw import ELW
+    from kiwoom_rest_api.koreanstock.etf import ETF
+    from kiwoom_rest_api.koreanstock.foreign_institution import ForeignInstitution
+    from kiwoom_rest_api.koreanstock.market_condition import MarketCondition
+    from kiwoom_rest_api.koreanstock.order import Order
+    from kiwoom_rest_api.koreanstock.quote_batch import QuoteBatcher
+    from kiwoom_rest_api.koreanstock.rank_info import RankInfo
+    from kiwoom_rest_api.koreanstock.sector import Sector
+    from kiwoom_rest_api.koreanstock.slb import SecuritiesLendingAndBorrowing
+    from kiwoom_rest_api.koreanstock.stockinfo import StockInfo
+    from kiwoom_rest_api.koreanstock.theme import Theme
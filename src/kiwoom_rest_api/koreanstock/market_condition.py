@@ -9,7 +9,8 @@ class MarketCondition(KiwoomBaseAPI):
         base_url: str = None, 
         token_manager=None, 
         use_async: bool = False,
-        resource_url: str = "/api/dostk/mrkcond"
+        resource_url: str = "/api/dostk/mrkcond",
+        **kwargs
     ):
         """
         MarketCondition 클래스 초기화
@@ -18,12 +19,14 @@ class MarketCondition(KiwoomBaseAPI):
             base_url (str, optional): API 기본 URL
             token_manager: 토큰 관리자 객체
             use_async (bool): 비동기 클라이언트 사용 여부 (기본값: False)
+            **kwargs: KiwoomBaseAPI 공통 옵션 (session 등)
         """
         super().__init__(
             base_url=base_url,
             token_manager=token_manager,
             use_async=use_async,
-            resource_url=resource_url
+            resource_url=resource_url,
+            **kwargs
         )
         
     def stock_quote_request_ka10004(
@@ -0,0 +1,197 @@
+import asyncio
+import contextvars
+import threading
+import time
+from concurrent.futures import Future, TimeoutError as FutureTimeout
+from typing import Any, Awaitable, Dict, Iterable, List, Optional, Union
+
+from kiwoom_rest_api.config import BULK_CONCURRENCY, WATCHLIST_MAX_CODES, QUOTE_BATCH_WINDOW
+from kiwoom_rest_api.core import bulk, deadline
+from kiwoom_rest_api.koreanstock.stockinfo import StockInfo
+
+WATCHLIST_LIST_KEY = "atn_stk_infr"
+
+
+def chunk_codes(codes: Iterable[str], size: int) -> List[List[str]]:
+    """Drop blanks and duplicates (keeping order) and split codes into chunks of size"""
+    if size < 1:
+        raise ValueError("size must be at least 1")
+    unique = list(dict.fromkeys(code.strip() for code in codes if code and code.strip()))
+    return [unique[i:i + size] for i in range(0, len(unique), size)]
+
+
+def index_quotes(response: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """Index the atn_stk_infr rows of a ka10095 response by stk_cd"""
+    return {
+        row["stk_cd"]: row
+        for row in response.get(WATCHLIST_LIST_KEY) or []
+        if isinstance(row, dict) and row.get("stk_cd")
+    }
+
+
+class _PendingBatch:
+    def __init__(self, future):
+        self.codes: List[str] = []
+        self.future = future
+        self.closed = False
+        # 가장 이른 deadline 을 가진 호출자의 컨텍스트. 배치 요청은 이 컨텍스트에서 보낸다
+        self.context: Optional[contextvars.Context] = None
+        self.expires_at: Optional[float] = None
+
+    def join(self, code: str) -> None:
+        self.codes.append(code)
+        left = deadline.remaining()
+        if left is None:
+            return
+        expires_at = time.monotonic() + left
+        if self.expires_at is None or expires_at < self.expires_at:
+            self.expires_at = expires_at
+            self.context = contextvars.copy_context()
+
+    def run(self, func, *args):
+        if self.context is None:
+            return func(*args)
+        return self.context.run(func, *args)
+
+
+class QuoteBatcher:
+    """
+    관심종목정보(ka10095) 일괄 시세 조회
+
+    종목코드 목록을 요청당 최대 종목 수로 나누어 '|' 로 이어 붙인 ka10095 요청을 동시에 보내고,
+    응답의 atn_stk_infr 리스트를 종목코드 기준 dict 로 돌려준다. 1,000 종목 시세를
+    ka10001 1,000 번 대신 ka10095 수십 번으로 조회할 수 있다.
+
+    get_quote(code) 는 window 초 안에 들어온 개별 호출을 모아 한 번의 요청으로 보낸다.
+    StockInfo 가 use_async=True 이면 get_quotes / get_quote 는 코루틴을 반환한다.
+
+    Example:
+        >>> batcher = QuoteBatcher(api.stockinfo)
+        >>> quotes = batcher.get_quotes(codes)
+        >>> quotes["005930"]["cur_prc"]
+    """
+
+    def __init__(
+        self,
+        stock_info: StockInfo,
+        chunk_size: int = WATCHLIST_MAX_CODES,
+        concurrency: int = BULK_CONCURRENCY,
+        window: float = QUOTE_BATCH_WINDOW,
+    ):
+        """
+        Args:
+            stock_info (StockInfo): 요청에 사용할 StockInfo 인스턴스
+            chunk_size (int): ka10095 요청 하나에 담을 최대 종목 수
+            concurrency (int): 동시에 보낼 ka10095 요청 수
+            window (float): get_quote 호출을 모으는 시간 (초)
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        self.stock_info = stock_info
+        self.chunk_size = chunk_size
+        self.concurrency = concurrency
+        self.window = window
+        self._lock = threading.Lock()
+        self._batch: Optional[_PendingBatch] = None
+        self._async_batch: Optional[_PendingBatch] = None
+        self._flush_tasks = set()
+
+    def _fetch_chunk(self, joined: str):
+        return self.stock_info.fetch_all(
+            "watchlist_stock_information_request_ka10095", joined, list_keys=[WATCHLIST_LIST_KEY]
+        )
+
+    def get_quotes(
+        self, codes: Iterable[str]
+    ) -> Union[Dict[str, Dict[str, Any]], Awaitable[Dict[str, Dict[str, Any]]]]:
+        """Return {stk_cd: row} for all codes; codes the server did not return are absent"""
+        joined = ["|".join(chunk) for chunk in chunk_codes(codes, self.chunk_size)]
+        if self.stock_info.use_async:
+            return self._get_quotes_async(joined)
+        quotes: Dict[str, Dict[str, Any]] = {}
+        for item in bulk.map_symbols(self._fetch_chunk, joined, max_workers=self.concurrency):
+            if item.error is not None:
+                raise item.error
+            quotes.update(index_quotes(item.result))
+        return quotes
+
+    async def _get_quotes_async(self, joined: List[str]) -> Dict[str, Dict[str, Any]]:
+        quotes: Dict[str, Dict[str, Any]] = {}
+        results = bulk.amap_symbols(self._fetch_chunk, joined, concurrency=self.concurrency)
+        try:
+            async for item in results:
+                if item.error is not None:
+                    raise item.error
+                quotes.update(index_quotes(item.result))
+        finally:
+            await results.aclose()
+        return quotes
+
+    def get_quote(self, code: str) -> Union[Optional[Dict[str, Any]], Awaitable[Optional[Dict[str, Any]]]]:
+        """Return the ka10095 row for one code, batched with other calls in the same window"""
+        if self.stock_info.use_async:
+            return self._get_quote_async(code)
+
+        flush = None
+        with self._lock:
+            batch = self._batch
+            if batch is None:
+                batch = self._batch = _PendingBatch(Future())
+                timer = threading.Timer(self.window, self._flush, (batch,))
+                timer.daemon = True
+                timer.start()
+            batch.join(code)
+            if len(batch.codes) >= self.chunk_size:
+                # 가득 찬 배치는 기다리지 않고 호출한 스레드에서 바로 보낸다
+                flush = batch
+        if flush is not None:
+            self._flush(flush)
+        try:
+            return batch.future.result(deadline.remaining()).get(code)
+        except FutureTimeout:
+            if batch.future.done():
+                raise
+            raise deadline.DeadlineExceeded("Deadline exceeded waiting for a batched quote") from None
+
+    def _flush(self, batch: _PendingBatch) -> None:
+        with self._lock:
+            if batch.closed:
+                return
+            batch.closed = True
+            if self._batch is batch:
+                self._batch = None
+        try:
+            batch.future.set_result(batch.run(self.get_quotes, batch.codes))
+        except Exception as e:
+            batch.future.set_exception(e)
+
+    async def _get_quote_async(self, code: str) -> Optional[Dict[str, Any]]:
+        loop = asyncio.get_running_loop()
+        batch = self._async_batch
+        if batch is None or batch.future.get_loop() is not loop:
+            batch = self._async_batch = _PendingBatch(loop.create_future())
+            loop.call_later(self.window, self._flush_async, batch)
+        batch.join(code)
+        if len(batch.codes) >= self.chunk_size:
+            self._flush_async(batch)
+        return (await deadline.wait_for(asyncio.shield(batch.future))).get(code)
+
+    def _flush_async(self, batch: _PendingBatch) -> None:
+        if batch.closed:
+            return
+        batch.closed = True
+        if self._async_batch is batch:
+            self._async_batch = None
+
+        async def run():
+            try:
+                batch.future.set_result(await self._get_quotes_async(
+                    ["|".join(chunk) for chunk in chunk_codes(batch.codes, self.chunk_size)]
+                ))
+            except Exception as e:
+                batch.future.set_exception(e)
+
+        # 태스크가 끝날 때까지 참조를 유지한다
+        task = batch.run(asyncio.ensure_future, run())
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
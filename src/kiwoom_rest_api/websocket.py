@@ -1,11 +1,11 @@
 import asyncio
-import json
 import logging
 from typing import Any, Callable, Dict, List, Optional, Union
 import websockets
 from websockets.exceptions import ConnectionClosed, WebSocketException
 
 from .config import get_ws_url, WS_TIMEOUT
+from .core import codec
 
 logger = logging.getLogger(__name__)
 
@@ -113,7 +113,7 @@ class WebSocketClient:
         
         try:
             if isinstance(message, dict):
-                message_str = json.dumps(message)
+                message_str = codec.dumps(message)
             else:
                 message_str = message
                 
@@ -173,7 +173,7 @@ class WebSocketClient:
     async def _handle_message(self, message: str) -> None:
         """메시지 처리"""
         try:
-            data = json.loads(message)
+            data = codec.loads(message)
             realtime_data = RealTimeData(data)
             
             trnm = realtime_data.trnm
@@ -207,7 +207,7 @@ class WebSocketClient:
                 if self.on_data:
                     await self.on_data(realtime_data)
                     
-        except json.JSONDecodeError as e:
+        except codec.JSONDecodeError as e:
             logger.error(f"JSON 파싱 오류: {e}")
             if self.on_error:
                 await self.on_error(e)
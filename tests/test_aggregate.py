@@ -0,0 +1,126 @@
+"""
+체결 -> 봉 스트리밍 집계 테스트
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from kiwoom_rest_api.core.session import AsyncKiwoomSession, KiwoomSession
+from kiwoom_rest_api.history.aggregate import (
+    Bar,
+    BarAggregator,
+    Trade,
+    aaggregate_pages,
+    aggregate_pages,
+    aggregate_trades,
+    trades_from_real,
+)
+from kiwoom_rest_api.koreanstock.chart import Chart
+
+# 09:00:00 부터 20초 간격 체결 9건 (가격 100~108, 수량 1~9)
+TRADES = [Trade(20250102090000 + (i * 20 // 60) * 100 + i * 20 % 60, 100 + i, i + 1) for i in range(9)]
+
+
+def tick_pages(page_size=4):
+    """ka10079 응답처럼 최신 체결부터 나눈 페이지"""
+    rows = [
+        {"cntr_tm": str(t.time), "cur_prc": f"+{t.price}", "trde_qty": str(t.volume)}
+        for t in reversed(TRADES)
+    ]
+    return [{"stk_tic_chart_qry": rows[i:i + page_size]} for i in range(0, len(rows), page_size)]
+
+
+class TestBarAggregator:
+    """BarAggregator 테스트"""
+
+    def test_time_bars(self):
+        bars = list(aggregate_trades(TRADES, BarAggregator("time", 60)))
+        assert bars == [
+            Bar(20250102090000, 100, 102, 100, 102, 6, 608, 3),
+            Bar(20250102090100, 103, 105, 103, 105, 15, 1562, 3),
+            Bar(20250102090200, 106, 108, 106, 108, 24, 2570, 3),
+        ]
+
+    def test_descending_pages_match_ascending(self):
+        ascending = list(aggregate_trades(TRADES, BarAggregator("time", 60)))
+        descending = list(aggregate_pages(tick_pages(), BarAggregator("time", 60, descending=True)))
+        assert descending == list(reversed(ascending))
+
+    def test_tick_and_volume_bars(self):
+        ticks = list(aggregate_trades(TRADES, BarAggregator("tick", 4)))
+        assert [bar.ticks for bar in ticks] == [4, 4, 1]
+        assert ticks[0] == Bar(20250102090000, 100, 103, 100, 103, 10, 1020, 4)
+
+        volume = list(aggregate_trades(TRADES, BarAggregator("volume", 10)))
+        assert [bar.volume for bar in volume] == [10, 11, 15, 9]
+        value = list(aggregate_trades(TRADES, BarAggregator("value", 1000), flush=False))
+        assert all(bar.value >= 1000 for bar in value)
+
+    def test_descending_tick_bars_label_oldest_trade(self):
+        bars = list(aggregate_pages(tick_pages(), BarAggregator("tick", 4, descending=True)))
+        assert [bar.ticks for bar in bars] == [4, 4, 1]
+        assert bars[0] == Bar(20250102090140, 105, 108, 105, 108, 30, 3200, 4)
+        assert bars[-1].time == 20250102090000
+
+    def test_late_trade_joins_current_bar(self):
+        aggregator = BarAggregator("time", 60)
+        assert aggregator.add(Trade(20250102090105, 100, 1)) == []
+        assert aggregator.add(Trade(20250102090059, 99, 1)) == []
+        assert aggregator.current.low == 99
+        assert aggregator.add(Trade(20250102090200, 101, 1))[0].ticks == 2
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError):
+            BarAggregator("renko", 10)
+        with pytest.raises(ValueError):
+            BarAggregator("time", 0)
+
+
+class TestSources:
+    """REST 페이지, 실시간 0B 입력 테스트"""
+
+    def test_trades_from_real(self):
+        message = {
+            "trnm": "REAL",
+            "data": [
+                {"type": "0B", "item": "005930", "values": {"20": "090001", "10": "-70000", "15": "-5"}},
+                {"type": "0C", "item": "005930", "values": {"27": "70100"}},
+                {"type": "0B", "item": "000660", "values": {"20": "090002", "10": "+180000", "15": "+1"}},
+            ],
+        }
+        assert list(trades_from_real(message, code="005930", trade_date="20250102")) == [
+            Trade(20250102090001, 70000, 5)
+        ]
+        assert len(list(trades_from_real(message, trade_date="20250102"))) == 2
+
+    def test_chart_iter_pages(self):
+        pages = tick_pages()
+
+        def handler(request):
+            index = int(request.headers.get("next-key") or 0)
+            more = index + 1 < len(pages)
+            headers = {
+                "cont-yn": "Y" if more else "N",
+                "next-key": str(index + 1) if more else "",
+                "access-control-expose-headers": "cont-yn,next-key",
+            }
+            return httpx.Response(200, json=dict(pages[index], return_code=0), headers=headers)
+
+        chart = Chart(base_url="https://api.kiwoom.com", session=KiwoomSession(transport=httpx.MockTransport(handler)))
+        iterator = chart.iter_pages("stock_tick_chart_request_ka10079", "005930", "1", "1")
+        bars = list(aggregate_pages(iterator, BarAggregator("time", 60, descending=True)))
+        assert [bar.ticks for bar in bars] == [3, 3, 3]
+
+        async_chart = Chart(
+            base_url="https://api.kiwoom.com",
+            session=AsyncKiwoomSession(transport=httpx.MockTransport(handler)),
+            use_async=True,
+        )
+
+        async def run():
+            iterator = async_chart.aiter_pages("stock_tick_chart_request_ka10079", "005930", "1", "1")
+            return [bar async for bar in aaggregate_pages(iterator, BarAggregator("time", 60, descending=True))]
+
+        assert asyncio.run(run()) == bars
@@ -0,0 +1,111 @@
+"""
+KiwoomRestAPI 통합 클라이언트 테스트
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from kiwoom_rest_api import KiwoomRestAPI, AsyncKiwoomRestAPI
+from kiwoom_rest_api.core.session import KiwoomSession, AsyncKiwoomSession
+from kiwoom_rest_api.koreanstock.order import Order
+from kiwoom_rest_api.koreanstock.stockinfo import StockInfo
+
+
+class FakeTokenManager:
+    def __init__(self):
+        self.stopped = False
+
+    def get_token(self):
+        return "test-token"
+
+    async def get_token_async(self):
+        return "test-token"
+
+    def stop_background_refresh(self):
+        self.stopped = True
+
+
+def recording_handler(seen):
+    def handler(request):
+        seen.append((request.url.path, request.headers["api-id"], request.headers["authorization"]))
+        return httpx.Response(200, json={"return_code": 0})
+    return handler
+
+
+class TestKiwoomRestAPI:
+    """동기 통합 클라이언트 테스트"""
+
+    def test_sub_clients_are_lazy_and_shared(self):
+        api = KiwoomRestAPI(base_url="https://api.kiwoom.com", token_manager=FakeTokenManager())
+        assert "stockinfo" not in vars(api)
+        assert isinstance(api.stockinfo, StockInfo)
+        assert api.stockinfo is api.stockinfo
+        assert isinstance(api.order, Order)
+        for client in (api.stockinfo, api.order, api.chart, api.account):
+            assert client.session is api.session
+            assert client.rate_limiter is api.rate_limiter
+            assert client.cache is api.cache
+            assert client.token_manager is api.token_manager
+            assert client.base_url == "https://api.kiwoom.com"
+            assert client.use_async is False
+
+    def test_options_forwarded(self):
+        marker = object()
+        api = KiwoomRestAPI(token_manager=FakeTokenManager(), coalescer=marker)
+        assert api.rank_info.coalescer is marker
+
+    def test_requests_share_session(self):
+        seen = []
+        session = KiwoomSession(transport=httpx.MockTransport(recording_handler(seen)))
+        with KiwoomRestAPI(
+            base_url="https://api.kiwoom.com", token_manager=FakeTokenManager(), session=session
+        ) as api:
+            api.stockinfo.basic_stock_information_request_ka10001("005930")
+            api.chart.stock_daily_chart_request_ka10081("005930", "20250101", "1")
+        assert seen == [
+            ("/api/dostk/stkinfo", "ka10001", "Bearer test-token"),
+            ("/api/dostk/chart", "ka10081", "Bearer test-token"),
+        ]
+        # 외부에서 전달한 세션은 닫지 않는다
+        assert api.token_manager.stopped
+        assert not session.is_closed
+
+    def test_close_owned_session(self):
+        api = KiwoomRestAPI(token_manager=FakeTokenManager())
+        api.session.client
+        api.close()
+        assert api.session.is_closed
+
+
+class TestAsyncKiwoomRestAPI:
+    """비동기 통합 클라이언트 테스트"""
+
+    def test_async_requests(self):
+        seen = []
+        session = AsyncKiwoomSession(transport=httpx.MockTransport(recording_handler(seen)))
+
+        async def run():
+            async with AsyncKiwoomRestAPI(
+                base_url="https://api.kiwoom.com", token_manager=FakeTokenManager(), session=session
+            ) as api:
+                assert api.stockinfo.use_async is True
+                assert api.stockinfo.session is session
+                await asyncio.gather(
+                    api.stockinfo.basic_stock_information_request_ka10001("005930"),
+                    api.order.stock_buy_order_request_kt10000(
+                        dmst_stex_tp="KRX", stk_cd="005930", ord_qty="1", trde_tp="3"
+                    ),
+                )
+
+        asyncio.run(run())
+        assert sorted(seen) == [
+            ("/api/dostk/ordr", "kt10000", "Bearer test-token"),
+            ("/api/dostk/stkinfo", "ka10001", "Bearer test-token"),
+        ]
+
+    def test_sync_close_rejected(self):
+        api = AsyncKiwoomRestAPI(token_manager=FakeTokenManager())
+        with pytest.raises(TypeError):
+            api.close()
@@ -0,0 +1,145 @@
+"""
+재개 가능한 분봉(ka10080) 백필 테스트
+"""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from kiwoom_rest_api.core.base import APIError
+from kiwoom_rest_api.core.session import AsyncKiwoomSession, KiwoomSession
+from kiwoom_rest_api.history.backfill import BackfillJournal, MinuteBackfill
+from kiwoom_rest_api.history.columnar import ColumnarStore
+from kiwoom_rest_api.koreanstock.chart import Chart
+
+PAGE_SIZE = 4
+
+
+class MinuteServer:
+    """ka10080 연속조회를 흉내 내는 서버 (최신 분봉부터 PAGE_SIZE 개씩)"""
+
+    def __init__(self, minutes=10):
+        self.times = [f"2025010209{m:02d}00" for m in reversed(range(minutes))]
+        self.requests = []
+        self.fail_at = set()
+
+    async def handler(self, request):
+        code = json.loads(request.content)["stk_cd"]
+        offset = int(request.headers.get("next-key") or 0)
+        self.requests.append((code, offset))
+        if (code, offset) in self.fail_at:
+            self.fail_at.discard((code, offset))
+            return httpx.Response(500, json={"return_code": 1, "return_msg": "error"})
+        rows = [
+            {"cntr_tm": tm, "cur_prc": f"-{70000 + i}", "open_pric": "70000", "high_pric": "70100",
+             "low_pric": "69900", "trde_qty": "10"}
+            for i, tm in enumerate(self.times[offset:offset + PAGE_SIZE])
+        ]
+        more = offset + PAGE_SIZE < len(self.times)
+        headers = {
+            "cont-yn": "Y" if more else "N",
+            "next-key": str(offset + PAGE_SIZE) if more else "",
+            "access-control-expose-headers": "cont-yn,next-key",
+        }
+        return httpx.Response(200, json={"return_code": 0, "stk_min_pole_chart_qry": rows}, headers=headers)
+
+
+def make_backfill(server, tmp_path, **kwargs):
+    chart = Chart(
+        base_url="https://api.kiwoom.com",
+        session=AsyncKiwoomSession(transport=httpx.MockTransport(server.handler)),
+        use_async=True,
+    )
+    store = ColumnarStore(str(tmp_path / "bars"))
+    return MinuteBackfill(chart, store, journal_path=str(tmp_path / "journal.jsonl"), **kwargs), store
+
+
+class TestMinuteBackfill:
+    """MinuteBackfill 테스트"""
+
+    def test_backfill_writes_symbols(self, tmp_path):
+        server = MinuteServer(minutes=10)
+        backfill, store = make_backfill(server, tmp_path, workers=2)
+        assert asyncio.run(backfill.run(["005930", "000660"])) == {"005930": 10, "000660": 10}
+        with store.open("005930", "1m") as bars:
+            times = bars.to_array("time")
+        assert list(times) == sorted(int(tm) for tm in server.times)
+        assert not (tmp_path / "spool" / "1" / "005930.jsonl").exists()
+
+        # 완료된 종목은 다시 요청하지 않는다
+        server.requests.clear()
+        assert asyncio.run(backfill.run(["005930", "000660"])) == {}
+        assert server.requests == []
+
+    def test_resume_from_checkpoint(self, tmp_path):
+        server = MinuteServer(minutes=10)
+        server.fail_at.add(("005930", 8))
+        backfill, store = make_backfill(server, tmp_path, workers=1)
+        with pytest.raises(APIError):
+            asyncio.run(backfill.run(["005930", "000660"]))
+        assert store.exists("000660", "1m")
+        assert not store.exists("005930", "1m")
+
+        journal = BackfillJournal(str(tmp_path / "journal.jsonl"))
+        assert journal.get("005930", "1")["next_key"] == "8"
+        assert journal.get("005930", "1")["pages"] == 2
+        journal.close()
+
+        server.requests.clear()
+        assert asyncio.run(backfill.run(["005930", "000660"])) == {"005930": 10}
+        # 마지막 연속조회키부터 이어서 받는다
+        assert server.requests == [("005930", 8)]
+        with store.open("005930", "1m") as bars:
+            assert len(bars) == 10
+
+    def test_partial_journal_line_ignored(self, tmp_path):
+        path = tmp_path / "journal.jsonl"
+        path.write_text('{"code": "005930", "tic_scope": "1", "next_key": "4", "pages": 1}\n{"code": "0006', encoding="utf-8")
+        journal = BackfillJournal(str(path))
+        journal.complete("000660", "1", 3)
+        journal.close()
+        reloaded = BackfillJournal(str(path))
+        assert reloaded.get("005930", "1")["next_key"] == "4"
+        assert reloaded.is_done("000660", "1")
+        reloaded.close()
+
+    def test_journal_compacted_on_open(self, tmp_path):
+        server = MinuteServer(minutes=10)
+        backfill, _ = make_backfill(server, tmp_path)
+        asyncio.run(backfill.run(["005930", "000660"]))
+        path = tmp_path / "journal.jsonl"
+        # 페이지마다 체크포인트 3줄 + 완료 1줄
+        assert len(path.read_text(encoding="utf-8").splitlines()) == 8
+
+        journal = BackfillJournal(str(path))
+        journal.close()
+        lines = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+        assert sorted(record["code"] for record in lines) == ["000660", "005930"]
+        assert all(record["done"] for record in lines)
+        assert not (tmp_path / "journal.jsonl.tmp").exists()
+
+    def test_leftover_spool_removed_for_done_symbols(self, tmp_path):
+        server = MinuteServer(minutes=10)
+        backfill, _ = make_backfill(server, tmp_path)
+        asyncio.run(backfill.run(["005930"]))
+        # 완료 기록 후 스풀을 지우기 전에 중단된 상황
+        spool = tmp_path / "spool" / "1" / "005930.jsonl"
+        spool.write_text('{"rows": []}\n', encoding="utf-8")
+
+        server.requests.clear()
+        assert asyncio.run(backfill.run(["005930"])) == {}
+        assert server.requests == []
+        assert not spool.exists()
+
+    def test_until_stops_pagination(self, tmp_path):
+        server = MinuteServer(minutes=10)
+        backfill, store = make_backfill(server, tmp_path, until="20250102090500")
+        assert asyncio.run(backfill.run(["005930"])) == {"005930": 5}
+        assert server.requests == [("005930", 0), ("005930", 4)]
+
+    def test_requires_async_chart(self, tmp_path):
+        chart = Chart(base_url="https://api.kiwoom.com", session=KiwoomSession())
+        with pytest.raises(TypeError):
+            MinuteBackfill(chart, journal_path=str(tmp_path / "journal.jsonl"))
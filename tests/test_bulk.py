@@ -0,0 +1,169 @@
+"""
+다종목 일괄 조회 테스트
+"""
+
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+
+from kiwoom_rest_api.core.bulk import BulkResult, amap_symbols, map_symbols
+from kiwoom_rest_api.core.session import KiwoomSession, AsyncKiwoomSession
+from kiwoom_rest_api.koreanstock.stockinfo import StockInfo
+
+CODES = [f"{i:06d}" for i in range(40)]
+
+
+class InFlight:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.current = 0
+        self.peak = 0
+
+    def __enter__(self):
+        with self.lock:
+            self.current += 1
+            self.peak = max(self.peak, self.current)
+
+    def __exit__(self, *exc_info):
+        with self.lock:
+            self.current -= 1
+
+
+class TestMapSymbols:
+    """스레드 풀 일괄 실행 테스트"""
+
+    def test_bounded_and_errors_captured(self):
+        in_flight = InFlight()
+
+        def fetch(code, suffix):
+            with in_flight:
+                time.sleep(0.005)
+            if code == "000007":
+                raise ValueError("bad code")
+            return code + suffix
+
+        results = list(map_symbols(fetch, CODES, "!", max_workers=4))
+        assert len(results) == len(CODES)
+        assert in_flight.peak <= 4
+        by_code = {item.code: item for item in results}
+        assert by_code["000001"] == BulkResult("000001", "000001!")
+        assert not by_code["000007"].ok
+        assert isinstance(by_code["000007"].error, ValueError)
+
+    def test_codes_pulled_lazily(self):
+        pulled = []
+
+        def codes():
+            for code in CODES:
+                pulled.append(code)
+                yield code
+
+        results = map_symbols(lambda code: code, codes(), max_workers=2)
+        next(results)
+        assert len(pulled) <= 4
+        results.close()
+
+    def test_completion_order(self):
+        def fetch(code):
+            time.sleep(0.05 if code == "slow" else 0)
+            return code
+
+        assert [item.code for item in map_symbols(fetch, ["slow", "fast"], max_workers=2)] == ["fast", "slow"]
+
+
+class TestAmapSymbols:
+    """asyncio 일괄 실행 테스트"""
+
+    def test_bounded_and_errors_captured(self):
+        in_flight = InFlight()
+
+        async def fetch(code):
+            with in_flight:
+                await asyncio.sleep(0.001)
+            if code == "000003":
+                raise RuntimeError("boom")
+            return {"code": code}
+
+        async def run():
+            return [item async for item in amap_symbols(fetch, CODES, concurrency=5)]
+
+        results = asyncio.run(run())
+        assert len(results) == len(CODES)
+        assert in_flight.peak <= 5
+        assert sum(not item.ok for item in results) == 1
+
+    def test_early_exit_cancels(self):
+        started = []
+
+        async def fetch(code):
+            started.append(code)
+            await asyncio.sleep(0 if code == CODES[0] else 10)
+            return code
+
+        async def run():
+            results = amap_symbols(fetch, CODES, concurrency=3)
+            async for item in results:
+                assert item.code == CODES[0]
+                break
+            await results.aclose()
+            # 진행 중이던 요청은 모두 취소되고 새 요청은 시작되지 않는다
+            tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+            await asyncio.sleep(0)
+            assert all(task.cancelled() for task in tasks)
+            return len(started)
+
+        assert asyncio.run(run()) <= 4
+
+    def test_invalid_concurrency(self):
+        async def run():
+            async for _ in amap_symbols(lambda code: code, CODES, concurrency=0):
+                pass
+
+        with pytest.raises(ValueError):
+            asyncio.run(run())
+
+
+class TestBaseAPIMapSymbols:
+    """KiwoomBaseAPI.map_symbols / amap_symbols 테스트"""
+
+    @staticmethod
+    def handler(request):
+        body = request.read().decode()
+        if "999999" in body:
+            return httpx.Response(400, json={"return_code": 1, "return_msg": "종목코드 오류"})
+        return httpx.Response(200, json={"return_code": 0, "body": body})
+
+    def test_sync(self):
+        stock_info = StockInfo(
+            base_url="https://api.kiwoom.com",
+            session=KiwoomSession(transport=httpx.MockTransport(self.handler)),
+        )
+        results = {
+            item.code: item
+            for item in stock_info.map_symbols("basic_stock_information_request_ka10001", ["005930", "999999"])
+        }
+        assert results["005930"].ok
+        assert not results["999999"].ok
+        with pytest.raises(TypeError):
+            stock_info.amap_symbols("basic_stock_information_request_ka10001", [])
+
+    def test_async(self):
+        stock_info = StockInfo(
+            base_url="https://api.kiwoom.com",
+            session=AsyncKiwoomSession(transport=httpx.MockTransport(self.handler)),
+            use_async=True,
+        )
+
+        async def run():
+            return [
+                item async for item in stock_info.amap_symbols(
+                    stock_info.basic_stock_information_request_ka10001, CODES, concurrency=8
+                )
+            ]
+
+        results = asyncio.run(run())
+        assert sorted(item.code for item in results) == CODES
+        assert all(item.ok for item in results)
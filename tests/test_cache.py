@@ -0,0 +1,120 @@
+"""
+응답 캐시 테스트
+"""
+
+import asyncio
+import time
+
+import httpx
+
+from kiwoom_rest_api.core.cache import MemoryCacheBackend, ResponseCache, SQLiteCacheBackend
+from kiwoom_rest_api.core.session import KiwoomSession, AsyncKiwoomSession
+from kiwoom_rest_api.koreanstock.stockinfo import StockInfo
+
+
+def counting_handler(calls):
+    def handler(request):
+        calls.append(request.headers["api-id"])
+        return httpx.Response(200, json={"return_code": 0, "list": [{"code": "005930"}]})
+    return handler
+
+
+class TestBackends:
+    """캐시 백엔드 테스트"""
+
+    def test_memory_lru_eviction(self):
+        backend = MemoryCacheBackend(maxsize=2)
+        future = time.time() + 60
+        backend.set("a", 1, future)
+        backend.set("b", 2, future)
+        backend.get("a")
+        backend.set("c", 3, future)
+        assert backend.get("b") is None
+        assert backend.get("a") == 1
+        assert backend.get("c") == 3
+
+    def test_memory_expiry(self):
+        backend = MemoryCacheBackend()
+        backend.set("a", 1, time.time() - 1)
+        assert backend.get("a") is None
+
+    def test_sqlite_backend(self, tmp_path):
+        path = str(tmp_path / "cache" / "responses.db")
+        backend = SQLiteCacheBackend(path, maxsize=2)
+        future = time.time() + 60
+        backend.set("a", {"v": 1}, future)
+        backend.set("b", {"v": 2}, future)
+        time.sleep(0.01)
+        backend.get("a")
+        backend.set("c", {"v": 3}, future)
+        assert len(backend) == 2
+        assert backend.get("b") is None
+        backend.close()
+
+        reopened = SQLiteCacheBackend(path)
+        assert reopened.get("a") == {"v": 1}
+        reopened.close()
+
+
+class TestResponseCache:
+    """ResponseCache 테스트"""
+
+    def test_ttl_for(self):
+        cache = ResponseCache()
+        assert cache.ttl_for("ka10099") > 0
+        assert cache.ttl_for("ka10001") is None
+        assert ResponseCache(default_ttl=5).ttl_for("ka10001") == 5
+        assert ResponseCache(default_ttl=5).ttl_for("kt10000") is None
+        assert ResponseCache(default_ttl=5).ttl_for("ka10085", "/api/dostk/acnt") is None
+        assert ResponseCache(ttls={"ka10075": 5}).ttl_for("ka10075", "https://api.kiwoom.com/api/dostk/acnt") is None
+
+    def test_reference_tr_cached(self):
+        calls = []
+        stock_info = StockInfo(
+            base_url="https://api.kiwoom.com",
+            session=KiwoomSession(transport=httpx.MockTransport(counting_handler(calls))),
+            cache=ResponseCache(),
+        )
+        first = stock_info.stock_information_list_request_ka10099("0")
+        second = stock_info.stock_information_list_request_ka10099("0")
+        stock_info.stock_information_list_request_ka10099("10")
+        stock_info.basic_stock_information_request_ka10001("005930")
+        stock_info.basic_stock_information_request_ka10001("005930")
+        assert first == second
+        assert calls == ["ka10099", "ka10099", "ka10001", "ka10001"]
+
+    def test_error_reply_not_cached(self):
+        """HTTP 200 이라도 return_code 가 0 이 아닌 응답은 저장하지 않는다"""
+        calls = []
+
+        def handler(request):
+            calls.append(request.headers["api-id"])
+            if len(calls) == 1:
+                return httpx.Response(200, json={"return_code": 2, "return_msg": "조회 실패"})
+            return httpx.Response(200, json={"return_code": 0, "list": []})
+
+        stock_info = StockInfo(
+            base_url="https://api.kiwoom.com",
+            session=KiwoomSession(transport=httpx.MockTransport(handler)),
+            cache=ResponseCache(),
+        )
+        assert stock_info.stock_information_list_request_ka10099("0")["return_code"] == 2
+        assert stock_info.stock_information_list_request_ka10099("0")["return_code"] == 0
+        assert stock_info.stock_information_list_request_ka10099("0")["return_code"] == 0
+        assert calls == ["ka10099", "ka10099"]
+
+    def test_async_cached(self):
+        calls = []
+        stock_info = StockInfo(
+            base_url="https://api.kiwoom.com",
+            session=AsyncKiwoomSession(transport=httpx.MockTransport(counting_handler(calls))),
+            cache=ResponseCache(),
+            use_async=True,
+        )
+
+        async def run():
+            await stock_info.industry_code_list_request_ka10101("0")
+            await stock_info.industry_code_list_request_ka10101("0")
+
+        asyncio.run(run())
+        assert calls == ["ka10101"]
@@ -0,0 +1,110 @@
+"""
+동일 요청 단일 실행(single-flight) 테스트
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+
+from kiwoom_rest_api.core.coalesce import RequestCoalescer, is_coalescable
+from kiwoom_rest_api.core.session import KiwoomSession, AsyncKiwoomSession
+from kiwoom_rest_api.koreanstock.account import Account
+from kiwoom_rest_api.koreanstock.stockinfo import StockInfo
+
+
+class TestRequestCoalescer:
+    """RequestCoalescer 테스트"""
+
+    def test_is_coalescable(self):
+        assert is_coalescable("ka10001")
+        assert not is_coalescable("kt10000")
+        assert not is_coalescable(None)
+        # 계좌 조회 TR 은 appkey 마다 결과가 다르므로 공유하지 않는다
+        assert not is_coalescable("ka10085", "https://api.kiwoom.com/api/dostk/acnt")
+        assert is_coalescable("ka10001", "https://api.kiwoom.com/api/dostk/stkinfo")
+
+    def test_threads_share_one_call(self):
+        coalescer = RequestCoalescer()
+        calls = []
+        gate = threading.Event()
+
+        def func():
+            calls.append(1)
+            gate.wait(1)
+            return {"value": 1}
+
+        with ThreadPoolExecutor(8) as pool:
+            futures = [pool.submit(coalescer.run, "key", func) for _ in range(8)]
+            time.sleep(0.05)
+            gate.set()
+            results = [f.result() for f in futures]
+
+        assert len(calls) == 1
+        assert all(r is results[0] for r in results)
+        assert coalescer.in_flight == 0
+
+    def test_exception_shared(self):
+        coalescer = RequestCoalescer()
+
+        async def boom():
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        async def run():
+            return await asyncio.gather(*[coalescer.run_async("k", boom) for _ in range(3)], return_exceptions=True)
+
+        results = asyncio.run(run())
+        assert all(isinstance(r, ValueError) for r in results)
+
+
+class TestCoalescingIntegration:
+    """KiwoomBaseAPI 통합 테스트"""
+
+    def test_async_identical_requests(self):
+        calls = []
+
+        async def handler(request):
+            calls.append(request.content)
+            await asyncio.sleep(0.02)
+            return httpx.Response(200, json={"return_code": 0})
+
+        stock_info = StockInfo(
+            base_url="https://api.kiwoom.com",
+            session=AsyncKiwoomSession(transport=httpx.MockTransport(handler)),
+            coalescer=RequestCoalescer(),
+            use_async=True,
+        )
+
+        async def run():
+            same = [stock_info.basic_stock_information_request_ka10001("005930") for _ in range(5)]
+            other = [stock_info.basic_stock_information_request_ka10001("000660")]
+            return await asyncio.gather(*same, *other)
+
+        results = asyncio.run(run())
+        assert len(results) == 6
+        assert len(calls) == 2
+
+    def test_account_inquiries_not_shared(self):
+        """계좌 조회(/api/dostk/acnt)는 같은 요청이라도 각자 보낸다 (appkey 마다 결과가 다르다)"""
+        calls = []
+
+        async def handler(request):
+            calls.append(request.headers["api-id"])
+            await asyncio.sleep(0.02)
+            return httpx.Response(200, json={"return_code": 0})
+
+        account = Account(
+            base_url="https://api.kiwoom.com",
+            session=AsyncKiwoomSession(transport=httpx.MockTransport(handler)),
+            coalescer=RequestCoalescer(),
+            use_async=True,
+        )
+
+        async def run():
+            return await asyncio.gather(*(account.account_return_rate_request_ka10085("0") for _ in range(3)))
+
+        asyncio.run(run())
+        assert calls == ["ka10085"] * 3
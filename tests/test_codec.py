@@ -0,0 +1,61 @@
+"""
+JSON 코덱 테스트
+"""
+
+import httpx
+import pytest
+
+from kiwoom_rest_api.core import codec
+from kiwoom_rest_api.core.session import KiwoomSession
+from kiwoom_rest_api.koreanstock.stockinfo import StockInfo
+
+BACKENDS = ["json"] + (["orjson"] if codec.orjson is not None else [])
+
+
+@pytest.fixture(params=BACKENDS)
+def backend(request):
+    previous = codec.get_backend()
+    codec.set_backend(request.param)
+    yield request.param
+    codec.set_backend(previous)
+
+
+class TestCodec:
+    """codec 테스트"""
+
+    def test_roundtrip(self, backend):
+        data = {"stk_nm": "삼성전자", "cur_prc": "+70000", "list": [1, 2.5, None, True]}
+        assert codec.loads(codec.dumps(data)) == data
+        assert codec.loads(codec.dumps_bytes(data)) == data
+
+    def test_compact_utf8(self, backend):
+        assert codec.dumps_bytes({"a": "한"}) == '{"a":"한"}'.encode("utf-8")
+
+    def test_sort_keys(self, backend):
+        assert codec.dumps({"b": 1, "a": 2}, sort_keys=True) == '{"a":2,"b":1}'
+
+    def test_decode_error(self, backend):
+        with pytest.raises(codec.JSONDecodeError):
+            codec.loads(b"not json")
+
+    def test_unknown_backend(self):
+        with pytest.raises(ValueError):
+            codec.set_backend("yaml")
+
+    def test_request_and_response_use_codec(self, backend):
+        """요청 본문과 응답이 codec 을 통해 처리되는지 테스트"""
+        seen = {}
+
+        def handler(request):
+            seen["body"] = request.content
+            seen["content_type"] = request.headers["content-type"]
+            return httpx.Response(200, content='{"stk_nm":"삼성전자","return_code":0}'.encode("utf-8"))
+
+        stock_info = StockInfo(
+            base_url="https://api.kiwoom.com",
+            session=KiwoomSession(transport=httpx.MockTransport(handler)),
+        )
+        result = stock_info.basic_stock_information_request_ka10001("005930")
+        assert result["stk_nm"] == "삼성전자"
+        assert seen["body"] == b'{"stk_cd":"005930"}'
+        assert seen["content_type"].startswith("application/json")
@@ -0,0 +1,102 @@
+"""
+메모리 맵 컬럼형 봉 파일 테스트
+"""
+
+import pytest
+
+from kiwoom_rest_api.history.columnar import BarFile, ColumnarStore, parse_number, rows_to_columns
+
+DAILY_ROWS = [
+    {"dt": "20250103", "open_pric": "+70500", "high_pric": "+71000", "low_pric": "-69000",
+     "cur_prc": "+70800", "trde_qty": "1200", "trde_prica": "84000"},
+    {"dt": "20250102", "open_pric": "70000", "high_pric": "70500", "low_pric": "69500",
+     "cur_prc": "-70100", "trde_qty": "1000", "trde_prica": "70000"},
+    {"dt": "20250106", "open_pric": "71000", "high_pric": "72000", "low_pric": "70900",
+     "cur_prc": "71500", "trde_qty": "900", "trde_prica": "64000"},
+]
+
+
+class TestParse:
+    """차트 문자열 필드 변환 테스트"""
+
+    def test_parse_number(self):
+        assert parse_number("+70000") == 70000
+        assert parse_number("-69500") == 69500
+        assert parse_number("") == 0
+        assert parse_number("-1.25", "d") == -1.25
+
+    def test_rows_to_columns_sorted(self):
+        columns = rows_to_columns(DAILY_ROWS)
+        assert list(columns["time"]) == [20250102, 20250103, 20250106]
+        assert list(columns["close"]) == [70100, 70800, 71500]
+        assert list(columns["low"]) == [69500, 69000, 70900]
+
+    def test_minute_rows_use_cntr_tm(self):
+        columns = rows_to_columns([{"cntr_tm": "20250102090100", "cur_prc": "-70000", "trde_qty": "5"}])
+        assert list(columns["time"]) == [20250102090100]
+        assert list(columns["value"]) == [0]
+
+    def test_same_time_rows_are_one_bar(self):
+        """봉 전용 형식: 시간이 같은 행은 나중 행이 남는다 (연속조회 겹침)"""
+        rows = [
+            {"cntr_tm": "20250102090000", "cur_prc": "70000", "trde_qty": "5"},
+            {"cntr_tm": "20250102090000", "cur_prc": "70100", "trde_qty": "7"},
+        ]
+        columns = rows_to_columns(rows)
+        assert list(columns["volume"]) == [7]
+
+
+class TestColumnarStore:
+    """ColumnarStore / BarFile 테스트"""
+
+    def test_write_and_slice(self, tmp_path):
+        store = ColumnarStore(str(tmp_path))
+        assert store.write("005930", "D", DAILY_ROWS) == 3
+        with store.open("005930", "D") as bars:
+            assert len(bars) == 3
+            assert bars.columns == ["time", "open", "high", "low", "close", "volume", "value"]
+            view = bars.slice(20250103, 20250110)
+            assert list(view["time"]) == [20250103, 20250106]
+            assert list(view["volume"]) == [1200, 900]
+            assert bars.bounds(20250104, 20250105) == (2, 2)
+            for column in view.values():
+                column.release()
+
+    def test_append_merges_and_overwrites(self, tmp_path):
+        store = ColumnarStore(str(tmp_path))
+        store.write("005930", "D", DAILY_ROWS[:2])
+        updated = dict(DAILY_ROWS[0], cur_prc="70900")
+        assert store.append("005930", "D", [DAILY_ROWS[2], updated]) == 3
+        with store.open("005930", "D") as bars:
+            close = bars.column("close")
+            assert list(close) == [70100, 70900, 71500]
+            close.release()
+        # 다른 종목/주기 파일은 따로 저장된다
+        assert not store.exists("005930", "W")
+
+    def test_empty_file(self, tmp_path):
+        store = ColumnarStore(str(tmp_path))
+        store.write("000660", "1m", [])
+        with store.open("000660", "1m") as bars:
+            assert len(bars) == 0
+            assert bars.bounds(0, 99999999999999) == (0, 0)
+
+    def test_invalid_names_and_files(self, tmp_path):
+        store = ColumnarStore(str(tmp_path))
+        with pytest.raises(ValueError):
+            store.path_for("../005930", "D")
+        path = tmp_path / "bogus.bars"
+        path.write_bytes(b"x" * 64)
+        with pytest.raises(ValueError):
+            BarFile(str(path))
+
+    def test_as_numpy(self, tmp_path):
+        numpy = pytest.importorskip("numpy")
+        store = ColumnarStore(str(tmp_path))
+        store.write("005930", "D", DAILY_ROWS)
+        bars = store.open("005930", "D")
+        close = bars.as_numpy("close")
+        assert close.dtype == numpy.dtype("<i8")
+        assert close.tolist() == [70100, 70800, 71500]
+        del close
+        bars.close()
@@ -0,0 +1,106 @@
+"""
+적응형 동시성 제어기 테스트
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from kiwoom_rest_api.core.base import RateLimitError, is_throttled
+from kiwoom_rest_api.core.concurrency import AdaptiveConcurrencyLimiter
+from kiwoom_rest_api.core.session import AsyncKiwoomSession, KiwoomSession
+from kiwoom_rest_api.koreanstock.stockinfo import StockInfo
+
+
+class TestThrottleDetection:
+    """한도 초과 응답 판별 테스트"""
+
+    def test_is_throttled(self):
+        assert is_throttled(429)
+        assert is_throttled(200, {"return_code": 5, "return_msg": "허용된 요청 개수를 초과하였습니다[1700:...]"})
+        assert not is_throttled(200, {"return_code": 0, "return_msg": "정상적으로 처리되었습니다"})
+        assert not is_throttled(500)
+
+    def test_process_response_async_raises_rate_limit_error(self):
+        """return_msg 기반 RateLimitError 테스트"""
+        def handler(request):
+            return httpx.Response(200, json={"return_code": 5, "return_msg": "허용된 요청 개수를 초과하였습니다"})
+
+        stock_info = StockInfo(
+            base_url="https://api.kiwoom.com",
+            session=AsyncKiwoomSession(transport=httpx.MockTransport(handler)),
+            use_async=True,
+        )
+        with pytest.raises(RateLimitError):
+            asyncio.run(stock_info.basic_stock_information_request_ka10001("005930"))
+
+    def test_process_response_sync_raises_rate_limit_error(self):
+        """동기 경로도 HTTP 200 한도 초과 응답을 RateLimitError 로 올린다"""
+        replies = [
+            {"return_code": 5, "return_msg": "허용된 요청 개수를 초과하였습니다[1700:...]"},
+            {"return_code": 2, "return_msg": "조회 실패"},
+        ]
+
+        def handler(request):
+            return httpx.Response(200, json=replies.pop(0))
+
+        stock_info = StockInfo(
+            base_url="https://api.kiwoom.com",
+            session=KiwoomSession(transport=httpx.MockTransport(handler)),
+        )
+        with pytest.raises(RateLimitError):
+            stock_info.basic_stock_information_request_ka10001("005930")
+        # 다른 업무 오류는 지금처럼 응답 그대로 돌려준다
+        assert stock_info.basic_stock_information_request_ka10001("005930")["return_code"] == 2
+
+
+class TestAdaptiveConcurrencyLimiter:
+    """AdaptiveConcurrencyLimiter 테스트"""
+
+    def test_additive_increase(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=10)
+        for _ in range(4):
+            limiter.on_success()
+        assert 3.4 < limiter.limit < 4
+
+    def test_multiplicative_decrease_with_cooldown(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=8, cooldown=60)
+        limiter.on_throttle()
+        limiter.on_throttle()
+        assert limiter.limit == 4
+
+    def test_limits_in_flight_and_backs_off(self):
+        """429 응답 시 동시 요청 수가 줄어드는지 테스트"""
+        state = {"in_flight": 0, "peak": 0, "calls": 0}
+
+        async def handler(request):
+            state["calls"] += 1
+            call_no = state["calls"]
+            state["in_flight"] += 1
+            state["peak"] = max(state["peak"], state["in_flight"])
+            await asyncio.sleep(0.01)
+            state["in_flight"] -= 1
+            if call_no == 3:
+                return httpx.Response(429, text="Too Many Requests")
+            return httpx.Response(200, json={"return_code": 0})
+
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=4, increase=0.1, cooldown=60)
+        stock_info = StockInfo(
+            base_url="https://api.kiwoom.com",
+            session=AsyncKiwoomSession(transport=httpx.MockTransport(handler)),
+            concurrency_limiter=limiter,
+            use_async=True,
+        )
+
+        async def run():
+            return await asyncio.gather(
+                *[stock_info.basic_stock_information_request_ka10001("005930") for _ in range(12)],
+                return_exceptions=True,
+            )
+
+        results = asyncio.run(run())
+        assert sum(isinstance(r, RateLimitError) for r in results) == 1
+        assert state["peak"] <= 4
+        assert limiter.limit < 4
+        assert limiter.in_flight == 0
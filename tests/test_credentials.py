@@ -0,0 +1,138 @@
+"""
+다중 자격 증명 풀 테스트
+"""
+
+import asyncio
+from collections import Counter
+
+import httpx
+import pytest
+
+from kiwoom_rest_api.auth.credentials import (
+    Credential,
+    CredentialPool,
+    LEAST_LOADED,
+    is_pinned,
+)
+from kiwoom_rest_api.core.rate_limit import RateLimiter
+from kiwoom_rest_api.core.session import KiwoomSession, AsyncKiwoomSession
+from kiwoom_rest_api.koreanstock.account import Account
+from kiwoom_rest_api.koreanstock.order import Order
+from kiwoom_rest_api.koreanstock.stockinfo import StockInfo
+
+
+class FakeTokenManager:
+    def __init__(self, token):
+        self.token = token
+
+    def get_token(self):
+        return self.token
+
+    async def get_token_async(self):
+        return self.token
+
+    def stop_background_refresh(self):
+        pass
+
+
+def make_pool(count=3, **kwargs):
+    credentials = [
+        Credential(f"key-{i}", f"secret-{i}", token_manager=FakeTokenManager(f"token-{i}"))
+        for i in range(count)
+    ]
+    return CredentialPool(credentials, **kwargs)
+
+
+def recording_handler(seen, delay=0.0):
+    async def handler(request):
+        seen.append((request.headers["api-id"], request.headers["appkey"], request.headers["authorization"]))
+        await asyncio.sleep(delay)
+        return httpx.Response(200, json={"return_code": 0})
+
+    def sync_handler(request):
+        seen.append((request.headers["api-id"], request.headers["appkey"], request.headers["authorization"]))
+        return httpx.Response(200, json={"return_code": 0})
+
+    return handler if delay else sync_handler
+
+
+class TestCredentialPool:
+    """CredentialPool 선택 테스트"""
+
+    def test_is_pinned(self):
+        assert is_pinned("kt10000", "https://api.kiwoom.com/api/dostk/ordr")
+        assert is_pinned("ka10085", "https://api.kiwoom.com/api/dostk/acnt")
+        assert is_pinned("kt00018", "/api/dostk/acnt")
+        assert not is_pinned("ka10001", "https://api.kiwoom.com/api/dostk/stkinfo")
+
+    def test_round_robin(self):
+        pool = make_pool()
+        picked = []
+        for _ in range(6):
+            credential = pool.acquire("ka10001", "/api/dostk/stkinfo")
+            picked.append(credential.appkey)
+            pool.release(credential)
+        assert picked == ["key-0", "key-1", "key-2"] * 2
+
+    def test_least_loaded(self):
+        pool = make_pool(strategy=LEAST_LOADED)
+        first = pool.acquire("ka10001", "/api/dostk/stkinfo")
+        second = pool.acquire("ka10001", "/api/dostk/stkinfo")
+        pool.release(first)
+        # 진행 중 요청이 없는 key-0, key-2 중 돌아가며 선택
+        assert pool.acquire("ka10001", "/api/dostk/stkinfo").appkey == "key-2"
+        assert pool.acquire("ka10001", "/api/dostk/stkinfo").appkey == "key-0"
+        assert second.in_flight == 1
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError):
+            CredentialPool([])
+        with pytest.raises(ValueError):
+            make_pool(strategy="random")
+
+    def test_from_keys(self):
+        pool = CredentialPool.from_keys([("a", "x"), ("b", "y")])
+        assert [c.appkey for c in pool.credentials] == ["a", "b"]
+        assert all(isinstance(c.rate_limiter, RateLimiter) for c in pool.credentials)
+        assert pool.credentials[0].rate_limiter is not pool.credentials[1].rate_limiter
+
+
+class TestBaseAPIWithPool:
+    """KiwoomBaseAPI 자격 증명 풀 연동 테스트"""
+
+    def test_inquiry_spread_and_orders_pinned(self):
+        seen = []
+        pool = make_pool()
+        options = dict(
+            base_url="https://api.kiwoom.com",
+            session=KiwoomSession(transport=httpx.MockTransport(recording_handler(seen))),
+            credential_pool=pool,
+        )
+        stock_info, order, account = StockInfo(**options), Order(**options), Account(**options)
+        for _ in range(3):
+            stock_info.basic_stock_information_request_ka10001("005930")
+            order.stock_buy_order_request_kt10000(dmst_stex_tp="KRX", stk_cd="005930", ord_qty="1", trde_tp="3")
+        account.deposit_detail_status_request_kt00001(qry_tp="3")
+
+        inquiry = [(key, auth) for api_id, key, auth in seen if api_id == "ka10001"]
+        assert inquiry == [("key-0", "Bearer token-0"), ("key-1", "Bearer token-1"), ("key-2", "Bearer token-2")]
+        pinned = {key for api_id, key, _ in seen if api_id != "ka10001"}
+        assert pinned == {"key-0"}
+        assert all(c.in_flight == 0 for c in pool.credentials)
+
+    def test_async_least_loaded(self):
+        seen = []
+        pool = make_pool(strategy=LEAST_LOADED)
+        stock_info = StockInfo(
+            base_url="https://api.kiwoom.com",
+            session=AsyncKiwoomSession(transport=httpx.MockTransport(recording_handler(seen, delay=0.01))),
+            credential_pool=pool,
+            use_async=True,
+        )
+
+        async def run():
+            await asyncio.gather(*(stock_info.basic_stock_information_request_ka10001("005930") for _ in range(9)))
+
+        asyncio.run(run())
+        assert Counter(key for _, key, _ in seen) == {"key-0": 3, "key-1": 3, "key-2": 3}
+        assert all(c.in_flight == 0 for c in pool.credentials)
@@ -0,0 +1,167 @@
+"""
+요청 deadline(전체 시간 예산) 테스트
+"""
+
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+
+from kiwoom_rest_api.core import deadline
+from kiwoom_rest_api.core.deadline import DeadlineExceeded
+from kiwoom_rest_api.core.rate_limit import RateLimiter
+from kiwoom_rest_api.core.retry import RetryPolicy
+from kiwoom_rest_api.core.scheduler import PriorityScheduler
+from kiwoom_rest_api.core.session import KiwoomSession, AsyncKiwoomSession
+from kiwoom_rest_api.koreanstock.chart import Chart
+from kiwoom_rest_api.koreanstock.stockinfo import StockInfo
+
+
+class FixedBackoff(RetryPolicy):
+    def backoff(self, attempt):
+        return 5.0
+
+
+def endless_pages(request):
+    time.sleep(0.03)
+    return httpx.Response(
+        200,
+        json={"return_code": 0, "stk_dt_pole_chart_qry": [{"dt": "20250101"}]},
+        headers={"cont-yn": "Y", "next-key": "k", "access-control-expose-headers": "cont-yn,next-key"},
+    )
+
+
+class TestDeadlineContext:
+    """deadline 컨텍스트 테스트"""
+
+    def test_no_deadline(self):
+        assert deadline.remaining() is None
+        assert deadline.clamp(30) == 30
+        deadline.check()
+
+    def test_nested_keeps_earliest(self):
+        with deadline.deadline(0.5):
+            with deadline.deadline(10):
+                assert deadline.remaining() <= 0.5
+            with deadline.deadline(0.1):
+                assert deadline.remaining() <= 0.1
+                assert deadline.clamp(30) <= 0.1
+        assert deadline.remaining() is None
+
+    def test_absolute_deadline(self):
+        with deadline.deadline(at=time.time() + 1):
+            assert 0.5 < deadline.remaining() <= 1
+        with deadline.deadline(at=time.time() - 1):
+            with pytest.raises(DeadlineExceeded):
+                deadline.check()
+
+    def test_requires_one_argument(self):
+        with pytest.raises(ValueError):
+            with deadline.deadline():
+                pass
+        with pytest.raises(ValueError):
+            with deadline.deadline(1, at=time.time()):
+                pass
+
+
+class TestSyncDeadline:
+    """동기 경로 deadline 테스트"""
+
+    def test_fetch_all_stops_at_deadline(self):
+        chart = Chart(base_url="https://api.kiwoom.com", session=KiwoomSession(transport=httpx.MockTransport(endless_pages)))
+        pages = []
+        started = time.monotonic()
+        with pytest.raises(DeadlineExceeded):
+            with deadline.deadline(0.2):
+                for page in chart.iter_pages(chart.stock_daily_chart_request_ka10081, "005930", "20250101", "1"):
+                    pages.append(page)
+        assert time.monotonic() - started < 0.5
+        assert 1 <= len(pages) <= 8
+
+    def test_retry_gives_up_when_backoff_exceeds_budget(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(500, json={"return_code": 1, "return_msg": "error"})
+
+        stock_info = StockInfo(
+            base_url="https://api.kiwoom.com",
+            session=KiwoomSession(transport=httpx.MockTransport(handler)),
+            retry_policy=FixedBackoff(max_attempts=5),
+        )
+        started = time.monotonic()
+        with pytest.raises(DeadlineExceeded) as exc_info:
+            with deadline.deadline(1.0):
+                stock_info.basic_stock_information_request_ka10001("005930")
+        assert time.monotonic() - started < 0.5
+        assert len(calls) == 1
+        assert exc_info.value.status_code == 504
+
+    def test_rate_limit_wait_exceeds_budget(self):
+        limiter = RateLimiter(rate=1, burst=1)
+        limiter.acquire("ka10001")
+        with deadline.deadline(0.1):
+            with pytest.raises(DeadlineExceeded):
+                limiter.acquire("ka10001")
+
+    def test_scheduler_waiter_leaves_queue(self):
+        scheduler = PriorityScheduler(RateLimiter(rate=4, burst=1))
+        scheduler.acquire("ka10001")
+        # 두 번째 요청이 다음 슬롯(약 0.25초 뒤)을 기다리며 차례를 잡고 있는 동안
+        holder = threading.Thread(target=scheduler.acquire, args=("ka10001",))
+        holder.start()
+        time.sleep(0.02)
+        with deadline.deadline(0.05):
+            with pytest.raises(DeadlineExceeded):
+                scheduler.acquire("ka10081", "/api/dostk/chart")
+        assert scheduler.waiting == 0
+        holder.join()
+        scheduler.acquire("ka10001")
+
+
+class TestAsyncDeadline:
+    """비동기 경로 deadline 테스트"""
+
+    def test_slow_request_cancelled(self):
+        async def handler(request):
+            await asyncio.sleep(2)
+            return httpx.Response(200, json={"return_code": 0})
+
+        stock_info = StockInfo(
+            base_url="https://api.kiwoom.com",
+            session=AsyncKiwoomSession(transport=httpx.MockTransport(handler)),
+            use_async=True,
+        )
+
+        async def run():
+            with deadline.deadline(0.1):
+                await stock_info.basic_stock_information_request_ka10001("005930")
+
+        started = time.monotonic()
+        with pytest.raises(DeadlineExceeded):
+            asyncio.run(run())
+        assert time.monotonic() - started < 1.0
+
+    def test_expired_deadline_fails_without_request(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(200, json={"return_code": 0})
+
+        stock_info = StockInfo(
+            base_url="https://api.kiwoom.com",
+            session=AsyncKiwoomSession(transport=httpx.MockTransport(handler)),
+            use_async=True,
+        )
+
+        async def run():
+            with deadline.deadline(at=time.time() - 1):
+                await stock_info.basic_stock_information_request_ka10001("005930")
+
+        with pytest.raises(DeadlineExceeded):
+            asyncio.run(run())
+        assert calls == []
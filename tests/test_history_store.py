@@ -0,0 +1,140 @@
+"""
+일봉 로컬 이력 저장소 테스트
+"""
+
+import asyncio
+import json
+from datetime import date, timedelta
+
+import httpx
+import pytest
+
+from kiwoom_rest_api.core.base import APIError
+from kiwoom_rest_api.core.session import KiwoomSession, AsyncKiwoomSession
+from kiwoom_rest_api.history.store import HistoryStore, collect_new_rows
+from kiwoom_rest_api.koreanstock.chart import Chart
+
+PAGE_SIZE = 3
+
+
+class DailyServer:
+    """ka10081 연속조회를 흉내 내는 서버 (최신 일자부터 PAGE_SIZE 개씩)"""
+
+    def __init__(self, days=10):
+        start = date(2025, 1, 1)
+        self.bars = {}
+        for i in range(days):
+            self.add(start + timedelta(days=i), 1000 + i)
+        self.requests = []
+
+    def add(self, day, price, event=""):
+        dt = day.strftime("%Y%m%d")
+        self.bars[dt] = {"dt": dt, "cur_prc": str(price), "trde_qty": "10", "upd_stkpc_event": event}
+        return dt
+
+    def handler(self, request):
+        body = json.loads(request.content)
+        if body["stk_cd"] == "999999":
+            return httpx.Response(500, json={"return_code": 1, "return_msg": "error"})
+        offset = int(request.headers.get("next-key") or 0)
+        self.requests.append((body["stk_cd"], offset))
+        rows = [self.bars[dt] for dt in sorted(self.bars, reverse=True) if dt <= body["base_dt"]]
+        page = rows[offset:offset + PAGE_SIZE]
+        more = offset + PAGE_SIZE < len(rows)
+        headers = {
+            "cont-yn": "Y" if more else "N",
+            "next-key": str(offset + PAGE_SIZE) if more else "",
+            "access-control-expose-headers": "cont-yn,next-key",
+        }
+        return httpx.Response(
+            200, json={"return_code": 0, "stk_cd": body["stk_cd"], "stk_dt_pole_chart_qry": page}, headers=headers
+        )
+
+
+def make_chart(server, use_async=False):
+    session_class = AsyncKiwoomSession if use_async else KiwoomSession
+    return Chart(
+        base_url="https://api.kiwoom.com",
+        session=session_class(transport=httpx.MockTransport(server.handler)),
+        use_async=use_async,
+    )
+
+
+class TestCollectNewRows:
+    """페이지 증분 수집 테스트"""
+
+    def test_stops_at_known_rows(self):
+        rows = []
+        page = {"stk_dt_pole_chart_qry": [{"dt": "20250103"}, {"dt": "20250102"}, {"dt": "20250101"}]}
+        assert collect_new_rows(page, "20250102", rows) is True
+        assert [row["dt"] for row in rows] == ["20250103", "20250102"]
+
+    def test_collects_everything_without_since(self):
+        rows = []
+        assert collect_new_rows({"stk_dt_pole_chart_qry": [{"dt": "20250101"}, {}]}, None, rows) is False
+        assert len(rows) == 1
+
+
+class TestHistoryStore:
+    """HistoryStore 동기화 테스트"""
+
+    def test_initial_then_delta_sync(self):
+        server = DailyServer(days=10)
+        store = HistoryStore(":memory:")
+        chart = make_chart(server)
+
+        assert store.sync_daily(chart, ["005930"], base_dt="20250110") == {"005930": 10}
+        assert len(server.requests) == 4
+        assert store.last_date("005930") == "20250110"
+
+        server.requests.clear()
+        server.bars["20250110"]["cur_prc"] = "2000"  # 장중에 저장된 마지막 일봉이 확정됨
+        server.add(date(2025, 1, 11), 1100)
+        assert store.sync_daily(chart, ["005930"], base_dt="20250111") == {"005930": 2}
+        # 첫 페이지에서 이미 저장된 일자에 닿아 연속조회를 멈춘다
+        assert server.requests == [("005930", 0)]
+
+        bars = store.daily("005930")
+        assert [bar["dt"] for bar in bars] == sorted(server.bars)
+        assert bars[-2]["cur_prc"] == "2000"
+        assert [bar["dt"] for bar in store.daily("005930", start="20250109", end="20250110")] == ["20250109", "20250110"]
+
+    def test_adjustment_event_rebuilds_symbol(self):
+        server = DailyServer(days=5)
+        store = HistoryStore(":memory:")
+        chart = make_chart(server)
+        store.sync_daily(chart, ["005930"], base_dt="20250105")
+
+        for bar in server.bars.values():
+            bar["cur_prc"] = str(int(bar["cur_prc"]) // 2)
+        server.add(date(2025, 1, 6), 600, event="액면분할")
+        assert store.sync_daily(chart, ["005930"], base_dt="20250106") == {"005930": 6}
+        assert [bar["cur_prc"] for bar in store.daily("005930")] == ["500", "500", "501", "501", "502", "600"]
+
+        # 수정주가를 쓰지 않는 이력은 과거 가격이 바뀌지 않으므로 증분만 받는다
+        assert store.sync_daily(chart, ["005930"], base_dt="20250106", upd_stkpc_tp="0") == {"005930": 6}
+        server.add(date(2025, 1, 7), 610, event="액면분할")
+        assert store.sync_daily(chart, ["005930"], base_dt="20250107", upd_stkpc_tp="0") == {"005930": 2}
+
+    def test_failed_symbol_does_not_block_others(self):
+        server = DailyServer(days=3)
+        store = HistoryStore(":memory:")
+        with pytest.raises(APIError):
+            store.sync_daily(make_chart(server), ["005930", "999999", "000660"], base_dt="20250103")
+        assert store.codes() == ["000660", "005930"]
+
+    def test_async_sync(self, tmp_path):
+        server = DailyServer(days=7)
+        path = str(tmp_path / "history.db")
+        chart = make_chart(server, use_async=True)
+
+        with HistoryStore(path) as store:
+            written = asyncio.run(store.sync_daily(chart, ["005930", "000660"], base_dt="20250107"))
+        assert written == {"005930": 7, "000660": 7}
+
+        with HistoryStore(path) as store:
+            assert store.last_date("000660") == "20250107"
+            server.requests.clear()
+            server.add(date(2025, 1, 8), 1200)
+            assert asyncio.run(store.sync_daily(chart, ["000660"], base_dt="20250108")) == {"000660": 2}
+            assert server.requests == [("000660", 0)]
@@ -0,0 +1,103 @@
+"""
+요청 추적 훅 테스트
+"""
+
+import asyncio
+import logging
+
+import httpx
+import pytest
+
+from kiwoom_rest_api.core.base import APIError
+from kiwoom_rest_api.core.hooks import RequestHooks, disable_logging, enable_logging, hooks
+from kiwoom_rest_api.core.session import KiwoomSession, AsyncKiwoomSession
+from kiwoom_rest_api.koreanstock.stockinfo import StockInfo
+
+
+@pytest.fixture(autouse=True)
+def clean_hooks():
+    hooks.clear()
+    yield
+    hooks.clear()
+
+
+def make_stock_info(handler, use_async=False):
+    session_class = AsyncKiwoomSession if use_async else KiwoomSession
+    return StockInfo(
+        base_url="https://api.kiwoom.com",
+        session=session_class(transport=httpx.MockTransport(handler)),
+        use_async=use_async,
+    )
+
+
+def ok_handler(request):
+    return httpx.Response(200, json={"return_code": 0, "stk_nm": "삼성전자"})
+
+
+class TestRequestHooks:
+    """RequestHooks 레지스트리 테스트"""
+
+    def test_active_flag(self):
+        registry = RequestHooks()
+        assert not registry.active
+        callback = registry.on_response(lambda event: None)
+        assert registry.active
+        registry.remove(callback)
+        assert not registry.active
+
+    def test_callback_error_is_swallowed(self):
+        @hooks.on_response
+        def broken(event):
+            raise RuntimeError("boom")
+
+        result = make_stock_info(ok_handler).basic_stock_information_request_ka10001("005930")
+        assert result["stk_nm"] == "삼성전자"
+
+
+class TestTracing:
+    """요청 경로에서 훅 호출 테스트"""
+
+    def test_sync_events(self):
+        events = []
+        hooks.on_request_start(lambda event: events.append(("start", event.api_id, event.elapsed)))
+        hooks.on_response(lambda event: events.append(("response", event.status_code, event.elapsed)))
+
+        make_stock_info(ok_handler).basic_stock_information_request_ka10001("005930")
+        assert events[0] == ("start", "ka10001", None)
+        assert events[1][:2] == ("response", 200)
+        assert events[1][2] >= 0
+
+    def test_sync_error_event(self):
+        errors = []
+        hooks.on_error(errors.append)
+
+        def handler(request):
+            return httpx.Response(500, json={"return_code": 1, "return_msg": "fail"})
+
+        with pytest.raises(APIError):
+            make_stock_info(handler).basic_stock_information_request_ka10001("005930")
+        assert len(errors) == 1
+        assert errors[0].status_code == 500
+        assert isinstance(errors[0].error, APIError)
+
+    def test_async_events(self):
+        events = []
+        hooks.on_response(events.append)
+        stock_info = make_stock_info(ok_handler, use_async=True)
+
+        asyncio.run(stock_info.basic_stock_information_request_ka10001("005930"))
+        assert len(events) == 1
+        assert events[0].method == "POST"
+        assert events[0].url == "https://api.kiwoom.com/api/dostk/stkinfo"
+
+    def test_no_debug_output(self, capsys):
+        make_stock_info(ok_handler).basic_stock_information_request_ka10001("005930")
+        assert capsys.readouterr().out == ""
+
+    def test_enable_logging(self, caplog):
+        hook = enable_logging()
+        with caplog.at_level(logging.DEBUG, logger="kiwoom_rest_api.requests"):
+            make_stock_info(ok_handler).basic_stock_information_request_ka10001("005930")
+        assert "api-id=ka10001 status=200" in caplog.text
+        disable_logging(hook)
+        assert not hooks.active
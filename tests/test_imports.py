@@ -0,0 +1,79 @@
+"""
+지연 import 및 import 시간 예산 테스트
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+
+# 패키지 import 에 허용하는 누적 시간 (마이크로초)
+IMPORT_BUDGET_US = 50_000
+
+HEAVY_MODULES = ["httpx", "websockets", "rich", "sqlite3", "kiwoom_rest_api.koreanstock.stockinfo"]
+
+
+def run_python(code, *args):
+    env = dict(os.environ, PYTHONPATH=SRC_DIR)
+    return subprocess.run(
+        [sys.executable, *args, "-c", code],
+        capture_output=True, text=True, env=env, check=True,
+    )
+
+
+def cumulative_import_times(statement):
+    """Run statement under -X importtime and return {module: cumulative microseconds}"""
+    result = run_python(statement, "-X", "importtime")
+    cumulative = {}
+    for line in result.stderr.splitlines():
+        parts = [part.strip() for part in line.split("|")]
+        if len(parts) == 3 and parts[1].isdigit():
+            cumulative[parts[2]] = int(parts[1])
+    return cumulative
+
+
+def loaded_modules(statement):
+    code = f"{statement}\nimport sys\nprint(','.join(sorted(sys.modules)))"
+    return set(run_python(code).stdout.strip().split(","))
+
+
+class TestLazyImports:
+    """지연 import 테스트"""
+
+    def test_package_import_is_light(self):
+        modules = loaded_modules("import kiwoom_rest_api, kiwoom_rest_api.koreanstock")
+        assert not modules & set(HEAVY_MODULES)
+
+    def test_import_time_budget(self):
+        cumulative = cumulative_import_times("import kiwoom_rest_api, kiwoom_rest_api.koreanstock")
+        total = cumulative["kiwoom_rest_api"] + cumulative["kiwoom_rest_api.koreanstock"]
+        assert total < IMPORT_BUDGET_US
+
+    def test_lazy_attributes_resolve(self):
+        import kiwoom_rest_api
+        from kiwoom_rest_api import koreanstock
+        from kiwoom_rest_api.api import KiwoomRestAPI
+        from kiwoom_rest_api.koreanstock.stockinfo import StockInfo
+
+        assert kiwoom_rest_api.KiwoomRestAPI is KiwoomRestAPI
+        assert koreanstock.StockInfo is StockInfo
+        assert "StockInfo" in dir(koreanstock)
+        with pytest.raises(AttributeError):
+            koreanstock.NoSuchClass
+
+    def test_cli_defers_heavy_imports(self):
+        pytest.importorskip("typer")
+        modules = loaded_modules("import kiwoom_rest_api.cli.main")
+        assert "httpx" not in modules
+        assert "kiwoom_rest_api.koreanstock.stockinfo" not in modules
+        # rich 는 typer(0.9) 가 import 시점에 불러오므로 CLI 에서 미룰 수 없다
+
+    def test_cli_import_time_budget(self):
+        """typer(+rich) 를 뺀 CLI 모듈 자체의 import 시간 예산"""
+        pytest.importorskip("typer")
+        cumulative = cumulative_import_times("import kiwoom_rest_api.cli.main")
+        own = cumulative["kiwoom_rest_api.cli.main"] - cumulative.get("typer", 0)
+        assert own < IMPORT_BUDGET_US
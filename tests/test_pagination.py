@@ -0,0 +1,169 @@
+"""
+연속조회 페이지네이션 테스트
+"""
+
+import asyncio
+import json
+import time
+
+import httpx
+import pytest
+
+from kiwoom_rest_api.core.session import KiwoomSession, AsyncKiwoomSession
+from kiwoom_rest_api.core.pagination import (
+    aprefetch_pages,
+    iter_pages,
+    merge_pages,
+    next_page_key,
+    prefetch_pages,
+)
+from kiwoom_rest_api.koreanstock.chart import Chart
+
+PAGES = {
+    "": ("Y", "key1", [{"dt": "20241107"}, {"dt": "20241106"}]),
+    "key1": ("Y", "key2", [{"dt": "20241105"}]),
+    "key2": ("N", "", [{"dt": "20241104"}]),
+}
+
+
+def paged_handler(calls):
+    def handler(request: httpx.Request) -> httpx.Response:
+        key = request.headers.get("next-key", "")
+        calls.append((request.headers.get("cont-yn"), key, json.loads(request.content)))
+        cont_yn, next_key, rows = PAGES[key]
+        return httpx.Response(
+            200,
+            json={"stk_cd": "005930", "stk_dt_pole_chart_qry": rows, "return_code": 0},
+            headers={
+                "cont-yn": cont_yn,
+                "next-key": next_key,
+                "api-id": "ka10081",
+                "access-control-expose-headers": "cont-yn, next-key, api-id",
+            },
+        )
+    return handler
+
+
+class TestPagination:
+    """페이지네이션 테스트"""
+
+    def test_next_page_key(self):
+        """연속조회키 판별 테스트"""
+        assert next_page_key({"cont-yn": "Y", "next-key": "abc"}) == "abc"
+        assert next_page_key({"cont-yn": "N", "next-key": "abc"}) is None
+        assert next_page_key({"return_code": 0}) is None
+
+    def test_iter_pages(self):
+        """동기 페이지 순회 테스트"""
+        calls = []
+        chart = Chart(base_url="https://api.kiwoom.com",
+                      session=KiwoomSession(transport=httpx.MockTransport(paged_handler(calls))))
+        pages = list(chart.iter_pages(
+            chart.stock_daily_chart_request_ka10081,
+            stk_cd="005930", base_dt="20241107", upd_stkpc_tp="1",
+        ))
+        assert len(pages) == 3
+        assert [(c[0], c[1]) for c in calls] == [("N", ""), ("Y", "key1"), ("Y", "key2")]
+        assert all(c[2]["stk_cd"] == "005930" for c in calls)
+
+    def test_max_pages(self):
+        """최대 페이지 수 제한 테스트"""
+        calls = []
+        chart = Chart(base_url="https://api.kiwoom.com",
+                      session=KiwoomSession(transport=httpx.MockTransport(paged_handler(calls))))
+        pages = list(chart.iter_pages(
+            "stock_daily_chart_request_ka10081",
+            stk_cd="005930", base_dt="20241107", upd_stkpc_tp="1", max_pages=2,
+        ))
+        assert len(pages) == 2
+
+    def test_fetch_all(self):
+        """리스트 필드 병합 테스트"""
+        chart = Chart(base_url="https://api.kiwoom.com",
+                      session=KiwoomSession(transport=httpx.MockTransport(paged_handler([]))))
+        result = chart.fetch_all(
+            chart.stock_daily_chart_request_ka10081,
+            stk_cd="005930", base_dt="20241107", upd_stkpc_tp="1",
+        )
+        assert [row["dt"] for row in result["stk_dt_pole_chart_qry"]] == [
+            "20241107", "20241106", "20241105", "20241104"
+        ]
+        assert result["stk_cd"] == "005930"
+        assert result["cont-yn"] == "N"
+
+    def test_fetch_all_async(self):
+        """비동기 병합 테스트"""
+        chart = Chart(base_url="https://api.kiwoom.com", use_async=True,
+                      session=AsyncKiwoomSession(transport=httpx.MockTransport(paged_handler([]))))
+        result = asyncio.run(chart.fetch_all(
+            chart.stock_daily_chart_request_ka10081,
+            stk_cd="005930", base_dt="20241107", upd_stkpc_tp="1",
+        ))
+        assert len(result["stk_dt_pole_chart_qry"]) == 4
+
+    def test_merge_pages_list_keys(self):
+        """지정한 리스트 필드만 병합하는지 테스트"""
+        merged = merge_pages(
+            [{"a": [1], "b": [1]}, {"a": [2], "b": [2]}],
+            list_keys=["a"],
+        )
+        assert merged == {"a": [1, 2], "b": [1]}
+
+
+def _slow_fetcher(delay, pages=6, fail_at=None):
+    def fetch(cont_yn, next_key):
+        index = int(next_key or 0)
+        time.sleep(delay)
+        if fail_at is not None and index == fail_at:
+            raise RuntimeError("boom")
+        more = index + 1 < pages
+        return {"i": index, "cont-yn": "Y" if more else "N", "next-key": str(index + 1) if more else ""}
+    return fetch
+
+
+class TestPrefetch:
+    """다음 페이지 선요청 테스트"""
+
+    def test_prefetch_overlaps_processing(self):
+        """페이지 처리와 네트워크 대기가 겹치는지 테스트"""
+        def consume(pages):
+            start = time.monotonic()
+            seen = []
+            for page in pages:
+                time.sleep(0.03)
+                seen.append(page["i"])
+            return seen, time.monotonic() - start
+
+        seen_plain, plain = consume(iter_pages(_slow_fetcher(0.03)))
+        seen_prefetch, prefetched = consume(prefetch_pages(_slow_fetcher(0.03), depth=2))
+        assert seen_plain == seen_prefetch == list(range(6))
+        assert prefetched < plain * 0.8
+
+    def test_prefetch_error_propagates(self):
+        """생산자 오류 전달 테스트"""
+        pages = prefetch_pages(_slow_fetcher(0, fail_at=2), depth=1)
+        assert next(pages)["i"] == 0
+        assert next(pages)["i"] == 1
+        with pytest.raises(RuntimeError):
+            next(pages)
+
+    def test_aprefetch(self):
+        """비동기 선요청 테스트"""
+        async def fetch(cont_yn, next_key):
+            await asyncio.sleep(0.001)
+            return _slow_fetcher(0)(cont_yn, next_key)
+
+        async def run():
+            return [page["i"] async for page in aprefetch_pages(fetch, depth=3)]
+
+        assert asyncio.run(run()) == list(range(6))
+
+    def test_iter_pages_prefetch_option(self):
+        """iter_pages prefetch 옵션 테스트"""
+        chart = Chart(base_url="https://api.kiwoom.com",
+                      session=KiwoomSession(transport=httpx.MockTransport(paged_handler([]))))
+        pages = list(chart.iter_pages(
+            chart.stock_daily_chart_request_ka10081,
+            stk_cd="005930", base_dt="20241107", upd_stkpc_tp="1", prefetch=2,
+        ))
+        assert len(pages) == 3
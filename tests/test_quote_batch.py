@@ -0,0 +1,171 @@
+"""
+관심종목(ka10095) 일괄 시세 조회 테스트
+"""
+
+import asyncio
+import json
+import threading
+import time
+
+import httpx
+import pytest
+
+from kiwoom_rest_api.core import deadline
+from kiwoom_rest_api.core.base import APIError
+from kiwoom_rest_api.core.session import KiwoomSession, AsyncKiwoomSession
+from kiwoom_rest_api.koreanstock.quote_batch import QuoteBatcher, chunk_codes
+from kiwoom_rest_api.koreanstock.stockinfo import StockInfo
+
+CODES = [f"{i:06d}" for i in range(250)]
+
+
+def watchlist_handler(calls):
+    def handler(request):
+        codes = json.loads(request.content)["stk_cd"].split("|")
+        calls.append(codes)
+        if "999999" in codes:
+            return httpx.Response(500, json={"return_code": 1, "return_msg": "error"})
+        rows = [{"stk_cd": code, "cur_prc": f"+{int(code) + 1000}"} for code in codes]
+        return httpx.Response(200, json={"return_code": 0, "atn_stk_infr": rows})
+    return handler
+
+
+def make_batcher(calls, use_async=False, **kwargs):
+    session_class = AsyncKiwoomSession if use_async else KiwoomSession
+    stock_info = StockInfo(
+        base_url="https://api.kiwoom.com",
+        session=session_class(transport=httpx.MockTransport(watchlist_handler(calls))),
+        use_async=use_async,
+    )
+    return QuoteBatcher(stock_info, **kwargs)
+
+
+class TestChunkCodes:
+    """종목코드 분할 테스트"""
+
+    def test_dedup_and_chunk(self):
+        assert chunk_codes(["A", "B", " A", "", "C"], 2) == [["A", "B"], ["C"]]
+
+    def test_invalid_size(self):
+        with pytest.raises(ValueError):
+            chunk_codes(["A"], 0)
+
+
+class TestGetQuotes:
+    """get_quotes 테스트"""
+
+    def test_sync_chunked(self):
+        calls = []
+        quotes = make_batcher(calls, chunk_size=100).get_quotes(CODES + CODES[:10])
+        assert sorted(len(codes) for codes in calls) == [50, 100, 100]
+        assert len(quotes) == len(CODES)
+        assert quotes["000123"]["cur_prc"] == "+1123"
+
+    def test_async_chunked(self):
+        calls = []
+        batcher = make_batcher(calls, use_async=True, chunk_size=100)
+        quotes = asyncio.run(batcher.get_quotes(CODES))
+        assert len(calls) == 3
+        assert set(quotes) == set(CODES)
+
+    def test_error_raised(self):
+        calls = []
+        with pytest.raises(APIError):
+            make_batcher(calls, chunk_size=2).get_quotes(["005930", "999999", "000660"])
+
+
+class TestGetQuote:
+    """get_quote 묶음 처리 테스트"""
+
+    def test_sync_micro_batch(self):
+        calls = []
+        batcher = make_batcher(calls, window=0.05)
+        results = {}
+
+        def worker(code):
+            results[code] = batcher.get_quote(code)
+
+        threads = [threading.Thread(target=worker, args=(code,)) for code in CODES[:20]]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(calls) == 1
+        assert results["000007"]["cur_prc"] == "+1007"
+
+    def test_sync_full_batch_flushes_early(self):
+        calls = []
+        batcher = make_batcher(calls, chunk_size=1, window=10)
+        assert batcher.get_quote("005930")["stk_cd"] == "005930"
+        assert calls == [["005930"]]
+
+    def test_async_micro_batch(self):
+        calls = []
+        batcher = make_batcher(calls, use_async=True, chunk_size=100, window=0.01)
+
+        async def run():
+            return await asyncio.gather(*(batcher.get_quote(code) for code in CODES))
+
+        results = asyncio.run(run())
+        assert len(calls) == 3
+        assert [row["stk_cd"] for row in results] == CODES
+
+    def test_async_error_propagates(self):
+        calls = []
+        batcher = make_batcher(calls, use_async=True)
+
+        async def run():
+            return await batcher.get_quote("999999")
+
+        with pytest.raises(APIError):
+            asyncio.run(run())
+
+    def test_sync_wait_bounded_by_deadline(self):
+        """배치 응답이 늦으면 호출자의 deadline 에서 DeadlineExceeded, 배치 요청에도 deadline 이 전달된다"""
+        seen = []
+        release = threading.Event()
+
+        def handler(request):
+            seen.append(deadline.remaining())
+            release.wait(2)
+            return watchlist_handler([])(request)
+
+        stock_info = StockInfo(
+            base_url="https://api.kiwoom.com",
+            session=KiwoomSession(transport=httpx.MockTransport(handler)),
+        )
+        batcher = QuoteBatcher(stock_info, window=0.01)
+        started = time.monotonic()
+        try:
+            with deadline.deadline(0.2):
+                with pytest.raises(deadline.DeadlineExceeded):
+                    batcher.get_quote("005930")
+        finally:
+            release.set()
+        assert time.monotonic() - started < 1
+        assert seen and seen[0] is not None
+
+    def test_async_wait_bounded_by_deadline(self):
+        seen = []
+
+        async def handler(request):
+            seen.append(deadline.remaining())
+            await asyncio.sleep(1)
+            return watchlist_handler([])(request)
+
+        stock_info = StockInfo(
+            base_url="https://api.kiwoom.com",
+            session=AsyncKiwoomSession(transport=httpx.MockTransport(handler)),
+            use_async=True,
+        )
+        batcher = QuoteBatcher(stock_info, window=0.01)
+
+        async def run():
+            with deadline.deadline(0.2):
+                return await batcher.get_quote("005930")
+
+        started = time.monotonic()
+        with pytest.raises(deadline.DeadlineExceeded):
+            asyncio.run(run())
+        assert time.monotonic() - started < 1
+        assert seen and seen[0] is not None
@@ -0,0 +1,86 @@
+"""
+레이트 리미터 테스트
+"""
+
+import asyncio
+import time
+
+import httpx
+
+from kiwoom_rest_api.core.rate_limit import RateLimiter, TokenBucket
+from kiwoom_rest_api.core.session import KiwoomSession, AsyncKiwoomSession
+from kiwoom_rest_api.koreanstock.stockinfo import StockInfo
+
+
+def _ok(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, json={"return_code": 0})
+
+
+class TestTokenBucket:
+    """TokenBucket 테스트"""
+
+    def test_burst_then_rate(self):
+        """버스트 이후 속도 제한 테스트"""
+        bucket = TokenBucket(rate=10, capacity=3)
+        now = time.monotonic()
+        starts = [bucket.reserve() - now for _ in range(5)]
+        assert all(s < 0.01 for s in starts[:3])
+        assert abs(starts[3] - 0.1) < 0.02
+        assert abs(starts[4] - 0.2) < 0.02
+
+
+class TestRateLimiter:
+    """RateLimiter 테스트"""
+
+    def test_per_api_bucket(self):
+        """api-id 별 버킷 테스트"""
+        limiter = RateLimiter(rate=None, per_api_rates={"ka10081": 2}, per_api_burst=1)
+        assert limiter.reserve("ka10081") == 0
+        assert limiter.reserve("ka10081") > 0.4
+        # 설정되지 않은 TR 은 제한하지 않는다
+        assert limiter.reserve("ka10001") == 0
+
+    def test_global_bucket(self):
+        """전역 버킷 테스트"""
+        limiter = RateLimiter(rate=20, burst=1)
+        limiter.reserve("ka10001")
+        assert limiter.reserve("ka10002") > 0.03
+
+    def test_per_api_spacing_behind_global_backlog(self):
+        """전역 대기로 밀려도 TR 별 버킷은 실제 시작 시각 기준으로 간격을 지킨다"""
+        limiter = RateLimiter(rate=5, burst=1, per_api_rates={"ka10081": 1}, per_api_burst=1)
+        for _ in range(15):
+            limiter.reserve("ka10001")
+        delays = [limiter.reserve("ka10081") for _ in range(3)]
+        assert delays[0] > 2.5
+        assert all(later - earlier >= 0.99 for earlier, later in zip(delays, delays[1:]))
+
+    def test_sync_requests_are_spaced(self):
+        """동기 요청 간격 테스트"""
+        limiter = RateLimiter(rate=20, burst=1)
+        stock_info = StockInfo(
+            base_url="https://api.kiwoom.com",
+            session=KiwoomSession(transport=httpx.MockTransport(_ok)),
+            rate_limiter=limiter,
+        )
+        start = time.monotonic()
+        for _ in range(4):
+            stock_info.basic_stock_information_request_ka10001("005930")
+        assert time.monotonic() - start >= 0.14
+
+    def test_async_requests_are_spaced(self):
+        """비동기 요청 간격 테스트"""
+        limiter = RateLimiter(rate=20, burst=1)
+        stock_info = StockInfo(
+            base_url="https://api.kiwoom.com",
+            session=AsyncKiwoomSession(transport=httpx.MockTransport(_ok)),
+            rate_limiter=limiter,
+            use_async=True,
+        )
+
+        async def run():
+            start = time.monotonic()
+            await asyncio.gather(*[stock_info.basic_stock_information_request_ka10001("005930") for _ in range(4)])
+            return time.monotonic() - start
+
+        assert asyncio.run(run()) >= 0.14
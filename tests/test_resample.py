@@ -0,0 +1,183 @@
+"""
+로컬 봉 변환(리샘플링) 테스트
+"""
+
+import importlib
+from datetime import date, timedelta
+
+import pytest
+
+from kiwoom_rest_api.history.columnar import ColumnarStore, rows_to_columns
+from kiwoom_rest_api.history.resample import (
+    compare_bars,
+    minute_bucket,
+    period_key,
+    resample,
+    resample_daily,
+)
+
+# history 패키지의 resample 함수가 같은 이름의 모듈을 가린다
+resample_module = importlib.import_module("kiwoom_rest_api.history.resample")
+
+
+def daily_row(dt, o, h, low, c, v):
+    return {"dt": dt, "open_pric": str(o), "high_pric": str(h), "low_pric": str(low),
+            "cur_prc": str(c), "trde_qty": str(v), "trde_prica": str(v * 10)}
+
+
+# 2024-12-30(월) ~ 2025-01-03(금)은 같은 ISO 주, 2025-01-01 은 휴장
+DAILY = [
+    daily_row("20241227", 100, 110, 95, 105, 10),
+    daily_row("20241230", 105, 108, 100, 101, 20),
+    daily_row("20250102", 101, 120, 99, 118, 30),
+    daily_row("20250103", 118, 119, 110, 112, 40),
+    daily_row("20250106", 112, 115, 111, 114, 50),
+]
+
+
+class TestKeys:
+    """기간 키 테스트"""
+
+    def test_period_key(self):
+        assert period_key(20241230, "W") == period_key(20250103, "W")
+        assert period_key(20241227, "W") != period_key(20241230, "W")
+        assert period_key(20250131, "M") == (2025, 1)
+        with pytest.raises(ValueError):
+            period_key(20250101, "Q")
+
+    def test_minute_bucket(self):
+        assert minute_bucket(20250102090000, 5) == 20250102090000
+        assert minute_bucket(20250102090400, 5) == 20250102090000
+        assert minute_bucket(20250102090500, 5) == 20250102090500
+        assert minute_bucket(20250102153000, 60) == 20250102150000
+        # 장 시작 전(시간외)도 장 시작 시각 기준으로 나눈다
+        assert minute_bucket(20250102085900, 3) == 20250102085700
+
+
+class TestResample:
+    """주/월/년봉, N분봉 변환 테스트"""
+
+    def test_weekly_across_year_end(self):
+        weekly = resample(rows_to_columns(DAILY), "W")
+        assert list(weekly["time"]) == [20241227, 20241230, 20250106]
+        assert list(weekly["open"]) == [100, 105, 112]
+        assert list(weekly["high"]) == [110, 120, 115]
+        assert list(weekly["low"]) == [95, 99, 111]
+        assert list(weekly["close"]) == [105, 112, 114]
+        assert list(weekly["volume"]) == [10, 90, 50]
+        assert list(weekly["value"]) == [100, 900, 500]
+
+    def test_monthly_and_yearly_labels(self):
+        columns = rows_to_columns(DAILY)
+        monthly = resample_daily(columns, "M", label="last")
+        assert list(monthly["time"]) == [20241230, 20250106]
+        assert list(monthly["close"]) == [101, 114]
+        yearly = resample(columns, "Y")
+        assert list(yearly["time"]) == [20241227, 20250102]
+        assert list(yearly["volume"]) == [30, 120]
+
+    def test_n_minute(self):
+        rows = [
+            {"cntr_tm": f"2025010209{m:02d}00", "open_pric": str(100 + m), "high_pric": str(101 + m),
+             "low_pric": str(99 + m), "cur_prc": str(100 + m), "trde_qty": "1"}
+            for m in range(7)
+        ]
+        bars = resample(rows_to_columns(rows), "3m")
+        assert list(bars["time"]) == [20250102090000, 20250102090300, 20250102090600]
+        assert list(bars["open"]) == [100, 103, 106]
+        assert list(bars["high"]) == [103, 106, 107]
+        assert list(bars["volume"]) == [3, 3, 1]
+
+    def test_from_bar_file_views(self, tmp_path):
+        store = ColumnarStore(str(tmp_path))
+        store.write("005930", "D", DAILY)
+        with store.open("005930", "D") as daily:
+            view = daily.slice(20241230, None)
+            weekly = resample(view, "W")
+            for column in view.values():
+                column.release()
+        assert list(weekly["time"]) == [20241230, 20250106]
+
+    def test_unknown_timeframe(self):
+        with pytest.raises(ValueError):
+            resample(rows_to_columns(DAILY), "Q")
+
+
+def synthetic_daily(days=800):
+    """2023-01-02 부터 평일 일봉 (저가 0 인 거래 없는 날 포함)"""
+    rows, day = [], date(2023, 1, 2)
+    for i in range(days):
+        if day.weekday() < 5:
+            low = 0 if i % 17 == 0 else 95 + i % 7
+            rows.append(daily_row(day.strftime("%Y%m%d"), 100 + i % 11, 120 + i % 13, low, 100 + i % 9, i % 50))
+        day += timedelta(days=1)
+    return rows
+
+
+def synthetic_minutes():
+    """장 시작 전부터 장 마감까지 이틀치 1분봉"""
+    rows = []
+    for dt in ("20250102", "20250103"):
+        for m in range(8 * 60 + 50, 15 * 60 + 31):
+            rows.append({"cntr_tm": f"{dt}{m // 60:02d}{m % 60:02d}00", "open_pric": str(100 + m % 5),
+                         "high_pric": str(110 + m % 7), "low_pric": str(0 if m % 23 == 0 else 90 + m % 3),
+                         "cur_prc": str(100 + m % 4), "trde_qty": str(m % 10)})
+    return rows
+
+
+class TestNumpyPath:
+    """numpy 벡터 경로와 파이썬 루프 결과 비교"""
+
+    @pytest.fixture
+    def loop_only(self, monkeypatch):
+        def run(columns, timeframe, **kwargs):
+            with monkeypatch.context() as patch:
+                patch.setattr(resample_module, "_numpy", lambda: None)
+                return resample(columns, timeframe, **kwargs)
+        return run
+
+    def test_daily_matches_loop(self, loop_only):
+        pytest.importorskip("numpy")
+        columns = rows_to_columns(synthetic_daily())
+        for period in ("W", "M", "Y"):
+            for label in ("first", "last"):
+                assert resample(columns, period, label=label) == loop_only(columns, period, label=label)
+
+    def test_minutes_match_loop(self, loop_only):
+        pytest.importorskip("numpy")
+        columns = rows_to_columns(synthetic_minutes())
+        for timeframe in ("1m", "3m", "5m", "7m", "60m"):
+            assert resample(columns, timeframe) == loop_only(columns, timeframe)
+
+    def test_empty_columns(self):
+        pytest.importorskip("numpy")
+        assert all(len(column) == 0 for column in resample(rows_to_columns([]), "W").values())
+
+    def test_from_as_numpy(self, tmp_path, loop_only):
+        pytest.importorskip("numpy")
+        store = ColumnarStore(str(tmp_path))
+        store.write("005930", "D", synthetic_daily())
+        with store.open("005930", "D") as daily:
+            names = ("time", "open", "high", "low", "close", "volume", "value")
+            weekly = resample({name: daily.as_numpy(name) for name in names}, "W")
+            expected = loop_only({name: daily.to_array(name) for name in names}, "W")
+        assert weekly == expected
+
+
+class TestCompareBars:
+    """서버 봉과 비교 테스트"""
+
+    def test_matches_server_weekly(self):
+        weekly = resample(rows_to_columns(DAILY), "W", label="last")
+        server = [
+            {"dt": "20241230", "open_pric": "+105", "high_pric": "+120", "low_pric": "-99",
+             "cur_prc": "112", "trde_qty": "90"},
+            {"dt": "20250106", "open_pric": "112", "high_pric": "115", "low_pric": "111",
+             "cur_prc": "114", "trde_qty": "50"},
+        ]
+        mismatches = compare_bars(weekly, server, "W")
+        # 서버 응답에 없는 2024-12-23 주만 차이로 남는다
+        assert mismatches == [((2024, 52), "missing", True, False)]
+
+        server[1]["cur_prc"] = "115"
+        assert ((2025, 2), "close", 114, 115) in compare_bars(weekly, server, "W")
@@ -0,0 +1,163 @@
+"""
+재시도 정책 및 서킷 브레이커 테스트
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from kiwoom_rest_api.core.base import APIError, RateLimitError
+from kiwoom_rest_api.core.deadline import DeadlineExceeded
+from kiwoom_rest_api.core.retry import (
+    CircuitBreaker,
+    CircuitOpenError,
+    RetryPolicy,
+    acall_with_retry,
+    is_order_api,
+)
+from kiwoom_rest_api.core.session import KiwoomSession, AsyncKiwoomSession
+from kiwoom_rest_api.koreanstock.order import Order
+from kiwoom_rest_api.koreanstock.stockinfo import StockInfo
+
+
+def flaky_handler(calls, failures, error=None, status=503):
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.headers.get("api-id"))
+        if len(calls) <= failures:
+            if error is not None:
+                raise error("boom", request=request)
+            return httpx.Response(status, text="unavailable")
+        return httpx.Response(200, json={"return_code": 0})
+    return handler
+
+
+FAST = RetryPolicy(max_attempts=3, base_delay=0.001, max_delay=0.001)
+
+
+class TestRetryPolicy:
+    """RetryPolicy 테스트"""
+
+    def test_order_api_ids(self):
+        assert is_order_api("kt10000")
+        assert is_order_api("kt10009")
+        assert not is_order_api("kt10010")
+        assert not is_order_api("ka10001")
+
+    def test_inquiry_retry_decisions(self):
+        policy = RetryPolicy(max_attempts=3)
+        assert policy.should_retry(httpx.ReadTimeout("t"), "ka10001", 1)
+        assert policy.should_retry(APIError(503, "down"), "ka10001", 1)
+        assert not policy.should_retry(APIError(400, "bad"), "ka10001", 1)
+        assert not policy.should_retry(httpx.ReadTimeout("t"), "ka10001", 3)
+
+    def test_order_retry_decisions(self):
+        """주문 TR 은 요청이 전달되지 않은 경우에만 재시도"""
+        policy = RetryPolicy(max_attempts=3)
+        assert not policy.should_retry(httpx.ReadTimeout("t"), "kt10000", 1)
+        assert not policy.should_retry(APIError(503, "down"), "kt10000", 1)
+        assert policy.should_retry(httpx.ConnectError("c"), "kt10000", 1)
+        assert policy.should_retry(RateLimitError(429, "quota"), "kt10000", 1)
+        assert not RetryPolicy(retry_orders=False).should_retry(httpx.ConnectError("c"), "kt10000", 1)
+
+    def test_backoff_is_bounded(self):
+        policy = RetryPolicy(base_delay=0.1, max_delay=0.3)
+        assert all(0 <= policy.backoff(n) <= 0.3 for n in range(1, 10))
+
+
+class TestRetryIntegration:
+    """KiwoomBaseAPI 재시도 통합 테스트"""
+
+    def test_sync_retries_transient_error(self):
+        calls = []
+        stock_info = StockInfo(
+            base_url="https://api.kiwoom.com",
+            session=KiwoomSession(transport=httpx.MockTransport(flaky_handler(calls, 2))),
+            retry_policy=FAST,
+        )
+        assert stock_info.basic_stock_information_request_ka10001("005930")["return_code"] == 0
+        assert len(calls) == 3
+
+    def test_order_timeout_not_retried(self):
+        calls = []
+        order = Order(
+            base_url="https://api.kiwoom.com",
+            session=KiwoomSession(transport=httpx.MockTransport(flaky_handler(calls, 1, error=httpx.ReadTimeout))),
+            retry_policy=FAST,
+        )
+        with pytest.raises(httpx.ReadTimeout):
+            order.stock_buy_order_request_kt10000(
+                dmst_stex_tp="KRX", stk_cd="005930", ord_qty="1", trde_tp="3"
+            )
+        assert calls == ["kt10000"]
+
+    def test_async_retries(self):
+        calls = []
+        stock_info = StockInfo(
+            base_url="https://api.kiwoom.com",
+            session=AsyncKiwoomSession(transport=httpx.MockTransport(flaky_handler(calls, 1, error=httpx.ConnectError))),
+            retry_policy=FAST,
+            use_async=True,
+        )
+        result = asyncio.run(stock_info.basic_stock_information_request_ka10001("005930"))
+        assert result["return_code"] == 0
+        assert len(calls) == 2
+
+
+class TestCircuitBreaker:
+    """CircuitBreaker 테스트"""
+
+    def test_opens_and_fails_fast(self):
+        calls = []
+        breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=60)
+        stock_info = StockInfo(
+            base_url="https://api.kiwoom.com",
+            session=KiwoomSession(transport=httpx.MockTransport(flaky_handler(calls, 100))),
+            circuit_breaker=breaker,
+        )
+        for _ in range(2):
+            with pytest.raises(APIError):
+                stock_info.basic_stock_information_request_ka10001("005930")
+        with pytest.raises(CircuitOpenError):
+            stock_info.basic_stock_information_request_ka10001("005930")
+        assert len(calls) == 2
+        assert breaker.state("api.kiwoom.com") == "open"
+
+    def test_half_open_trial_closes(self):
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0)
+        breaker.record_failure("h")
+        assert breaker.state("h") == "half-open"
+        breaker.before_request("h")
+        with pytest.raises(CircuitOpenError):
+            breaker.before_request("h")
+        breaker.record_success("h")
+        assert breaker.state("h") == "closed"
+
+    def test_cancelled_trial_is_released(self):
+        """시험 요청이 취소되어도 다음 요청이 다시 시험할 수 있어야 한다"""
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0)
+        breaker.record_failure("h")
+
+        async def hang():
+            await asyncio.sleep(10)
+
+        async def run():
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(acall_with_retry(hang, "ka10001", "h", breaker=breaker), 0.01)
+
+        asyncio.run(run())
+        assert breaker.state("h") == "half-open"
+        breaker.before_request("h")
+
+    def test_business_errors_do_not_trip(self):
+        breaker = CircuitBreaker(failure_threshold=1)
+        breaker.record_result("h", APIError(400, "bad request"))
+        breaker.record_result("h", RateLimitError(429, "quota"))
+        assert breaker.state("h") == "closed"
+
+    def test_deadline_expiry_is_not_an_outage(self):
+        """DeadlineExceeded(504) 는 장애로 세지도, 재시도하지도 않는다"""
+        breaker = CircuitBreaker(failure_threshold=1)
+        breaker.record_result("h", DeadlineExceeded())
+        assert breaker.state("h") == "closed"
+        assert not RetryPolicy().should_retry(DeadlineExceeded(), "ka10001", 1)
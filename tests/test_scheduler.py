@@ -0,0 +1,160 @@
+"""
+우선순위 요청 스케줄러 테스트
+"""
+
+import asyncio
+import threading
+import time
+
+import httpx
+
+from kiwoom_rest_api.core.rate_limit import RateLimiter
+from kiwoom_rest_api.core.scheduler import Priority, PriorityScheduler, classify
+from kiwoom_rest_api.core.session import AsyncKiwoomSession
+from kiwoom_rest_api.koreanstock.chart import Chart
+from kiwoom_rest_api.koreanstock.order import Order
+
+
+def wait_for(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.001)
+    assert predicate()
+
+
+class TestClassify:
+    """기본 우선순위 분류 테스트"""
+
+    def test_classify(self):
+        assert classify("kt10000", "https://api.kiwoom.com/api/dostk/ordr") == Priority.ORDER
+        assert classify("kt10006", "/api/dostk/crdordr") == Priority.ORDER
+        assert classify("kt00018", "/api/dostk/acnt") == Priority.ACCOUNT
+        assert classify("ka10085", "/api/dostk/acnt") == Priority.ACCOUNT
+        assert classify("ka10081", "https://api.kiwoom.com/api/dostk/chart") == Priority.HISTORY
+        assert classify("ka10001", "/api/dostk/stkinfo") == Priority.QUOTE
+
+    def test_overrides(self):
+        scheduler = PriorityScheduler(overrides={"ka10001": Priority.ORDER})
+        assert scheduler.priority_for("ka10001", "/api/dostk/stkinfo") == Priority.ORDER
+
+
+class TestPriorityScheduler:
+    """슬롯 배정 순서 테스트"""
+
+    def test_sync_order_preempts_history(self):
+        scheduler = PriorityScheduler(RateLimiter(rate=50, burst=1))
+        served = []
+
+        def request(name, api_id, url):
+            scheduler.acquire(api_id, url)
+            served.append(name)
+
+        threads = []
+        for i in range(5):
+            thread = threading.Thread(target=request, args=(f"chart-{i}", "ka10081", "/api/dostk/chart"))
+            thread.start()
+            threads.append(thread)
+            # 앞 요청이 차례를 잡거나 대기열에 들어간 뒤 다음 요청을 보낸다
+            wait_for(lambda: len(served) + scheduler.waiting >= i)
+        order = threading.Thread(target=request, args=("order", "kt10000", "/api/dostk/ordr"))
+        order.start()
+        threads.append(order)
+        for thread in threads:
+            thread.join()
+
+        assert sorted(served) == sorted(["order"] + [f"chart-{i}" for i in range(5)])
+        assert served.index("order") <= 2
+        assert [name for name in served if name != "order"] == [f"chart-{i}" for i in range(5)]
+
+    def test_per_api_wait_does_not_hold_turn(self):
+        """TR 별 한도로 기다리는 조회가 주문의 차례를 막지 않는다"""
+        scheduler = PriorityScheduler(RateLimiter(rate=100, burst=1, per_api_rates={"ka10081": 5}, per_api_burst=1))
+        served = []
+
+        def request(name, api_id, url):
+            scheduler.acquire(api_id, url)
+            served.append((name, time.monotonic()))
+
+        charts = [threading.Thread(target=request, args=("chart", "ka10081", "/api/dostk/chart")) for _ in range(3)]
+        for thread in charts:
+            thread.start()
+        wait_for(lambda: len(served) >= 1)
+        started = time.monotonic()
+        request("order", "kt10000", "/api/dostk/ordr")
+        for thread in charts:
+            thread.join()
+
+        order_time = dict(served)["order"]
+        assert order_time - started < 0.1
+        chart_times = [t for name, t in served if name == "chart"]
+        assert all(later - earlier >= 0.15 for earlier, later in zip(chart_times, chart_times[1:]))
+
+    def test_async_priority_order(self):
+        scheduler = PriorityScheduler(RateLimiter(rate=100, burst=1))
+        served = []
+
+        async def request(name, api_id, url):
+            await scheduler.acquire_async(api_id, url)
+            served.append(name)
+
+        async def run():
+            tasks = [asyncio.ensure_future(request(f"chart-{i}", "ka10081", "/api/dostk/chart")) for i in range(4)]
+            tasks.append(asyncio.ensure_future(request("quote", "ka10001", "/api/dostk/stkinfo")))
+            tasks.append(asyncio.ensure_future(request("account", "kt00018", "/api/dostk/acnt")))
+            tasks.append(asyncio.ensure_future(request("order", "kt10000", "/api/dostk/ordr")))
+            await asyncio.gather(*tasks)
+
+        asyncio.run(run())
+        # chart-0 은 빈 슬롯을 바로 쓰고, chart-1 은 다음 슬롯을 예약한 채 기다리는 중에 나머지가 도착한다
+        assert served == ["chart-0", "chart-1", "order", "account", "quote", "chart-2", "chart-3"]
+        assert scheduler.waiting == 0
+
+    def test_async_cancelled_waiter_skipped(self):
+        scheduler = PriorityScheduler(RateLimiter(rate=100, burst=1))
+        served = []
+
+        async def request(name):
+            await scheduler.acquire_async("ka10001", "/api/dostk/stkinfo")
+            served.append(name)
+
+        async def run():
+            first = asyncio.ensure_future(request("first"))
+            cancelled = asyncio.ensure_future(request("cancelled"))
+            last = asyncio.ensure_future(request("last"))
+            await asyncio.sleep(0)
+            cancelled.cancel()
+            await asyncio.gather(first, last)
+
+        asyncio.run(run())
+        assert served == ["first", "last"]
+
+
+class TestBaseAPIScheduler:
+    """KiwoomBaseAPI 스케줄러 연동 테스트"""
+
+    def test_order_overtakes_queued_charts(self):
+        seen = []
+
+        def handler(request):
+            seen.append(request.headers["api-id"])
+            return httpx.Response(200, json={"return_code": 0})
+
+        options = dict(
+            base_url="https://api.kiwoom.com",
+            session=AsyncKiwoomSession(transport=httpx.MockTransport(handler)),
+            scheduler=PriorityScheduler(RateLimiter(rate=200, burst=1)),
+            use_async=True,
+        )
+        chart, order = Chart(**options), Order(**options)
+
+        async def run():
+            calls = [chart.stock_daily_chart_request_ka10081("005930", "20250101", "1") for _ in range(6)]
+            calls.append(order.stock_buy_order_request_kt10000(
+                dmst_stex_tp="KRX", stk_cd="005930", ord_qty="1", trde_tp="3"
+            ))
+            await asyncio.gather(*calls)
+
+        asyncio.run(run())
+        # 이미 슬롯을 잡은 앞의 두 요청 다음으로 주문이 나간다
+        assert seen.index("kt10000") <= 2
+        assert seen.count("ka10081") == 6
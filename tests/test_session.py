@@ -0,0 +1,88 @@
+"""
+커넥션 풀 세션 테스트
+"""
+
+import asyncio
+
+import httpx
+
+from kiwoom_rest_api.core.session import KiwoomSession, AsyncKiwoomSession
+from kiwoom_rest_api.koreanstock.stockinfo import StockInfo
+from kiwoom_rest_api.koreanstock.chart import Chart
+
+
+def _handler(calls):
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(200, json={"return_code": 0, "return_msg": "정상"})
+    return handler
+
+
+class TestKiwoomSession:
+    """KiwoomSession 테스트"""
+
+    def test_pool_limits(self):
+        """풀 설정 테스트"""
+        session = KiwoomSession(max_connections=7, max_keepalive_connections=3, keepalive_expiry=5)
+        assert session.limits.max_connections == 7
+        assert session.limits.max_keepalive_connections == 3
+        assert session.limits.keepalive_expiry == 5
+
+    def test_shared_between_apis(self):
+        """여러 API 객체가 하나의 클라이언트를 공유하는지 테스트"""
+        calls = []
+        session = KiwoomSession(transport=httpx.MockTransport(_handler(calls)))
+        stock_info = StockInfo(base_url="https://api.kiwoom.com", session=session)
+        chart = Chart(base_url="https://api.kiwoom.com", session=session)
+
+        client = session.client
+        stock_info.basic_stock_information_request_ka10001("005930")
+        chart.stock_daily_chart_request_ka10081(stk_cd="005930", base_dt="20241107", upd_stkpc_tp="1")
+
+        assert session.client is client
+        assert [c.headers["api-id"] for c in calls] == ["ka10001", "ka10081"]
+        assert calls[1].url.path == "/api/dostk/chart"
+
+        session.close()
+        assert session.is_closed
+
+    def test_async_session(self):
+        """비동기 세션 테스트"""
+        calls = []
+        session = AsyncKiwoomSession(transport=httpx.MockTransport(_handler(calls)))
+        stock_info = StockInfo(base_url="https://api.kiwoom.com", session=session, use_async=True)
+
+        async def run():
+            results = await asyncio.gather(
+                *[stock_info.basic_stock_information_request_ka10001("005930") for _ in range(5)]
+            )
+            client = session.client
+            await session.aclose()
+            return results, client
+
+        results, client = asyncio.run(run())
+        assert len(results) == 5
+        assert len(calls) == 5
+        assert client.is_closed
+
+    def test_async_client_closed_on_loop_change(self):
+        """이벤트 루프가 바뀌면 이전 루프의 클라이언트를 닫는다"""
+        session = AsyncKiwoomSession()
+
+        async def get_client():
+            client = session.client
+            await asyncio.sleep(0)
+            return client
+
+        # asyncio.run 이 끝나면 그 루프의 클라이언트가 닫힌다
+        first = asyncio.run(get_client())
+        assert first.is_closed
+
+        # 태스크를 정리하지 않고 닫힌 루프의 클라이언트는 다음 루프에서 닫는다
+        loop = asyncio.new_event_loop()
+        stale = loop.run_until_complete(get_client())
+        loop.close()
+        assert not stale.is_closed
+        second = asyncio.run(get_client())
+        assert second is not stale
+        assert stale.is_closed
@@ -0,0 +1,298 @@
+"""
+토큰 관리자 테스트
+"""
+
+import asyncio
+import os
+import stat
+import threading
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+from kiwoom_rest_api.auth import token as token_module
+from kiwoom_rest_api.auth.token import TokenManager
+from kiwoom_rest_api.auth.token_store import FileTokenStore
+from kiwoom_rest_api.core import deadline
+
+
+def token_response(token, seconds=86400):
+    return {
+        "token": token,
+        "token_type": "bearer",
+        "expires_dt": (datetime.now() + timedelta(seconds=seconds)).strftime("%Y%m%d%H%M%S"),
+    }
+
+
+@pytest.fixture
+def oauth(monkeypatch):
+    """토큰 발급 요청을 가로채 호출 횟수를 센다"""
+    calls = []
+
+    def fake_request(**kwargs):
+        calls.append(kwargs["data"]["grant_type"])
+        time.sleep(0.05)
+        return token_response(f"token-{len(calls)}")
+
+    async def fake_request_async(**kwargs):
+        calls.append(kwargs["data"]["grant_type"])
+        await asyncio.sleep(0.05)
+        return token_response(f"token-{len(calls)}")
+
+    monkeypatch.setattr(token_module, "make_request", fake_request)
+    monkeypatch.setattr(token_module, "make_request_async", fake_request_async)
+    return calls
+
+
+class TestTokenManager:
+    """TokenManager 테스트"""
+
+    def test_token_reused(self, oauth):
+        manager = TokenManager()
+        assert manager.get_token() == "token-1"
+        assert manager.get_token() == "token-1"
+        assert oauth == ["client_credentials"]
+
+    def test_threads_single_flight(self, oauth):
+        manager = TokenManager()
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(manager.get_token())) for _ in range(20)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(oauth) == 1
+        assert set(results) == {"token-1"}
+
+    def test_async_single_flight(self, oauth):
+        manager = TokenManager()
+
+        async def run():
+            return await asyncio.gather(*(manager.get_token_async() for _ in range(200)))
+
+        results = asyncio.run(run())
+        assert len(oauth) == 1
+        assert set(results) == {"token-1"}
+
+    def test_mixed_sync_async_single_flight(self, oauth):
+        """동기 스레드와 여러 이벤트 루프의 태스크가 섞여도 발급 요청은 한 번이다"""
+        manager = TokenManager()
+        results = []
+        barrier = threading.Barrier(6)
+
+        def sync_worker():
+            barrier.wait()
+            results.append(manager.get_token())
+
+        def async_worker():
+            async def run():
+                barrier.wait()
+                return await asyncio.gather(*(manager.get_token_async() for _ in range(10)))
+
+            results.extend(asyncio.run(run()))
+
+        threads = [threading.Thread(target=sync_worker) for _ in range(3)]
+        threads += [threading.Thread(target=async_worker) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(oauth) == 1
+        assert len(results) == 33
+        assert set(results) == {"token-1"}
+
+    def test_refresh_on_expiry(self, oauth):
+        manager = TokenManager()
+        manager.get_token()
+        manager._token = (manager._access_token, datetime.now() - timedelta(seconds=1))
+
+        async def run():
+            return await asyncio.gather(*(manager.get_token_async() for _ in range(50)))
+
+        assert set(asyncio.run(run())) == {"token-2"}
+        assert len(oauth) == 2
+
+    def test_async_across_event_loops(self, oauth):
+        manager = TokenManager()
+        assert asyncio.run(manager.get_token_async()) == "token-1"
+        manager._token = None
+        assert asyncio.run(manager.get_token_async()) == "token-2"
+
+
+class TestBackgroundRefresh:
+    """백그라운드 토큰 갱신 테스트"""
+
+    def test_thread_refreshes_ahead_of_expiry(self, oauth):
+        manager = TokenManager(refresh_margin=60)
+        manager._token = ("old", datetime.now() + timedelta(seconds=45))
+        manager.start_background_refresh()
+        try:
+            deadline = time.monotonic() + 2
+            while manager._access_token == "old" and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert manager._access_token == "token-1"
+            # 갱신된 토큰은 여유가 충분하므로 get_token 은 발급 요청을 보내지 않는다
+            assert manager.get_token() == "token-1"
+            assert len(oauth) == 1
+        finally:
+            manager.stop_background_refresh()
+
+    def test_async_task_refreshes_ahead_of_expiry(self, oauth):
+        manager = TokenManager(refresh_margin=60)
+        manager._token = ("old", datetime.now() + timedelta(seconds=45))
+
+        async def run():
+            task = manager.start_background_refresh_async()
+            # 만료 45초 전이므로 요청 경로는 기존 토큰을 즉시 사용한다
+            assert await manager.get_token_async() == "old"
+            await asyncio.sleep(0.1)
+            assert await manager.get_token_async() == "token-1"
+            manager.stop_background_refresh()
+            await asyncio.sleep(0)
+            return task
+
+        task = asyncio.run(run())
+        assert task.cancelled()
+        assert len(oauth) == 1
+
+    def test_failure_is_retried(self, monkeypatch):
+        calls = []
+
+        def flaky_request(**kwargs):
+            calls.append(1)
+            if len(calls) == 1:
+                raise RuntimeError("network down")
+            return token_response("token-ok")
+
+        monkeypatch.setattr(token_module, "make_request", flaky_request)
+        monkeypatch.setattr(token_module, "BACKGROUND_RETRY_DELAY", 0.01)
+        manager = TokenManager()
+        manager.start_background_refresh()
+        try:
+            deadline = time.monotonic() + 2
+            while manager._access_token != "token-ok" and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert manager._access_token == "token-ok"
+        finally:
+            manager.stop_background_refresh()
+
+
+class TestFileTokenStore:
+    """파일 토큰 저장소 테스트"""
+
+    def test_reused_across_managers(self, oauth, tmp_path):
+        store = FileTokenStore(str(tmp_path / "tokens.json"))
+        assert TokenManager(appkey="key-a", token_store=store).get_token() == "token-1"
+        # 새 프로세스에 해당: 저장된 토큰을 읽어 발급 요청 없이 사용한다
+        assert TokenManager(appkey="key-a", token_store=store).get_token() == "token-1"
+        assert len(oauth) == 1
+        # 다른 앱키는 별도 토큰을 발급받는다
+        assert TokenManager(appkey="key-b", token_store=store).get_token() == "token-2"
+        assert len(oauth) == 2
+
+    def test_file_permissions(self, oauth, tmp_path):
+        path = tmp_path / "tokens.json"
+        TokenManager(appkey="key-a", token_store=FileTokenStore(str(path))).get_token()
+        assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+        assert "key-a" not in path.read_text()
+
+    def test_expired_entry_ignored(self, oauth, tmp_path):
+        store = FileTokenStore(str(tmp_path / "tokens.json"))
+        manager = TokenManager(appkey="key-a", token_store=store)
+        store.save(manager._store_key(), "stale", datetime.now() + timedelta(seconds=10))
+        assert TokenManager(appkey="key-a", token_store=store).get_token() == "token-1"
+
+    def test_corrupt_file_ignored(self, oauth, tmp_path):
+        path = tmp_path / "tokens.json"
+        path.write_text("{not json")
+        assert TokenManager(token_store=FileTokenStore(str(path))).get_token() == "token-1"
+
+    def test_parallel_workers_issue_once(self, oauth, tmp_path):
+        path = str(tmp_path / "tokens.json")
+        results = []
+
+        def worker():
+            # 워커마다 별도의 TokenManager 와 저장소 (프로세스 간 잠금만 공유)
+            manager = TokenManager(appkey="key-a", token_store=FileTokenStore(path))
+            results.append(manager.get_token())
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(oauth) == 1
+        assert set(results) == {"token-1"}
+
+    def test_async_with_store(self, oauth, tmp_path):
+        store = FileTokenStore(str(tmp_path / "tokens.json"))
+        manager = TokenManager(appkey="key-a", token_store=store)
+
+        async def run():
+            return await asyncio.gather(*(manager.get_token_async() for _ in range(20)))
+
+        assert set(asyncio.run(run())) == {"token-1"}
+        assert store.load(manager._store_key())[0] == "token-1"
+
+    def test_cancelled_leader_does_not_reissue(self, monkeypatch, tmp_path):
+        """스레드 발급 중 선두 태스크가 취소되어도 다른 태스크가 다시 발급하지 않는다"""
+        calls = []
+        budgets = []
+
+        def slow_request(**kwargs):
+            calls.append(1)
+            budgets.append(deadline.remaining())
+            time.sleep(0.2)
+            return token_response("token-1")
+
+        monkeypatch.setattr(token_module, "make_request", slow_request)
+        manager = TokenManager(appkey="key-a", token_store=FileTokenStore(str(tmp_path / "tokens.json")))
+
+        async def run():
+            with deadline.deadline(5):
+                leader = asyncio.ensure_future(manager.get_token_async())
+                await asyncio.sleep(0.05)
+            waiter = asyncio.ensure_future(manager.get_token_async())
+            await asyncio.sleep(0.01)
+            leader.cancel()
+            return await waiter
+
+        assert asyncio.run(run()) == "token-1"
+        assert len(calls) == 1
+        # 호출자의 deadline 이 스레드의 발급 요청에도 적용된다
+        assert budgets[0] is not None and 0 < budgets[0] <= 5
+
+    def test_async_refresh_with_store_does_not_block_loop(self, monkeypatch, tmp_path):
+        """저장소 발급이 스레드에서 진행되는 동안 이벤트 루프가 멈추지 않는다"""
+
+        def slow_request(**kwargs):
+            time.sleep(0.5)
+            return token_response("token-1")
+
+        monkeypatch.setattr(token_module, "make_request", slow_request)
+        manager = TokenManager(appkey="key-a", token_store=FileTokenStore(str(tmp_path / "tokens.json")))
+
+        async def run():
+            gaps = []
+
+            async def ticker():
+                last = time.monotonic()
+                while True:
+                    await asyncio.sleep(0.01)
+                    now = time.monotonic()
+                    gaps.append(now - last)
+                    last = now
+
+            tick = asyncio.ensure_future(ticker())
+            first = asyncio.ensure_future(manager.get_token_async())
+            await asyncio.sleep(0.05)
+            # 발급 중에 다른 이벤트 루프 태스크도 토큰을 요청한다
+            second = asyncio.ensure_future(manager.get_token_async())
+            tokens = await asyncio.gather(first, second)
+            tick.cancel()
+            return tokens, max(gaps)
+
+        tokens, worst_gap = asyncio.run(run())
+        assert tokens == ["token-1", "token-1"]
+        assert worst_gap < 0.2